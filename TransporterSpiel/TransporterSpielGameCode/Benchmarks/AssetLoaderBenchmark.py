@@ -0,0 +1,90 @@
+"""
+Benchmark for the Startup Time saved by loading the Assets in the Background.
+
+Loads the Images and Rotations once synchronously, as the Game did before the Difficulty Selection
+Screen, and once with the AssetLoaderService while the Main Thread keeps drawing Frames for the
+given Time, like the Difficulty Selection Screen. Prints how long the Window is blocked in both
+Cases, how long the first Round still waits, and the Timing of every Asset.
+
+Usage (from the TransporterSpielGameCode Directory):
+    python Benchmarks/AssetLoaderBenchmark.py [--small] [--selectionMs N]
+"""
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from Model.GameObjects.Game.GameDifficulty import GameDifficulty
+from Model.GameObjects.Messages.FinalMessage import FinalTextGameObject, LOSE_MESSAGE, WIN_MESSAGE
+from Model.GameObjects.Messages.TextGameObject import TextGameObject
+from Services.AssetLoaderService import AssetLoaderService
+from Services.ConfigService import loadConfig, getConfig
+from Services.GameObjectCreationService import GameObjectCreationService
+from Services.RotationCacheService import getRotationCache
+
+
+def drawSelectionFrames(screen: pygame.Surface, milliseconds: float) -> int:
+    """
+    Draw Text Frames on the Main Thread for the given Time, like the Difficulty Selection Screen.
+
+    Returns:
+        int: Number of drawn Frames.
+    """
+    frames = 0
+    end = time.perf_counter() + milliseconds / 1000
+    while time.perf_counter() < end:
+        screen.fill((0, 0, 0))
+        TextGameObject(screen=screen, message=f"Total Ore: {frames}", xCoordinate=200, yCoordinate=200, fontSize=32).draw()
+        pygame.display.flip()
+        pygame.time.wait(16)
+        frames += 1
+    return frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--small", action="store_true", help="Use the small Screen Profile.")
+    parser.add_argument("--selectionMs", type=float, default=1000, help="Time the Player spends on the Difficulty Selection Screen.")
+    arguments = parser.parse_args()
+
+    loadConfig(arguments.small)
+    pygame.init()
+    screenConfig = getConfig().getScreenConfig()
+    screen = pygame.display.set_mode((screenConfig.getScreenWidth(), screenConfig.getScreenHeight()))
+    difficulty = GameDifficulty()
+
+    start = time.perf_counter()
+    synchronousService = GameObjectCreationService(screen, screenConfig.getGameWidth(), screenConfig.getGameHeight())
+    synchronousBlockedMs = (time.perf_counter() - start) * 1000
+    synchronousService.createGameObjects(difficulty)
+    getRotationCache().clear()
+
+    assetLoader = AssetLoaderService()
+    start = time.perf_counter()
+    backgroundService = GameObjectCreationService(screen, screenConfig.getGameWidth(), screenConfig.getGameHeight(), assetLoader=assetLoader)
+    for message, fontSize, color in FinalTextGameObject.getTexts(WIN_MESSAGE, True) + FinalTextGameObject.getTexts(LOSE_MESSAGE, False):
+        assetLoader.prerenderText(message, fontSize, color)
+    backgroundBlockedMs = (time.perf_counter() - start) * 1000
+    frames = drawSelectionFrames(screen, arguments.selectionMs)
+    start = time.perf_counter()
+    backgroundService.createGameObjects(difficulty)
+    roundWaitMs = (time.perf_counter() - start) * 1000
+
+    print(f"selectionMs={arguments.selectionMs:.0f} selectionFrames={frames}")
+    print(f"synchronous: window blocked {synchronousBlockedMs:8.2f} ms")
+    print(f"background:  window blocked {backgroundBlockedMs:8.2f} ms, first Round waited {roundWaitMs:.2f} ms")
+    for timing in assetLoader.getTimings():
+        print(f"    {timing}")
+    print(assetLoader)
+    assetLoader.shutdown()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
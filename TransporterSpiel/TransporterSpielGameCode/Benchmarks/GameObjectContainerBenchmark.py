@@ -0,0 +1,104 @@
+"""
+Benchmark for the per-Frame Cost of the GameObjectContainer Identifier Lookups.
+
+Runs the HUD Update and a Number of fading Timed Messages for a fixed Number of Frames, once with
+the Identifier Index of the RenderList and once with the previous linear Scans patched in.
+
+Usage (from the TransporterSpielGameCode Directory):
+    python Benchmarks/GameObjectContainerBenchmark.py [--small] [--frames N] [--messages N]
+"""
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from Model.GameObjects.Base.GameObjectContainer import GameObjectContainer
+from Model.GameObjects.Game.EntityRegistry import EntityRegistry
+from Model.GameObjects.Game.GameDifficulty import GameDifficulty
+from Model.GameObjects.MenuElements.Hud import Hud
+from Model.GameObjects.Messages.TimedMessage import TimedTextGameObject
+from Services.ConfigService import loadConfig, getConfig
+from Services.GameObjectCreationService import GameObjectCreationService
+
+
+def linearGetGameObjectById(self, identifier: str):
+    """
+    The previous Implementation of GameObjectContainer.getGameObjectById.
+    """
+    return next((obj for obj in self.getGameObjects() if obj.getIdentifier() == identifier), None)
+
+
+def linearRemoveGameObjectById(self, identifier: str) -> None:
+    """
+    The previous Implementation of GameObjectContainer.removeGameObjectById.
+    """
+    for gameObject in [obj for obj in self.getGameObjects() if obj.getIdentifier() == identifier]:
+        self.getGameObjects().remove(gameObject)
+
+
+def runFrames(hud: Hud, messages: list[TimedTextGameObject], frames: int) -> float:
+    """
+    Run the Container Work of the given Number of Frames.
+
+    Returns:
+        float: Mean Milliseconds per Frame.
+    """
+    drawables: list = []
+    start = time.perf_counter()
+    for _ in range(frames):
+        hud.update()
+        for message in messages:
+            drawables.clear()
+            message.collectDrawables(drawables)
+    return (time.perf_counter() - start) / frames * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the GameObjectContainer Identifier Lookups.")
+    parser.add_argument("--small", action="store_true", help="Use the Small Screen Configuration.")
+    parser.add_argument("--frames", type=int, default=2000, help="Number of Frames per Run.")
+    parser.add_argument("--messages", type=int, default=5, help="Number of Timed Messages on Screen.")
+    arguments = parser.parse_args()
+
+    loadConfig(arguments.small)
+    pygame.init()
+    screenConfig = getConfig().getScreenConfig()
+    screen = pygame.display.set_mode((screenConfig.getScreenWidth(), screenConfig.getScreenHeight()))
+    gameObjectCreationService = GameObjectCreationService(screen, screenConfig.getGameWidth(), screenConfig.getGameHeight())
+    difficulty = GameDifficulty()
+    hud = Hud(screen=screen, oreToCollect=difficulty.getOreToCollect(), entityRegistry=EntityRegistry(gameObjectCreationService.createGameObjects(difficulty)))
+    messages = [
+        TimedTextGameObject(message=f"Message {index}", xCoordinate=100, yCoordinate=100, fontSize=24, screen=screen, duration=3600)
+        for index in range(arguments.messages)
+    ]
+
+    # Warm up the Font and Surface Caches before measuring
+    runFrames(hud, messages, 50)
+    indexed = runFrames(hud, messages, arguments.frames)
+
+    indexedGet = GameObjectContainer.getGameObjectById
+    indexedRemove = GameObjectContainer.removeGameObjectById
+    GameObjectContainer.getGameObjectById = linearGetGameObjectById
+    GameObjectContainer.removeGameObjectById = linearRemoveGameObjectById
+    try:
+        runFrames(hud, messages, 50)
+        linear = runFrames(hud, messages, arguments.frames)
+    finally:
+        GameObjectContainer.getGameObjectById = indexedGet
+        GameObjectContainer.removeGameObjectById = indexedRemove
+
+    print(f"frames={arguments.frames} messages={arguments.messages}")
+    print(f"linear scan:      {linear:.4f} ms/frame")
+    print(f"identifier index: {indexed:.4f} ms/frame")
+    print(f"speedup:          {linear / indexed:.2f}x")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,94 @@
+"""
+Memory Report of the Python Heap Bytes per Game Entity Type.
+
+Creates a Number of Instances of every Entity Type and divides the Python Heap Growth, measured
+with tracemalloc, by the Number of Instances. Images are shared between the Instances, and the
+Pixel Memory of pygame Surfaces is allocated by SDL and not part of the Report, so the Numbers are
+the Cost of the Python Objects themselves: Instance, Attribute Storage and owned Containers.
+A TimedTextGameObject is reported including its Text, its Background and its RenderList.
+
+Usage (from the TransporterSpielGameCode Directory):
+    python Benchmarks/MemoryReport.py [--small] [--instances N]
+"""
+import argparse
+import gc
+import random
+import os
+import sys
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from Model.GameObjects.Base.GameObject import GameObject
+from Model.GameObjects.Base.ImageGameObject import ImageGameObject
+from Model.GameObjects.Buildings.GasStation import GasStation
+from Model.GameObjects.Buildings.OreMine import OreMine
+from Model.GameObjects.Buildings.OreUnloadStation import OreUnloadStation
+from Model.GameObjects.Game.SimulationClock import SimulationClock
+from Model.GameObjects.Messages.TextGameObject import TextGameObject
+from Model.GameObjects.Messages.TimedMessage import TimedTextGameObject
+from Model.GameObjects.Vehicles.Helicopter import Helicopter
+from Model.GameObjects.Vehicles.OreTransport import OreTransport
+from Services.ConfigService import loadConfig, getConfig
+
+
+def measureBytesPerInstance(factory, instances: int) -> float:
+    """
+    Return the Python Heap Growth per Instance when creating the given Number of Instances.
+    """
+    # Create one Instance first, so lazily created shared State (Fonts, Config Lookups) is not counted
+    warmUp = factory()
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    created = [factory() for _ in range(instances)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # The List holding the Instances is not Part of their Cost
+    listBytes = sys.getsizeof(created)
+    del created, warmUp
+    return (after - before - listBytes) / instances
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report the Python Heap Bytes per Game Entity Type.")
+    parser.add_argument("--small", action="store_true", help="Use the Small Screen Configuration.")
+    parser.add_argument("--instances", type=int, default=2000, help="Number of Instances per Type.")
+    arguments = parser.parse_args()
+
+    loadConfig(arguments.small)
+    pygame.init()
+    screenConfig = getConfig().getScreenConfig()
+    screen = pygame.display.set_mode((screenConfig.getScreenWidth(), screenConfig.getScreenHeight()))
+    image = pygame.Surface((40, 40))
+    # All Helicopters of a Round share its Random Generator and Clock
+    randomGenerator = random.Random(0)
+    simulationClock = SimulationClock()
+
+    factories = {
+        "GameObject": lambda: GameObject(screen=screen),
+        "ImageGameObject": lambda: ImageGameObject(image=image, screen=screen),
+        "TextGameObject": lambda: TextGameObject(screen=screen, message="Refueled!", fontSize=24),
+        "OreTransport": lambda: OreTransport(screen=screen, image=image),
+        "Helicopter": lambda: Helicopter(screen=screen, image=image, randomGenerator=randomGenerator, simulationClock=simulationClock),
+        "GasStation": lambda: GasStation(screen=screen, image=image),
+        "OreMine": lambda: OreMine(screen=screen, image=image),
+        "OreUnloadStation": lambda: OreUnloadStation(screen=screen, image=image),
+        "TimedTextGameObject": lambda: TimedTextGameObject(message="Refueled!", xCoordinate=100, yCoordinate=100, fontSize=24, screen=screen),
+    }
+
+    print(f"instances={arguments.instances}")
+    print(f"{'entity type':<20} {'bytes/entity':>12} {'__dict__':>9}")
+    for name, factory in factories.items():
+        bytesPerInstance = measureBytesPerInstance(factory, arguments.instances)
+        hasDict = "yes" if hasattr(factory(), "__dict__") else "no"
+        print(f"{name:<20} {bytesPerInstance:>12.0f} {hasDict:>9}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,403 @@
+"""
+Microbenchmark Suite for the Engine Hot Paths.
+
+Times each Primitive in Isolation with the Fixtures of a real Game Round (Assets, Fonts, HUD and
+Vehicles created by the Game Services) under the SDL Dummy Drivers:
+    - ImageGameObject.draw of the rotating Ore Transport,
+    - GameObjectContainer.draw of a Timed Message (Background and Text),
+    - TextGameObject.updateMessage with a changed and an unchanged Message,
+    - FuelLevelBar.update and SideHud.update while the Fuel Level drops,
+    - GameRound.__handleCollisions__ with the Trigger Zone Update of one Tick,
+    - Vehicle.__move__ with the "python" Physics Backend,
+    - GameRound.reset of a rendered Round, alternating between two Difficulties,
+    - TimedMessagePoolService.acquire and release of the alternating Messages of a Refuel Stop,
+    - DifficultySelectionService Keystroke, typing into a Field and redrawing the changed Rows.
+
+Every Screen Profile runs in its own Process, as the Configuration can only be loaded once.
+Each Sample is the mean Time of one Batch of Calls in Microseconds, so the Timer Resolution does
+not matter. A single Process can run noticeably faster or slower than the next one on the same
+Machine, so every Profile runs --runs Times in fresh Processes and every Statistic is the Median
+over the Runs. The largest relative Deviation of a Run p50 from that Median is stored as the Spread.
+
+The Results are written as JSON with mean, p50, p99 and spread per Profile and Primitive and
+compared with the p50 of a stored Baseline. A Primitive slower than the Baseline by more than
+--tolerance, or by more than the Spread observed while recording the Baseline if that is larger,
+counts as Regression, which sets the Exit Code to 1. The Baseline is specific to the Machine it was
+recorded on, record it again with --updateBaseline after changing Machines.
+
+Usage (from the TransporterSpielGameCode Directory):
+    python Benchmarks/MicroBenchmarks.py [--profiles small big] [--samples N] [--batch N] [--runs N]
+        [--output FILE] [--baseline FILE] [--updateBaseline] [--tolerance F]
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from Model.GameObjects.Game.GameDifficulty import GameDifficulty
+from Model.GameObjects.Game.GameRound import GameRound
+from Model.GameObjects.MenuElements.HudElements.HudWidgets.FuelLevelBar import FuelLevelBar
+from Model.GameObjects.MenuElements.HudElements.SideHud import SideHud
+from Model.GameObjects.MenuElements.MainMenu import MainMenu
+from Model.GameObjects.Messages.TextGameObject import TextGameObject
+from Model.GameObjects.Messages.TimedMessage import TimedTextGameObject
+from Model.GameObjects.Vehicles.OreTransport import OreTransport
+from Services.ConfigService import loadConfig, getConfig
+from Services.DifficultySelectionService import DifficultySelectionService
+from Services.FontRegistryService import getFontRegistry
+from Services.GameObjectCreationService import GameObjectCreationService
+from Services.TimedMessagePoolService import TimedMessagePoolService
+
+BENCHMARK_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(BENCHMARK_DIRECTORY, "MicroBenchmarkBaseline.json")
+PROFILES = ("small", "big")
+
+
+def percentile(sortedValues: list[float], fraction: float) -> float:
+    """
+    Return the Nearest-Rank Percentile of sorted Values, e.g. fraction 0.99 for p99.
+    """
+    index = min(len(sortedValues) - 1, max(0, round(fraction * len(sortedValues)) - 1))
+    return sortedValues[index]
+
+
+def measure(operation, samples: int, batch: int, warmUpSamples: int = 10) -> dict:
+    """
+    Time an Operation in Batches of Calls.
+
+    Args:
+        operation (Callable): The Operation to time, called batch Times per Sample.
+        samples (int): Number of timed Samples.
+        batch (int): Calls per Sample.
+        warmUpSamples (int): Untimed Samples to fill the Caches first.
+
+    Returns:
+        dict: mean, p50 and p99 in Microseconds per Call and the Number of Samples.
+    """
+    for _ in range(warmUpSamples * batch):
+        operation()
+    timings = []
+    # Like timeit, keep Garbage Collection Pauses out of the Samples
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(samples):
+            start = time.perf_counter_ns()
+            for _ in range(batch):
+                operation()
+            timings.append((time.perf_counter_ns() - start) / batch / 1000)
+    finally:
+        gc.enable()
+    timings.sort()
+    return {
+        "mean": sum(timings) / len(timings),
+        "p50": percentile(timings, 0.50),
+        "p99": percentile(timings, 0.99),
+        "samples": samples,
+        "unit": "us",
+    }
+
+
+def createBenchmarks(screen: pygame.Surface) -> dict:
+    """
+    Create the Fixtures and return the timed Operation of every Primitive by Name.
+
+    Returns:
+        dict[str, tuple[Callable, int]]: The Operation and its Batch Factor, which multiplies the Batch
+            Size for Operations that only make Sense as a Sequence of Calls.
+    """
+    screenConfig = getConfig().getScreenConfig()
+    gameObjectCreationService = GameObjectCreationService(screen, screenConfig.getGameWidth(), screenConfig.getGameHeight())
+    mainMenu = MainMenu(screen=screen, bigFont=32, smallFont=22)
+    difficulty = GameDifficulty()
+
+    # A headless Round, so the Interactions do not add Timed Messages while measuring
+    gameRound = GameRound(
+        difficulty=difficulty,
+        gameObjectCreationService=gameObjectCreationService,
+        mainMenu=mainMenu,
+        screen=screen,
+        headless=True,
+        seed=0
+    )
+    entityRegistry = gameRound.__entityRegistry__
+    oreTransport: OreTransport = entityRegistry.getFirst(OreTransport)
+
+    def drawImage():
+        oreTransport.setOrientation(oreTransport.getOrientation() + 1)
+        oreTransport.draw()
+
+    timedMessage = TimedTextGameObject(message="Loaded 20 Ore", xCoordinate=300, yCoordinate=300, fontSize=24, screen=screen, duration=3600)
+
+    text = TextGameObject(screen=screen, message="Fuel: 100%", fontSize=screenConfig.getHudConfig().getSideHudConfig().getSmallFont())
+    messages = ["Fuel: 99%", "Fuel: 98%"]
+    messageIndex = [0]
+
+    def updateChangedMessage():
+        messageIndex[0] ^= 1
+        text.updateMessage(messages[messageIndex[0]])
+
+    def updateUnchangedMessage():
+        text.updateMessage(messages[messageIndex[0]])
+
+    # Drop the Fuel in small Steps and refill it when empty, like a driving Ore Transport
+    def drainFuel():
+        fuelLevel = oreTransport.getFuelLevel() - 0.05
+        oreTransport.setFuelLevel(fuelLevel if fuelLevel > 0 else oreTransport.getFuelCapacity())
+
+    fuelLevelBar = FuelLevelBar(screen=screen, oreTransport=oreTransport, yCoordinate=20)
+
+    def updateFuelLevelBar():
+        drainFuel()
+        fuelLevelBar.update()
+
+    sideHud = SideHud(screen=screen, entityRegistry=entityRegistry, oreToCollect=difficulty.getOreToCollect())
+
+    def updateSideHud():
+        drainFuel()
+        sideHud.update()
+
+    # In the open Field between the Buildings, so only the Queries and no Transfers are measured
+    def handleCollisions():
+        oreTransport.setXCoordinate(gameRound.__gameWidth__ / 2)
+        oreTransport.setYCoordinate(screenConfig.getScreenHeight() / 4)
+        gameRound.__handleCollisions__(oreTransport=oreTransport)
+
+    def moveVehicle():
+        oreTransport.setSpeed(3.0)
+        oreTransport.__move__()
+        if oreTransport.getFuelLevel() < 1:
+            oreTransport.setFuelLevel(oreTransport.getFuelCapacity())
+
+    # A rendered Round with HUD, restarted like after pressing R in the Main Menu
+    restartedRound = GameRound(
+        difficulty=difficulty,
+        gameObjectCreationService=gameObjectCreationService,
+        mainMenu=MainMenu(screen=screen, bigFont=32, smallFont=22),
+        screen=screen,
+        seed=0
+    )
+    restartDifficulties = [difficulty, GameDifficulty(percentageToCollect=60, totalOre=800, transporterCapacity=80)]
+    restartIndex = [0]
+
+    def resetRound():
+        restartIndex[0] ^= 1
+        restartedRound.reset(restartDifficulties[restartIndex[0]], seed=0)
+
+    # Both Messages were shown before, so every Acquire reuses a Message with the same Text
+    timedMessagePool = TimedMessagePoolService(screen=screen, fontSize=24)
+    poolMessages = ["Refueled!", "Loaded 20 Ore"]
+    for pooledMessage in [timedMessagePool.acquire(message, 300, 300, 1) for message in poolMessages]:
+        timedMessagePool.release(pooledMessage)
+    poolIndex = [0]
+
+    def acquireTimedMessage():
+        poolIndex[0] ^= 1
+        timedMessagePool.release(timedMessagePool.acquire(poolMessages[poolIndex[0]], 300, 300, 1))
+
+    # A Digit typed into and deleted from Total Ore, which also changes the computed Ore to Collect Row
+    difficultySelectionService = DifficultySelectionService(screen=screen, clock=pygame.time.Clock())
+    difficultySelectionService.__startSelection__()
+    difficultySelectionService.__updateFieldValues__()
+    difficultySelectionService.__render__()
+    keyEvents = [
+        pygame.event.Event(pygame.KEYDOWN, key=pygame.K_5, unicode="5", mod=0),
+        pygame.event.Event(pygame.KEYDOWN, key=pygame.K_BACKSPACE, unicode="", mod=0)
+    ]
+    keyIndex = [0]
+
+    def typeDifficultyKey():
+        keyIndex[0] ^= 1
+        difficultySelectionService.__handleInput__([keyEvents[keyIndex[0]]])
+        difficultySelectionService.__updateFieldValues__()
+        difficultySelectionService.__render__()
+
+    return {
+        "ImageGameObject.draw": (drawImage, 1),
+        "GameObjectContainer.draw": (timedMessage.draw, 1),
+        "TextGameObject.updateMessage (changed)": (updateChangedMessage, 1),
+        "TextGameObject.updateMessage (unchanged)": (updateUnchangedMessage, 1),
+        "FuelLevelBar.update": (updateFuelLevelBar, 1),
+        "SideHud.update": (updateSideHud, 1),
+        "GameRound.__handleCollisions__": (handleCollisions, 1),
+        "Vehicle.__move__": (moveVehicle, 1),
+        "GameRound.reset": (resetRound, 1),
+        "TimedMessagePoolService.acquire": (acquireTimedMessage, 1),
+        "DifficultySelectionService keystroke": (typeDifficultyKey, 1),
+    }
+
+
+def runProfile(profile: str, samples: int, batch: int) -> dict:
+    """
+    Run all Microbenchmarks for one Screen Profile in this Process.
+
+    Returns:
+        dict[str, dict]: The Statistics of every Primitive.
+    """
+    loadConfig(profile == "small")
+    pygame.init()
+    screenConfig = getConfig().getScreenConfig()
+    screen = pygame.display.set_mode((screenConfig.getScreenWidth(), screenConfig.getScreenHeight()))
+    getFontRegistry().prewarmConfiguredFonts()
+
+    results = {}
+    for name, (operation, batchFactor) in createBenchmarks(screen).items():
+        results[name] = measure(operation, samples, batch * batchFactor)
+    pygame.quit()
+    return results
+
+
+def runProfileInSubprocess(profile: str, samples: int, batch: int) -> dict:
+    """
+    Run all Microbenchmarks for one Screen Profile in a fresh Python Process.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        resultFile = os.path.join(directory, f"{profile}.json")
+        subprocess.run(
+            [
+                sys.executable, os.path.abspath(__file__),
+                "--runProfile", profile,
+                "--resultFile", resultFile,
+                "--samples", str(samples),
+                "--batch", str(batch)
+            ],
+            check=True,
+            cwd=os.path.dirname(BENCHMARK_DIRECTORY),
+            env={**os.environ, "PYGAME_HIDE_SUPPORT_PROMPT": "1"}
+        )
+        with open(resultFile) as file:
+            return json.load(file)
+
+
+def combineRuns(runs: list[dict]) -> dict:
+    """
+    Combine the Results of repeated Runs of one Profile.
+
+    Args:
+        runs (list[dict]): The Statistics of every Primitive per Run, see runProfile.
+
+    Returns:
+        dict[str, dict]: The Median of mean, p50 and p99 over the Runs of every Primitive, with the
+            Number of Runs and the Spread, the largest relative Deviation of a Run p50 from the Median p50.
+    """
+    results = {}
+    for name in runs[0]:
+        runStatistics = [run[name] for run in runs]
+        p50 = statistics.median(runStatistic["p50"] for runStatistic in runStatistics)
+        results[name] = {
+            "mean": statistics.median(runStatistic["mean"] for runStatistic in runStatistics),
+            "p50": p50,
+            "p99": statistics.median(runStatistic["p99"] for runStatistic in runStatistics),
+            "spread": max(abs(runStatistic["p50"] / p50 - 1) for runStatistic in runStatistics),
+            "samples": runStatistics[0]["samples"],
+            "runs": len(runs),
+            "unit": runStatistics[0]["unit"],
+        }
+    return results
+
+
+def compareWithBaseline(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """
+    Print the p50 of every Primitive next to its Baseline and return the Regressions.
+
+    Args:
+        results (dict): The current Results by Profile and Primitive.
+        baseline (dict): The Baseline Results in the same Format.
+        tolerance (float): Allowed relative Slowdown of the p50, e.g. 0.25 for 25 %. A Primitive whose
+            Baseline Runs spread further may slow down by its Spread instead.
+
+    Returns:
+        list[str]: "profile: primitive" of every Primitive slower than the Tolerance allows.
+    """
+    regressions = []
+    print(f"{'profile':<7} {'primitive':<42} {'p50 us':>9} {'baseline':>9} {'change':>8} {'allowed':>8}")
+    for profile, profileResults in results.items():
+        baselineResults = baseline.get(profile, {})
+        for name, statistics in profileResults.items():
+            baselineStatistics = baselineResults.get(name)
+            if baselineStatistics is None:
+                print(f"{profile:<7} {name:<42} {statistics['p50']:>9.2f} {'-':>9} {'new':>8}")
+                continue
+            change = statistics["p50"] / baselineStatistics["p50"] - 1
+            allowed = max(tolerance, baselineStatistics.get("spread", 0.0))
+            marker = ""
+            if change > allowed:
+                marker = " REGRESSION"
+                regressions.append(f"{profile}: {name}")
+            print(f"{profile:<7} {name:<42} {statistics['p50']:>9.2f} {baselineStatistics['p50']:>9.2f} {change:>+7.0%} {allowed:>7.0%}{marker}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the Engine Hot Paths and compare them with a Baseline.")
+    parser.add_argument("--profiles", nargs="+", choices=PROFILES, default=list(PROFILES), help="Screen Profiles to measure.")
+    parser.add_argument("--samples", type=int, default=1000, help="Timed Samples per Primitive.")
+    parser.add_argument("--batch", type=int, default=20, help="Calls per Sample.")
+    parser.add_argument("--runs", type=int, default=5, help="Processes per Profile, whose Median is compared.")
+    parser.add_argument("--output", default=None, help="Write the Results as JSON to this File.")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline File to compare with.")
+    parser.add_argument("--updateBaseline", action="store_true", help="Store the Results as the new Baseline.")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative Slowdown of the p50, at least the Baseline Spread.")
+    parser.add_argument("--runProfile", choices=PROFILES, help=argparse.SUPPRESS)
+    parser.add_argument("--resultFile", help=argparse.SUPPRESS)
+    arguments = parser.parse_args()
+
+    if arguments.runs < 1:
+        parser.error("--runs must be at least 1")
+
+    if arguments.runProfile is not None:
+        results = runProfile(arguments.runProfile, arguments.samples, arguments.batch)
+        with open(arguments.resultFile, "w") as file:
+            json.dump(results, file)
+        return
+
+    # Alternate the Profiles, so a slow Phase of the Machine does not hit all Runs of one Profile
+    runs = {profile: [] for profile in arguments.profiles}
+    for _ in range(arguments.runs):
+        for profile in arguments.profiles:
+            runs[profile].append(runProfileInSubprocess(profile, arguments.samples, arguments.batch))
+    results = {profile: combineRuns(profileRuns) for profile, profileRuns in runs.items()}
+    report = {
+        "environment": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+        },
+        "settings": {"samples": arguments.samples, "batch": arguments.batch, "runs": arguments.runs},
+        "results": results,
+    }
+    if arguments.output is not None:
+        with open(arguments.output, "w") as file:
+            json.dump(report, file, indent=2)
+
+    regressions = []
+    if os.path.exists(arguments.baseline):
+        with open(arguments.baseline) as file:
+            regressions = compareWithBaseline(results, json.load(file)["results"], arguments.tolerance)
+    else:
+        print(f"No Baseline at {arguments.baseline}, store one with --updateBaseline.")
+
+    if arguments.updateBaseline:
+        with open(arguments.baseline, "w") as file:
+            json.dump(report, file, indent=2)
+        print(f"Stored the Baseline at {arguments.baseline}")
+    elif regressions:
+        print(f"{len(regressions)} Regression(s) beyond the allowed Slowdown: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,135 @@
+"""
+Benchmark for the Collision Broadphase with 10 to 10,000 Entities.
+
+Scatters moving Entities with a constant Density (the World grows with the Entity Count) and measures
+per Tick:
+    - the SpatialHashGrid.refresh() that re-buckets the moved Entities, shared by all Queries of a Tick,
+    - one Object against all others, as GameRound does for the Ore Transport:
+      a linear Scan with ImageGameObject.areColliding versus SpatialHashGrid.queryOverlapping,
+    - all colliding Pairs: the O(n^2) Pair Loop with areColliding versus SpatialHashGrid.queryPairs.
+The Pair Loop is skipped above --pairLimit Entities, as it takes Minutes there. Both Methods must
+find the same Collisions.
+
+Usage (from the TransporterSpielGameCode Directory):
+    python Benchmarks/SpatialHashBenchmark.py [--ticks N] [--entities N [N ...]] [--cellSize N] [--pairLimit N]
+"""
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from Model.GameObjects.Base.ImageGameObject import ImageGameObject
+from Model.GameObjects.Base.SpatialHashGrid import SpatialHashGrid
+
+# World Area per Entity in square Pixels, about the Density of the Game Area with a Dozen Objects
+AREA_PER_ENTITY = 40000
+
+
+def createEntities(count: int, worldSize: float, generator: random.Random) -> list[ImageGameObject]:
+    """
+    Create Entities with Radii between 10 and 30 Pixels at random Positions.
+    """
+    screen = pygame.Surface((1, 1))
+    images = [pygame.Surface((size, size)) for size in range(20, 61, 10)]
+    return [
+        ImageGameObject(
+            image=generator.choice(images),
+            screen=screen,
+            xCoordinate=generator.uniform(0, worldSize),
+            yCoordinate=generator.uniform(0, worldSize)
+        )
+        for _ in range(count)
+    ]
+
+
+def moveEntities(entities: list[ImageGameObject], generator: random.Random) -> None:
+    for entity in entities:
+        entity.setXCoordinate(entity.getXCoordinate() + generator.uniform(-4, 4))
+        entity.setYCoordinate(entity.getYCoordinate() + generator.uniform(-4, 4))
+
+
+def linearQuery(entities: list[ImageGameObject], queried: ImageGameObject) -> list[ImageGameObject]:
+    return [entity for entity in entities if entity is not queried and queried.areColliding(entity, True)]
+
+
+def pairLoop(entities: list[ImageGameObject]) -> list[tuple]:
+    return [
+        (first, second)
+        for index, first in enumerate(entities)
+        for second in entities[index + 1:]
+        if first.areColliding(second, True)
+    ]
+
+
+def measure(function, ticks: int, entities: list[ImageGameObject], generator: random.Random, prepare=None) -> tuple[float, int]:
+    """
+    Run the Function once per Tick after moving all Entities.
+
+    Args:
+        prepare (Callable): Optional untimed Work after the Movement, e.g. refreshing the Grid.
+
+    Returns:
+        tuple[float, int]: Mean Milliseconds per Tick (without the Movement) and the total Number of found Collisions.
+    """
+    elapsed = 0.0
+    found = 0
+    for _ in range(ticks):
+        moveEntities(entities, generator)
+        if prepare is not None:
+            prepare()
+        start = time.perf_counter()
+        found += len(function())
+        elapsed += time.perf_counter() - start
+    return elapsed / ticks * 1000, found
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Spatial Hash Grid Broadphase.")
+    parser.add_argument("--ticks", type=int, default=20, help="Number of Ticks per Measurement.")
+    parser.add_argument("--entities", type=int, nargs="+", default=[10, 100, 1000, 10000], help="Numbers of Entities.")
+    parser.add_argument("--cellSize", type=float, default=128, help="Edge Length of a Grid Cell in Pixels.")
+    parser.add_argument("--pairLimit", type=int, default=2000, help="Largest Entity Count for the O(n^2) Pair Loop.")
+    arguments = parser.parse_args()
+
+    print(f"ticks={arguments.ticks} cellSize={arguments.cellSize} areaPerEntity={AREA_PER_ENTITY}")
+    print(f"{'entities':>8} | {'refresh ms':>10} | {'one vs all ms: scan':>19} {'grid':>8} {'speedup':>8} | {'all pairs ms: loop':>18} {'grid':>8} {'speedup':>8}")
+    for count in arguments.entities:
+        worldSize = math.sqrt(count * AREA_PER_ENTITY)
+        entities = createEntities(count, worldSize, random.Random(count))
+        queried = entities[0]
+        grid = SpatialHashGrid(cellSize=arguments.cellSize, gameObjects=entities)
+
+        # Identical Seeds give both Methods the same Movement, so their Results must match
+        scanTime, scanFound = measure(lambda: linearQuery(entities, queried), arguments.ticks, entities, random.Random(1))
+        entities = createEntities(count, worldSize, random.Random(count))
+        queried = entities[0]
+        grid = SpatialHashGrid(cellSize=arguments.cellSize, gameObjects=entities)
+
+        gridTime, gridFound = measure(lambda: grid.queryOverlapping(queried), arguments.ticks, entities, random.Random(1), grid.refresh)
+        if scanFound != gridFound:
+            raise AssertionError(f"Query Mismatch with {count} Entities: scan {scanFound}, grid {gridFound}")
+
+        gridPairTime, gridPairsFound = measure(grid.queryPairs, arguments.ticks, entities, random.Random(2), grid.refresh)
+        refreshTime, _ = measure(lambda: grid.refresh() or (), arguments.ticks, entities, random.Random(3))
+
+        loopColumn = f"{'skipped':>18} {gridPairTime:>8.3f} {'':>8}"
+        if count <= arguments.pairLimit:
+            entities = createEntities(count, worldSize, random.Random(count))
+            # The Grid Run moved the Entities through its first Measurement, repeat that Movement
+            measure(lambda: (), arguments.ticks, entities, random.Random(1))
+            loopTime, loopFound = measure(lambda: pairLoop(entities), arguments.ticks, entities, random.Random(2))
+            if loopFound != gridPairsFound:
+                raise AssertionError(f"Pair Mismatch with {count} Entities: loop {loopFound}, grid {gridPairsFound}")
+            loopColumn = f"{loopTime:>18.3f} {gridPairTime:>8.3f} {loopTime / gridPairTime:>7.1f}x"
+
+        print(f"{count:>8} | {refreshTime:>10.3f} | {scanTime:>19.3f} {gridTime:>8.3f} {scanTime / gridTime:>7.1f}x | {loopColumn}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,106 @@
+"""
+Benchmark for the per-Tick Cost of the Vehicle Physics with many Vehicles.
+
+Drives the given Numbers of Ore Transports with a fixed Input Pattern, once with the "python" Backend
+(every Vehicle moves itself) and once attached to the vectorized VehiclePhysicsService, and checks
+that both Backends end at the same Positions and Fuel Levels.
+
+Usage (from the TransporterSpielGameCode Directory):
+    python Benchmarks/VehiclePhysicsBenchmark.py [--small] [--ticks N] [--vehicles N [N ...]]
+"""
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from Model.GameObjects.Game.FixedTimestep import getTickScale
+from Model.GameObjects.Vehicles.OreTransport import OreTransport
+from Model.GameObjects.Vehicles.Vehicle import Vehicle
+from Services.ConfigService import loadConfig, getConfig
+from Services.VehiclePhysicsService import VehiclePhysicsService, isVectorizedPhysicsAvailable
+
+
+def createVehicles(screen: pygame.Surface, count: int) -> list[OreTransport]:
+    """
+    Create Ore Transports spread over the Screen with different Orientations.
+    """
+    image = pygame.Surface((40, 20))
+    vehicles = []
+    for index in range(count):
+        vehicle = OreTransport(
+            screen=screen,
+            image=image,
+            xCoordinate=(index * 37) % screen.get_width(),
+            yCoordinate=(index * 53) % screen.get_height()
+        )
+        vehicle.setOrientation(index * 7)
+        vehicles.append(vehicle)
+    return vehicles
+
+
+def runTicks(vehicles: list[OreTransport], ticks: int, physicsService: VehiclePhysicsService = None) -> float:
+    """
+    Accelerate, steer and update all Vehicles for the given Number of Ticks.
+
+    Returns:
+        float: Mean Milliseconds per Tick.
+    """
+    start = time.perf_counter()
+    for tick in range(ticks):
+        accelerating = tick % 200 < 150
+        steering = (tick // 50) % 3 == 0
+        for vehicle in vehicles:
+            if accelerating:
+                vehicle.accelerate()
+            if steering:
+                vehicle.steer("right")
+            vehicle.update()
+        if physicsService is not None:
+            physicsService.step()
+    return (time.perf_counter() - start) / ticks * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the python and the vectorized Vehicle Physics.")
+    parser.add_argument("--small", action="store_true", help="Use the Small Screen Configuration.")
+    parser.add_argument("--ticks", type=int, default=600, help="Number of Ticks per Run.")
+    parser.add_argument("--vehicles", type=int, nargs="+", default=[10, 100, 1000, 5000], help="Numbers of Vehicles.")
+    arguments = parser.parse_args()
+
+    if not isVectorizedPhysicsAvailable():
+        print("NumPy is not installed, the vectorized Backend cannot be measured.")
+        return
+
+    loadConfig(arguments.small)
+    pygame.init()
+    screenConfig = getConfig().getScreenConfig()
+    screen = pygame.display.set_mode((screenConfig.getScreenWidth(), screenConfig.getScreenHeight()))
+
+    print(f"ticks={arguments.ticks}")
+    print(f"{'vehicles':>8} {'python ms/tick':>15} {'numpy ms/tick':>14} {'speedup':>8} {'max deviation':>14}")
+    for count in arguments.vehicles:
+        pythonVehicles = createVehicles(screen, count)
+        pythonTime = runTicks(pythonVehicles, arguments.ticks)
+
+        numpyVehicles = createVehicles(screen, count)
+        physicsService = VehiclePhysicsService(columns=list(Vehicle.PHYSICS_COLUMNS), tickScale=getTickScale())
+        for vehicle in numpyVehicles:
+            physicsService.attach(vehicle)
+        numpyTime = runTicks(numpyVehicles, arguments.ticks, physicsService)
+
+        deviation = max(
+            max(abs(a.getXCoordinate() - b.getXCoordinate()), abs(a.getYCoordinate() - b.getYCoordinate()), abs(a.getFuelLevel() - b.getFuelLevel()))
+            for a, b in zip(pythonVehicles, numpyVehicles)
+        )
+        print(f"{count:>8} {pythonTime:>15.4f} {numpyTime:>14.4f} {pythonTime / numpyTime:>7.2f}x {deviation:>14.2e}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -1,184 +1,317 @@
-import pygame
-import sys
-
-from Model.GameObjects.Game.GameRound import GameRound
-from Model.GameObjects.Messages.ErrorMessage import ErrorTextGameObject
-from Model.GameObjects.Game.GameDifficulty import GameDifficulty
-from Model.GameObjects.MenuElements.MainMenu import MainMenu
-from Model.GameObjects.Exceptions.QuitException import QuitException
-from Services.ConfigService import loadConfig, getConfig
-from Services.DifficultySelectionService import DifficultySelectionService
-from Services.GameObjectCreationService import GameObjectCreationService
-
-class Game:
-    """
-    A Class representing the Main Game Loop and Setup for the Vehicle Game.
-
-    Attributes:
-        __difficulty__ (GameDifficulty): The Difficulty Level for the current Game Round.
-        __playing__ (bool): Flag indicating whether the Game is currently being played.
-        __running__ (bool): Flag indicating whether the Game Loop is running.
-        __oreDelivered__ (float): The Amount of Ore delivered during the Game.
-        __screen__ (pygame.Surface): The Pygame Surface representing the Game Window.
-        __mainMenu__ (MainMenu): The Main Menu Interface.
-        __clock__ (pygame.time.Clock): Clock for managing the Frame Rate.
-        __difficultySelectionService__ (DifficultySelectionService): Service to manage Difficulty Selection.
-        __gameObjectCreationService__ (GameObjectCreationService): Service to create Game Objects.
-        __windowHeight__ (int): Height of the Game Window.
-        __gameWidth__ (int): Width of the actual Game Area (excluding HUD).
-        __hudWidth__ (int): Width of the HUD Sidebar.
-        __difficultySelected__ (bool): Whether the Difficulty Selection Screen should be shown.
-        __fps__ (int): The Frames Per Second Limit for the Game.
-    """
-    __difficulty__ : GameDifficulty
-    __playing__ : bool
-    __running__ : bool
-
-    __oreDelivered__ : float
-    __screen__ : pygame.Surface
-
-    __mainMenu__ : MainMenu
-    __clock__ : pygame.time.Clock
-    __difficultySelectionService__ : DifficultySelectionService
-    __gameObjectCreationService__ : GameObjectCreationService
-
-    __windowHeight__ : int
-    __gameWidth__ : int
-    __hudWidth__ : int
-    __difficultySelected__ : bool
-    __fps__ : int
-
-
-    def __init__(self):
-        """
-        Initialize the Game Environment, including Window Setup, Services, and Menu Components.
-        """
-        config = getConfig()
-        screenConfig = config.getScreenConfig()
-        windowWidth = screenConfig.getScreenWidth()
-        self.__hudWidth__ = screenConfig.getHudConfig().getSideHudConfig().getWidth()
-        self.__gameWidth__ = windowWidth - self.__hudWidth__
-        self.__windowHeight__ = screenConfig.getScreenHeight()
-        self.__difficultySelected__ = config.getDifficultySelection()
-        self.__fps__ = config.getFPS()
-
-        pygame.init()
-        self.__screen__ = pygame.display.set_mode((windowWidth, self.__windowHeight__))
-        pygame.display.set_caption("Vehicle Game")
-
-        self.__clock__ = pygame.time.Clock()
-
-        self.__paused__ = False
-        self.__running__ = True
-        self.__oreDelivered__ = 0
-
-        self.__gameObjectCreationService__ = GameObjectCreationService(
-            self.__screen__,
-            self.__gameWidth__,
-            self.__windowHeight__
-        )
-        # Setup Main Menu
-        self.__mainMenu__ = MainMenu(
-            screen=self.__screen__,
-            bigFont=32,
-            smallFont=22
-        )
-
-        self.__difficultySelectionService__ = DifficultySelectionService(
-            screen=self.__screen__,
-            clock=self.__clock__
-        )
-
-        self.__run__()
-
-    def __showErrorMessage__(self, message):
-        """
-        Display an Error Message on the Game Screen.
-
-        Args:
-            message (str): The Error Message Text to be displayed.
-        """
-        errorMessage : ErrorTextGameObject =ErrorTextGameObject(
-            self.__screen__,
-            message,
-        )
-        errorMessage.draw()
-
-    def __waitForKeyPress__(self, key):
-        """
-        Wait until the given Key is pressed or the Window is closed.
-
-        Args:
-            key (int): Pygame Key Code to wait for.
-
-        Returns:
-            bool: True if the specified Key was pressed, False if the Window was closed.
-        """
-        waiting = True
-        while waiting:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.__running__ = False
-
-                if event.type == pygame.KEYDOWN:
-                    if event.key == key:
-                        return True
-        return False
-
-    def __selectDifficulty__(self):
-        """
-        Handle the Difficulty Selection Process.
-
-        Returns:
-            bool: True if a Difficulty was successfully selected, False if the Game should exit.
-        """
-        self.__oreDelivered__ = 0
-        if self.__difficultySelected__:
-            self.__difficulty__ = self.__difficultySelectionService__.selectDifficulty()
-        else:
-            # Create Difficulty with Default Values
-            self.__difficulty__ = GameDifficulty()
-
-        if self.__difficulty__ is None:
-            return False
-        return True
-
-    def __run__(self):
-        """
-        Execute the Main Game Loop, handling Difficulty Selection and Round Execution.
-        """
-        self.__running__ = True
-        while self.__running__:
-            try:
-                if not self.__selectDifficulty__():
-                    break
-            except QuitException:
-                self.__running__ = False
-                break
-
-            self.__playing__ = True
-            currentRound : GameRound = GameRound(
-                difficulty=self.__difficulty__,
-                gameObjectCreationService=self.__gameObjectCreationService__,
-                mainMenu=self.__mainMenu__,
-                screen=self.__screen__
-            )
-
-            # Game Loop for the Current Round
-            while currentRound.isPlaying():
-
-                self.__clock__.tick(self.__fps__)
-
-                currentRound.update()
-
-
-        pygame.quit()
-
-# Handle external screen argument
-useSmallScreenOuter = "--small" in sys.argv
-
-# Load Configuration before Game Initialization
-loadConfig(useSmallScreenOuter)
-
-# Start the Game
-game = Game()
\ No newline at end of file
+import os
+import pygame
+import sys
+
+from Model.GameObjects.Game.FixedTimestep import FixedTimestep
+from Model.GameObjects.Game.GameRound import GameRound
+from Model.GameObjects.Messages.ErrorMessage import ErrorTextGameObject
+from Model.GameObjects.Messages.FinalMessage import FinalTextGameObject, LOSE_MESSAGE, WIN_MESSAGE
+from Model.GameObjects.Game.GameDifficulty import GameDifficulty
+from Model.GameObjects.MenuElements.MainMenu import MainMenu
+from Model.GameObjects.Exceptions.QuitException import QuitException
+from Services.AssetLoaderService import AssetLoaderService, getAssetLoader
+from Services.ConfigService import loadConfig, getConfig
+from Services.DifficultySelectionService import DifficultySelectionService
+from Services.FontRegistryService import getFontRegistry
+from Services.FrameProfilerService import FrameProfilerService
+from Services.GameObjectCreationService import GameObjectCreationService, buildAssetPackFromConfig
+from Services.HeadlessSimulationService import runHeadlessFromConfig, runReplayFromFile
+
+class Game:
+    """
+    A Class representing the Main Game Loop and Setup for the Vehicle Game.
+
+    Attributes:
+        __difficulty__ (GameDifficulty): The Difficulty Level for the current Game Round.
+        __playing__ (bool): Flag indicating whether the Game is currently being played.
+        __running__ (bool): Flag indicating whether the Game Loop is running.
+        __oreDelivered__ (float): The Amount of Ore delivered during the Game.
+        __screen__ (pygame.Surface): The Pygame Surface representing the Game Window.
+        __mainMenu__ (MainMenu): The Main Menu Interface.
+        __clock__ (pygame.time.Clock): Clock for managing the Frame Rate.
+        __difficultySelectionService__ (DifficultySelectionService): Service to manage Difficulty Selection.
+        __gameObjectCreationService__ (GameObjectCreationService): Service to create Game Objects.
+        __assetLoader__ (AssetLoaderService): Loads the Images and static Texts while the Difficulty Selection Screen is shown.
+        __windowHeight__ (int): Height of the Game Window.
+        __gameWidth__ (int): Width of the actual Game Area (excluding HUD).
+        __hudWidth__ (int): Width of the HUD Sidebar.
+        __difficultySelected__ (bool): Whether the Difficulty Selection Screen should be shown.
+        __fps__ (int): The Frames Per Second Limit for the Game.
+        __timestep__ (FixedTimestep): Converts the Frame Time into fixed Simulation Ticks.
+        __recordPath__ (str): Path the Input of every Round is recorded to, None if not recording.
+        __roundNumber__ (int): Number of Rounds started so far.
+        __frameProfiler__ (FrameProfilerService): Collects the Frame Times of all Rounds for the F3 Overlay, None if disabled.
+        __profileCsvPath__ (str): Path the buffered Frame Times are exported to on Exit, None if not exporting.
+    """
+    __difficulty__ : GameDifficulty
+    __playing__ : bool
+    __running__ : bool
+
+    __oreDelivered__ : float
+    __screen__ : pygame.Surface
+
+    __mainMenu__ : MainMenu
+    __clock__ : pygame.time.Clock
+    __difficultySelectionService__ : DifficultySelectionService
+    __gameObjectCreationService__ : GameObjectCreationService
+    __assetLoader__ : AssetLoaderService
+
+    __windowHeight__ : int
+    __gameWidth__ : int
+    __hudWidth__ : int
+    __difficultySelected__ : bool
+    __fps__ : int
+    __timestep__ : FixedTimestep
+    __recordPath__ : str
+    __roundNumber__ : int
+    __frameProfiler__ : FrameProfilerService
+    __profileCsvPath__ : str
+
+
+    def __init__(self, recordPath: str = None, profileCsvPath: str = None):
+        """
+        Initialize the Game Environment, including Window Setup, Services, and Menu Components.
+
+        Args:
+            recordPath (str): Record the Input of every Round, the first Round to "<name>-1<extension>" and so on.
+            profileCsvPath (str): Export the Frame Times to a CSV File on Exit, overrides the configured Path.
+        """
+        self.__recordPath__ = recordPath
+        self.__roundNumber__ = 0
+        config = getConfig()
+        screenConfig = config.getScreenConfig()
+        self.__hudWidth__ = screenConfig.getHudConfig().getSideHudConfig().getWidth()
+        self.__gameWidth__ = screenConfig.getGameWidth()
+        self.__windowHeight__ = screenConfig.getScreenHeight()
+        self.__difficultySelected__ = config.getDifficultySelection()
+        self.__fps__ = config.getFPS()
+        simulationConfig = config.getSimulationConfig()
+        self.__timestep__ = FixedTimestep(
+            tickRate=simulationConfig.getTickRate(),
+            maxTicksPerFrame=simulationConfig.getMaxTicksPerFrame()
+        )
+        profilerConfig = config.getProfilerConfig()
+        self.__frameProfiler__ = None
+        if profilerConfig.getEnabled():
+            self.__frameProfiler__ = FrameProfilerService(capacity=profilerConfig.getFrames())
+        self.__profileCsvPath__ = profileCsvPath if profileCsvPath is not None else profilerConfig.getCsvExportPath()
+
+        pygame.init()
+        self.__screen__ = pygame.display.set_mode((screenConfig.getScreenWidth(), self.__windowHeight__))
+        pygame.display.set_caption("Vehicle Game")
+        # Load all configured Fonts once before any Text is created
+        getFontRegistry().prewarmConfiguredFonts()
+
+        self.__clock__ = pygame.time.Clock()
+
+        self.__paused__ = False
+        self.__running__ = True
+        self.__oreDelivered__ = 0
+
+        # The Images load in the Background, the first Round waits only for the ones still pending
+        self.__assetLoader__ = getAssetLoader()
+        self.__gameObjectCreationService__ = GameObjectCreationService(
+            self.__screen__,
+            self.__gameWidth__,
+            self.__windowHeight__,
+            assetLoader=self.__assetLoader__
+        )
+        # Setup Main Menu
+        self.__mainMenu__ = MainMenu(
+            screen=self.__screen__,
+            bigFont=32,
+            smallFont=22
+        )
+
+        self.__difficultySelectionService__ = DifficultySelectionService(
+            screen=self.__screen__,
+            clock=self.__clock__
+        )
+
+        try:
+            self.__run__()
+        finally:
+            # Stop the Worker before pygame quits, it must never use pygame afterwards
+            self.__assetLoader__.shutdown()
+            pygame.quit()
+            # Also export when the Player quits from the Main Menu
+            self.__exportFrameProfile__()
+
+    def __showErrorMessage__(self, message):
+        """
+        Display an Error Message on the Game Screen.
+
+        Args:
+            message (str): The Error Message Text to be displayed.
+        """
+        errorMessage : ErrorTextGameObject =ErrorTextGameObject(
+            self.__screen__,
+            message,
+        )
+        errorMessage.draw()
+
+    def __waitForKeyPress__(self, key):
+        """
+        Wait until the given Key is pressed or the Window is closed.
+
+        Args:
+            key (int): Pygame Key Code to wait for.
+
+        Returns:
+            bool: True if the specified Key was pressed, False if the Window was closed.
+        """
+        waiting = True
+        while waiting:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self.__running__ = False
+
+                if event.type == pygame.KEYDOWN:
+                    if event.key == key:
+                        return True
+        return False
+
+    def __selectDifficulty__(self):
+        """
+        Handle the Difficulty Selection Process.
+
+        Returns:
+            bool: True if a Difficulty was successfully selected, False if the Game should exit.
+        """
+        self.__oreDelivered__ = 0
+        self.__prerenderRoundTexts__()
+        if self.__difficultySelected__:
+            self.__difficulty__ = self.__difficultySelectionService__.selectDifficulty()
+        else:
+            # Create Difficulty with Default Values
+            self.__difficulty__ = GameDifficulty()
+
+        if self.__difficulty__ is None:
+            return False
+        return True
+
+    def __prerenderRoundTexts__(self):
+        """
+        Pre-render the static Texts of the next Round in the Background, while the Difficulty is selected.
+        """
+        for message, fontSize, color in FinalTextGameObject.getTexts(WIN_MESSAGE, True) + FinalTextGameObject.getTexts(LOSE_MESSAGE, False):
+            self.__assetLoader__.prerenderText(message, fontSize, color)
+
+    def __saveInputRecording__(self, gameRound: GameRound):
+        """
+        Save the Input Recording of a Round, if the Game records the Input.
+
+        Args:
+            gameRound (GameRound): The finished or aborted Round.
+        """
+        recording = gameRound.getInputRecording()
+        if recording is None:
+            return
+        if recording.getResult() is None:
+            # Left before the Round ended, like a Replay that reaches the End of the Recording
+            recording.setResult("timeout", recording.getTickCount(), gameRound.getOreDelivered())
+        name, extension = os.path.splitext(self.__recordPath__)
+        path = f"{name}-{self.__roundNumber__}{extension}"
+        recording.save(path)
+        print(f"Recorded {recording} to {path}")
+
+    def __exportFrameProfile__(self):
+        """
+        Export the buffered Frame Times to the CSV File, if the Game profiles and exports them.
+        """
+        if self.__frameProfiler__ is None or self.__profileCsvPath__ is None:
+            return
+        self.__frameProfiler__.exportCsv(self.__profileCsvPath__)
+        print(f"Exported {self.__frameProfiler__} to {self.__profileCsvPath__}")
+
+    def __run__(self):
+        """
+        Execute the Main Game Loop, handling Difficulty Selection and Round Execution.
+        """
+        self.__running__ = True
+        currentRound : GameRound = None
+        while self.__running__:
+            try:
+                if not self.__selectDifficulty__():
+                    break
+            except QuitException:
+                self.__running__ = False
+                break
+
+            self.__playing__ = True
+            self.__roundNumber__ += 1
+            if currentRound is None:
+                currentRound = GameRound(
+                    difficulty=self.__difficulty__,
+                    gameObjectCreationService=self.__gameObjectCreationService__,
+                    mainMenu=self.__mainMenu__,
+                    screen=self.__screen__,
+                    recordInput=self.__recordPath__ is not None,
+                    frameProfiler=self.__frameProfiler__
+                )
+            else:
+                # Restart the previous Round in place instead of creating all Objects and the HUD again
+                currentRound.reset(self.__difficulty__)
+
+            # Do not count the Time spent before the Round towards its first Ticks
+            self.__timestep__.reset()
+            self.__clock__.tick()
+            if self.__frameProfiler__ is not None:
+                self.__frameProfiler__.restartFrame()
+
+            try:
+                # Game Loop for the Current Round: simulate fixed Ticks, render once per Frame
+                while currentRound.isPlaying():
+
+                    dueTicks = self.__timestep__.advance(self.__clock__.tick(self.__fps__))
+                    for _ in range(dueTicks):
+                        if not currentRound.isPlaying():
+                            break
+                        currentRound.tick()
+
+                    currentRound.render(self.__timestep__.getInterpolation())
+            finally:
+                # Also save the Recording when the Player quits from the Main Menu
+                self.__saveInputRecording__(currentRound)
+
+USAGE = "Usage: python Game.py [--small] [--headless] [--record FILE] [--replay FILE] [--buildAssetPack] [--profileCsv FILE]"
+
+
+def getOptionValue(option: str) -> str:
+    """
+    Return the Value following an Option on the Command Line, None if the Option is not given.
+
+    Exits with the Usage if the Option is the last Argument or followed by another Option.
+    """
+    if option not in sys.argv:
+        return None
+    valueIndex = sys.argv.index(option) + 1
+    if valueIndex >= len(sys.argv) or sys.argv[valueIndex].startswith("--"):
+        sys.exit(f"{option} needs a File Path.\n{USAGE}")
+    return sys.argv[valueIndex]
+
+
+# Handle external screen argument
+useSmallScreenOuter = "--small" in sys.argv
+# Simulate Rounds without Window, Rendering and Frame Rate Limit
+useHeadlessOuter = "--headless" in sys.argv
+# Record the Input of every Round to a File, or replay a recorded Round headless at maximum Speed
+recordPathOuter = getOptionValue("--record")
+replayPathOuter = getOptionValue("--replay")
+# Build the Asset Pack with the pre-scaled Images offline, the Game maps it at Startup
+useBuildAssetPackOuter = "--buildAssetPack" in sys.argv
+# Export the Frame Times shown by the F3 Profiler Overlay to a CSV File on Exit
+profileCsvPathOuter = getOptionValue("--profileCsv")
+
+# Load Configuration before Game Initialization
+loadConfig(useSmallScreenOuter)
+
+if useBuildAssetPackOuter:
+    buildAssetPackFromConfig()
+elif replayPathOuter is not None:
+    runReplayFromFile(replayPathOuter)
+elif useHeadlessOuter:
+    runHeadlessFromConfig()
+else:
+    # Start the Game
+    game = Game(recordPath=recordPathOuter, profileCsvPath=profileCsvPathOuter)
\ No newline at end of file
@@ -1,104 +1,189 @@
-import pygame
-
-class GameObject:
-    """
-    A Class representing the Base Object for all Game Elements.
-
-    This Class provides common Attributes and Methods for all Game Objects,
-    such as Position, Drawing Layer, Identifier, and the Drawing Surface.
-
-    Attributes:
-        __screen__ (pygame.Surface): The Surface on which the Object is drawn.
-        __xCoordinate__ (float): The X-Coordinate of the Object.
-        __yCoordinate__ (float): The Y-Coordinate of the Object.
-        __baseLayer__ (int): The Drawing Layer of the Object.
-        __identifier__ (str): A String Identifier for this Object.
-    """
-    __screen__ : pygame.Surface
-    __xCoordinate__: float
-    __yCoordinate__: float
-    __baseLayer__: int
-    __identifier__: str
-
-    def __init__(self, screen: pygame.Surface, xCoordinate: float = 0.0, yCoordinate: float = 0.0, baseLayer: int = 0, identifier: str = "") -> None:
-        """
-        Initialize a GameObject Instance.
-
-        Args:
-            screen (pygame.Surface): The Surface this Object will be drawn on.
-            xCoordinate (float): Initial X-Coordinate of the Object.
-            yCoordinate (float): Initial Y-Coordinate of the Object.
-            baseLayer (int): Drawing Layer of the Object.
-            identifier (str): Optional Identifier for the Object.
-        """
-        self.__xCoordinate__ = xCoordinate
-        self.__yCoordinate__ = yCoordinate
-        self.__screen__ = screen
-        self.__baseLayer__ = baseLayer
-        self.__identifier__ = identifier
-
-    def draw(self) -> None:
-        """
-        Draw this Object to the Screen.
-
-        To be overridden by Subclasses with specific Drawing Logic.
-        """
-        pass
-
-    def update(self) -> None:
-        """
-        Update the Object's State.
-
-        To be overridden by Subclasses to implement Game Logic.
-        """
-        pass
-
-    def getXCoordinate(self) -> float:
-        return self.__xCoordinate__
-
-    def setXCoordinate(self, xCoordinate: float) -> None:
-        self.__xCoordinate__ = xCoordinate
-
-    def getYCoordinate(self) -> float:
-        return self.__yCoordinate__
-
-    def setYCoordinate(self, yCoordinate: float) -> None:
-        self.__yCoordinate__ = yCoordinate
-
-    def getScreen(self) -> pygame.Surface:
-        return self.__screen__
-
-    def getBaseLayer(self) -> int:
-        return self.__baseLayer__
-
-    def getLayer(self) -> int:
-        """
-        Return the drawing BaseLayer. This function exists to have the function work with all GameObjects.
-        """
-        return self.getBaseLayer()
-
-    def setLayer(self, layer: int) -> None:
-        """
-        Set the Drawing Layer for this Object.
-
-        This Function is intended for Uniform Layer Handling across Objects.
-        """
-        self.setBaseLayer(layer)
-
-    def setBaseLayer(self, layer: int) -> None:
-        self.__baseLayer__ = layer
-
-    def getIdentifier(self) -> str:
-        return self.__identifier__
-
-    def setIdentifier(self, identifier: str) -> None:
-        self.__identifier__ = identifier
-
-    def __str__(self) -> str:
-        """
-        Return a detailed String Representation of this GameObject Instance.
-        """
-        return (
-            f"{type(self).__name__} (xCoordinate={self.getXCoordinate}, yCoordinate={self.getYCoordinate}, "
-            f"layer={self.getBaseLayer}, identifier='{self.getIdentifier}', screen=<{type(self.getScreen).__name__}>)"
-        )
+import pygame
+
+class GameObject:
+    """
+    A Class representing the Base Object for all Game Elements.
+
+    This Class provides common Attributes and Methods for all Game Objects,
+    such as Position, Drawing Layer, Identifier, and the Drawing Surface.
+
+    Attributes:
+        __screen__ (pygame.Surface): The Surface on which the Object is drawn.
+        __xCoordinate__ (float): The X-Coordinate of the Object.
+        __yCoordinate__ (float): The Y-Coordinate of the Object.
+        __baseLayer__ (int): The Drawing Layer of the Object.
+        __identifier__ (str): A String Identifier for this Object.
+        __renderList__ (RenderList): The RenderList containing this Object, notified on Layer and Identifier Changes.
+        __changeCount__ (int): Counter increased whenever the Game State of the Object changes (not its Position).
+    """
+    __slots__ = ("__screen__", "__xCoordinate__", "__yCoordinate__", "__baseLayer__", "__identifier__", "__renderList__", "__changeCount__")
+    __screen__ : pygame.Surface
+    __xCoordinate__: float
+    __yCoordinate__: float
+    __baseLayer__: int
+    __identifier__: str
+    __renderList__: 'RenderList'
+    __changeCount__: int
+
+    def __init__(self, screen: pygame.Surface, xCoordinate: float = 0.0, yCoordinate: float = 0.0, baseLayer: int = 0, identifier: str = "") -> None:
+        """
+        Initialize a GameObject Instance.
+
+        Args:
+            screen (pygame.Surface): The Surface this Object will be drawn on.
+            xCoordinate (float): Initial X-Coordinate of the Object.
+            yCoordinate (float): Initial Y-Coordinate of the Object.
+            baseLayer (int): Drawing Layer of the Object.
+            identifier (str): Optional Identifier for the Object.
+        """
+        self.__xCoordinate__ = xCoordinate
+        self.__yCoordinate__ = yCoordinate
+        self.__screen__ = screen
+        self.__baseLayer__ = baseLayer
+        self.__identifier__ = identifier
+        self.__renderList__ = None
+        self.__changeCount__ = 0
+
+    def draw(self) -> None:
+        """
+        Draw this Object to the Screen.
+
+        To be overridden by Subclasses with specific Drawing Logic.
+        """
+        pass
+
+    def update(self) -> None:
+        """
+        Update the Object's State.
+
+        To be overridden by Subclasses to implement Game Logic.
+        """
+        pass
+
+    def reset(self, difficulty: 'GameDifficulty') -> None:
+        """
+        Restore the State the Object had at the Start of a Round, in place, for a restarted Round.
+
+        To be overridden by Subclasses with Game State. Objects without any, e.g. Backgrounds, keep everything.
+
+        Args:
+            difficulty (GameDifficulty): Difficulty of the restarted Round, it may differ from the previous one.
+        """
+        pass
+
+    def storePreviousState(self) -> None:
+        """
+        Remember the current Position as the State of the previous Simulation Tick.
+
+        Called before every fixed Simulation Tick, so Frames rendered between two Ticks can
+        interpolate. To be overridden by Subclasses that are drawn at a Position.
+        """
+        pass
+
+    def setInterpolation(self, interpolation: float) -> None:
+        """
+        Set how far between the previous and the current Tick State the next Frame is drawn.
+
+        To be overridden by Subclasses that are drawn at a Position.
+
+        Args:
+            interpolation (float): 0 draws the previous Tick State, 1 the current one.
+        """
+        pass
+
+    def isStatic(self) -> bool:
+        """
+        Return whether this Object never moves, rotates or changes its Appearance on its own.
+
+        Static Objects are pre-composited into the World Layer instead of being drawn every Frame.
+        """
+        return False
+
+    def collectDrawables(self, drawables: list) -> None:
+        """
+        Append every Image this Object would draw, in Drawing Order, to the given List.
+
+        Used by Renderers that need to know what is drawn where before drawing it.
+        To be overridden by Subclasses that draw something.
+
+        Args:
+            drawables (list[ImageGameObject]): The List to append to.
+        """
+        pass
+
+    def getChangeCount(self) -> int:
+        """
+        Return the Change Counter of this Object.
+
+        The Counter increases whenever a Value shown outside the Object changes, e.g. Fuel, Speed,
+        Load or stored Resources. Movement alone does not increase it. Observers such as the HUD
+        compare it with the last seen Value to skip Work while nothing changed.
+        """
+        return self.__changeCount__
+
+    def __markChanged__(self) -> None:
+        self.__changeCount__ += 1
+
+    def getXCoordinate(self) -> float:
+        return self.__xCoordinate__
+
+    def setXCoordinate(self, xCoordinate: float) -> None:
+        self.__xCoordinate__ = xCoordinate
+
+    def getYCoordinate(self) -> float:
+        return self.__yCoordinate__
+
+    def setYCoordinate(self, yCoordinate: float) -> None:
+        self.__yCoordinate__ = yCoordinate
+
+    def getScreen(self) -> pygame.Surface:
+        return self.__screen__
+
+    def getBaseLayer(self) -> int:
+        return self.__baseLayer__
+
+    def getLayer(self) -> int:
+        """
+        Return the drawing BaseLayer. This function exists to have the function work with all GameObjects.
+        """
+        return self.getBaseLayer()
+
+    def setLayer(self, layer: int) -> None:
+        """
+        Set the Drawing Layer for this Object.
+
+        This Function is intended for Uniform Layer Handling across Objects.
+        """
+        self.setBaseLayer(layer)
+
+    def setBaseLayer(self, layer: int) -> None:
+        self.__baseLayer__ = layer
+        if self.__renderList__ is not None:
+            self.__renderList__.reposition(self)
+
+    def getRenderList(self) -> 'RenderList':
+        return self.__renderList__
+
+    def setRenderList(self, renderList: 'RenderList') -> None:
+        """
+        Set the RenderList this Object belongs to. An Object belongs to at most one RenderList.
+        """
+        self.__renderList__ = renderList
+
+    def getIdentifier(self) -> str:
+        return self.__identifier__
+
+    def setIdentifier(self, identifier: str) -> None:
+        previousIdentifier = self.__identifier__
+        self.__identifier__ = identifier
+        if self.__renderList__ is not None:
+            self.__renderList__.reindex(self, previousIdentifier)
+
+    def __str__(self) -> str:
+        """
+        Return a detailed String Representation of this GameObject Instance.
+        """
+        return (
+            f"{type(self).__name__} (xCoordinate={self.getXCoordinate}, yCoordinate={self.getYCoordinate}, "
+            f"layer={self.getBaseLayer}, identifier='{self.getIdentifier}', screen=<{type(self.getScreen).__name__}>)"
+        )
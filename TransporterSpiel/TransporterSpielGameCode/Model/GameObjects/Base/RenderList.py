@@ -0,0 +1,173 @@
+from bisect import bisect_left, bisect_right
+
+
+class RenderList:
+    """
+    A Class representing a List of Game Objects that is always ordered by Layer.
+
+    Objects are inserted at their Layer Position with a Binary Search, so iterating the List
+    yields the Drawing Order without sorting every Frame. Objects with the same Layer keep their
+    Insertion Order. An Object notifies the RenderList it belongs to when its Layer changes
+    (see GameObject.setBaseLayer and ImageGameObject.setLayer), which re-sorts only that Object.
+
+    Objects are additionally indexed by their Identifier, so looking up or removing an Object by
+    Identifier does not scan the List. Identifier Changes are reported by GameObject.setIdentifier.
+
+    Attributes:
+        __items__ (list[GameObject]): The Objects in Drawing Order.
+        __keys__ (list[tuple[int, int]]): Sort Key (Layer, Insertion Sequence) for each Item, parallel to __items__.
+        __keysByObject__ (dict[GameObject, tuple[int, int]]): Current Sort Key of every contained Object.
+        __objectsByIdentifier__ (dict[str, list[GameObject]]): Contained Objects grouped by Identifier.
+        __sequence__ (int): Counter used to keep the Insertion Order within a Layer.
+    """
+    __items__: list
+    __keys__: list[tuple[int, int]]
+    __keysByObject__: dict
+    __objectsByIdentifier__: dict[str, list]
+    __sequence__: int
+
+    def __init__(self, gameObjects=None):
+        """
+        Initialize a RenderList.
+
+        Args:
+            gameObjects (Iterable[GameObject]): Optional Objects to add in the given Order.
+        """
+        self.__items__ = []
+        self.__keys__ = []
+        self.__keysByObject__ = {}
+        self.__objectsByIdentifier__ = {}
+        self.__sequence__ = 0
+        if gameObjects is not None:
+            for gameObject in gameObjects:
+                self.add(gameObject)
+
+    def add(self, gameObject) -> None:
+        """
+        Insert a Game Object behind all Objects with a lower or equal Layer.
+
+        Args:
+            gameObject (GameObject): The Object to add.
+        """
+        if gameObject in self.__keysByObject__:
+            return
+        self.__insertEntry__(gameObject)
+        self.__objectsByIdentifier__.setdefault(gameObject.getIdentifier(), []).append(gameObject)
+        gameObject.setRenderList(self)
+
+    def remove(self, gameObject) -> None:
+        """
+        Remove a Game Object from the List.
+
+        Args:
+            gameObject (GameObject): The Object to remove.
+
+        Raises:
+            ValueError: If the Object is not contained.
+        """
+        if gameObject not in self.__keysByObject__:
+            raise ValueError(f"{type(gameObject).__name__} is not in the RenderList")
+        self.__removeEntry__(gameObject)
+        self.__unindex__(gameObject, gameObject.getIdentifier())
+        if gameObject.getRenderList() is self:
+            gameObject.setRenderList(None)
+
+    def removeById(self, identifier: str) -> None:
+        """
+        Remove all Game Objects with the given Identifier.
+
+        Args:
+            identifier (str): The Identifier of the Objects to remove.
+        """
+        for gameObject in self.__objectsByIdentifier__.get(identifier, ())[:]:
+            self.remove(gameObject)
+
+    def getById(self, identifier: str):
+        """
+        Retrieve the first Game Object in Drawing Order with the given Identifier.
+
+        Args:
+            identifier (str): The Identifier of the Object.
+
+        Returns:
+            GameObject: The found Object or None if not found.
+        """
+        gameObjects = self.__objectsByIdentifier__.get(identifier)
+        if not gameObjects:
+            return None
+        if len(gameObjects) == 1:
+            return gameObjects[0]
+        return min(gameObjects, key=self.__keysByObject__.__getitem__)
+
+    def reindex(self, gameObject, previousIdentifier: str) -> None:
+        """
+        Move a contained Game Object to the Index Entry of its current Identifier.
+
+        Args:
+            gameObject (GameObject): The Object whose Identifier changed.
+            previousIdentifier (str): The Identifier the Object was indexed under.
+        """
+        if gameObject not in self.__keysByObject__:
+            return
+        self.__unindex__(gameObject, previousIdentifier)
+        self.__objectsByIdentifier__.setdefault(gameObject.getIdentifier(), []).append(gameObject)
+
+    def reposition(self, gameObject) -> None:
+        """
+        Move a contained Game Object to the Position matching its current Layer.
+
+        Args:
+            gameObject (GameObject): The Object whose Layer changed.
+        """
+        key = self.__keysByObject__.get(gameObject)
+        if key is None or key[0] == gameObject.getLayer():
+            return
+        self.__removeEntry__(gameObject)
+        self.__insertEntry__(gameObject)
+
+    def clear(self) -> None:
+        """
+        Remove all Game Objects from the List.
+        """
+        for gameObject in self.__items__:
+            if gameObject.getRenderList() is self:
+                gameObject.setRenderList(None)
+        self.__items__ = []
+        self.__keys__ = []
+        self.__keysByObject__ = {}
+        self.__objectsByIdentifier__ = {}
+
+    def __unindex__(self, gameObject, identifier: str) -> None:
+        gameObjects = self.__objectsByIdentifier__[identifier]
+        gameObjects.remove(gameObject)
+        if not gameObjects:
+            del self.__objectsByIdentifier__[identifier]
+
+    def __insertEntry__(self, gameObject) -> None:
+        key = (gameObject.getLayer(), self.__sequence__)
+        self.__sequence__ += 1
+        index = bisect_right(self.__keys__, key)
+        self.__keys__.insert(index, key)
+        self.__items__.insert(index, gameObject)
+        self.__keysByObject__[gameObject] = key
+
+    def __removeEntry__(self, gameObject) -> None:
+        key = self.__keysByObject__.pop(gameObject)
+        index = bisect_left(self.__keys__, key)
+        del self.__keys__[index]
+        del self.__items__[index]
+
+    def __iter__(self):
+        return iter(self.__items__)
+
+    def __len__(self) -> int:
+        return len(self.__items__)
+
+    def __contains__(self, gameObject) -> bool:
+        return gameObject in self.__keysByObject__
+
+    def __getitem__(self, index):
+        return self.__items__[index]
+
+    def __str__(self) -> str:
+        return f"{type(self).__name__} ({[type(item).__name__ for item in self.__items__]})"
\ No newline at end of file
@@ -0,0 +1,218 @@
+import math
+
+
+class SpatialHashGrid:
+    """
+    A Class representing a uniform Grid that buckets Objects by the Cells their Collision Circle touches.
+
+    Collision Queries only test the Objects sharing a Cell with the queried Circle, instead of every
+    Object, and compare squared Distances with the squared Sum of the Radii, the same Test as
+    ImageGameObject.areColliding without a Square Root. Layers and Collision Flags are not considered,
+    like areColliding with ignoreLayer and ignoreCollision.
+
+    Moving Objects are re-bucketed by refresh(), which only touches the Cells of Objects whose
+    covered Cell Range changed. Static Objects (see GameObject.isStatic) are bucketed once.
+    An Object touching several Cells is reported only once, by the first Cell it shares with the
+    Query (the Cell at the larger Minimum of both Cell Ranges), so no Deduplication Set is needed.
+
+    Attributes:
+        __cellSize__ (float): Edge Length of a Cell in Pixels.
+        __cells__ (dict[tuple[int, int], list[ImageGameObject]]): The Objects touching each occupied Cell.
+        __cellRanges__ (dict[ImageGameObject, tuple[int, int, int, int]]): Covered Cells of every Object as (minX, minY, maxX, maxY).
+        __movingObjects__ (list[ImageGameObject]): The non-static Objects, checked by refresh().
+    """
+    __cellSize__: float
+    __cells__: dict[tuple[int, int], list]
+    __cellRanges__: dict
+    __movingObjects__: list
+
+    def __init__(self, cellSize: float = 128, gameObjects=None):
+        """
+        Initialize a SpatialHashGrid.
+
+        Args:
+            cellSize (float): Edge Length of a Cell in Pixels, ideally about the Diameter of a typical Object.
+            gameObjects (Iterable[ImageGameObject]): Optional Objects to add.
+        """
+        self.__cellSize__ = cellSize
+        self.__cells__ = {}
+        self.__cellRanges__ = {}
+        self.__movingObjects__ = []
+        if gameObjects is not None:
+            for gameObject in gameObjects:
+                self.add(gameObject)
+
+    def add(self, gameObject) -> None:
+        """
+        Add an Object at its current Position. Adding a contained Object again has no Effect.
+
+        Args:
+            gameObject (ImageGameObject): The Object to add.
+        """
+        if gameObject in self.__cellRanges__:
+            return
+        cellRange = self.__getCellRange__(gameObject)
+        self.__cellRanges__[gameObject] = cellRange
+        self.__insertIntoCells__(gameObject, cellRange)
+        if not gameObject.isStatic():
+            self.__movingObjects__.append(gameObject)
+
+    def remove(self, gameObject) -> None:
+        """
+        Remove an Object from the Grid.
+
+        Args:
+            gameObject (ImageGameObject): The Object to remove.
+
+        Raises:
+            ValueError: If the Object is not contained.
+        """
+        cellRange = self.__cellRanges__.pop(gameObject, None)
+        if cellRange is None:
+            raise ValueError(f"{type(gameObject).__name__} is not in the SpatialHashGrid")
+        self.__removeFromCells__(gameObject, cellRange)
+        if not gameObject.isStatic():
+            self.__movingObjects__.remove(gameObject)
+
+    def refresh(self, gameObject=None) -> None:
+        """
+        Re-bucket moved Objects whose covered Cells changed.
+
+        Args:
+            gameObject (ImageGameObject): The Object that moved, or None to check all non-static Objects.
+        """
+        gameObjects = self.__movingObjects__ if gameObject is None else (gameObject,)
+        for movedObject in gameObjects:
+            cellRange = self.__getCellRange__(movedObject)
+            previousCellRange = self.__cellRanges__[movedObject]
+            if cellRange != previousCellRange:
+                self.__removeFromCells__(movedObject, previousCellRange)
+                self.__insertIntoCells__(movedObject, cellRange)
+                self.__cellRanges__[movedObject] = cellRange
+
+    def queryCircle(self, xCoordinate: float, yCoordinate: float, radius: float, exclude=None) -> list:
+        """
+        Find all Objects whose Collision Circle overlaps the given Circle.
+
+        Args:
+            xCoordinate (float): X-Coordinate of the Circle Center.
+            yCoordinate (float): Y-Coordinate of the Circle Center.
+            radius (float): Radius of the Circle.
+            exclude (ImageGameObject): An Object not to report, e.g. the queried Object itself.
+
+        Returns:
+            list[ImageGameObject]: The overlapping Objects, each reported once.
+        """
+        cellSize = self.__cellSize__
+        queryMinX = math.floor((xCoordinate - radius) / cellSize)
+        queryMinY = math.floor((yCoordinate - radius) / cellSize)
+        queryMaxX = math.floor((xCoordinate + radius) / cellSize)
+        queryMaxY = math.floor((yCoordinate + radius) / cellSize)
+        cellRanges = self.__cellRanges__
+        overlapping: list = []
+        for cellX in range(queryMinX, queryMaxX + 1):
+            for cellY in range(queryMinY, queryMaxY + 1):
+                for candidate in self.__cells__.get((cellX, cellY), ()):
+                    if candidate is exclude:
+                        continue
+                    minX, minY, _, _ = cellRanges[candidate]
+                    # Only the first shared Cell reports the Candidate
+                    if cellX != max(minX, queryMinX) or cellY != max(minY, queryMinY):
+                        continue
+                    dx = candidate.getXCoordinate() - xCoordinate
+                    dy = candidate.getYCoordinate() - yCoordinate
+                    reach = candidate.getCollisionRadius() + radius
+                    if dx * dx + dy * dy <= reach * reach:
+                        overlapping.append(candidate)
+        return overlapping
+
+    def queryOverlapping(self, gameObject) -> list:
+        """
+        Find all other Objects colliding with the given Object, as areColliding(ignoreLayer=True) would.
+
+        Args:
+            gameObject (ImageGameObject): The queried Object, it does not need to be contained.
+
+        Returns:
+            list[ImageGameObject]: The colliding Objects without the queried Object.
+        """
+        return self.queryCircle(
+            gameObject.getXCoordinate(),
+            gameObject.getYCoordinate(),
+            gameObject.getCollisionRadius(),
+            exclude=gameObject
+        )
+
+    def queryPairs(self) -> list[tuple]:
+        """
+        Find all colliding Pairs of contained Objects.
+
+        Returns:
+            list[tuple[ImageGameObject, ImageGameObject]]: Every colliding Pair once, in no particular Order.
+        """
+        cellRanges = self.__cellRanges__
+        pairs: list[tuple] = []
+        for (cellX, cellY), cellObjects in self.__cells__.items():
+            for index, first in enumerate(cellObjects):
+                firstMinX, firstMinY, _, _ = cellRanges[first]
+                firstX = first.getXCoordinate()
+                firstY = first.getYCoordinate()
+                firstRadius = first.getCollisionRadius()
+                for second in cellObjects[index + 1:]:
+                    secondMinX, secondMinY, _, _ = cellRanges[second]
+                    # Only the first Cell both Objects touch reports the Pair
+                    if cellX != max(firstMinX, secondMinX) or cellY != max(firstMinY, secondMinY):
+                        continue
+                    dx = second.getXCoordinate() - firstX
+                    dy = second.getYCoordinate() - firstY
+                    reach = second.getCollisionRadius() + firstRadius
+                    if dx * dx + dy * dy <= reach * reach:
+                        pairs.append((first, second))
+        return pairs
+
+    def clear(self) -> None:
+        self.__cells__ = {}
+        self.__cellRanges__ = {}
+        self.__movingObjects__ = []
+
+    def getCellSize(self) -> float:
+        return self.__cellSize__
+
+    def __getCellRange__(self, gameObject) -> tuple[int, int, int, int]:
+        """
+        Return the Cells covered by the Bounding Square of the Collision Circle as (minX, minY, maxX, maxY).
+        """
+        cellSize = self.__cellSize__
+        xCoordinate = gameObject.getXCoordinate()
+        yCoordinate = gameObject.getYCoordinate()
+        radius = gameObject.getCollisionRadius()
+        return (
+            math.floor((xCoordinate - radius) / cellSize),
+            math.floor((yCoordinate - radius) / cellSize),
+            math.floor((xCoordinate + radius) / cellSize),
+            math.floor((yCoordinate + radius) / cellSize)
+        )
+
+    def __insertIntoCells__(self, gameObject, cellRange: tuple[int, int, int, int]) -> None:
+        minX, minY, maxX, maxY = cellRange
+        for cellX in range(minX, maxX + 1):
+            for cellY in range(minY, maxY + 1):
+                self.__cells__.setdefault((cellX, cellY), []).append(gameObject)
+
+    def __removeFromCells__(self, gameObject, cellRange: tuple[int, int, int, int]) -> None:
+        minX, minY, maxX, maxY = cellRange
+        for cellX in range(minX, maxX + 1):
+            for cellY in range(minY, maxY + 1):
+                cellObjects = self.__cells__[(cellX, cellY)]
+                cellObjects.remove(gameObject)
+                if not cellObjects:
+                    del self.__cells__[(cellX, cellY)]
+
+    def __contains__(self, gameObject) -> bool:
+        return gameObject in self.__cellRanges__
+
+    def __len__(self) -> int:
+        return len(self.__cellRanges__)
+
+    def __str__(self) -> str:
+        return f"{type(self).__name__} (objects={len(self.__cellRanges__)}, occupiedCells={len(self.__cells__)}, cellSize={self.__cellSize__})"
\ No newline at end of file
@@ -0,0 +1,292 @@
+NUMBER = (int, float)
+COLOR = "color"
+MAPPING = "mapping"
+REQUIRED = "required"
+
+
+class ConfigField:
+    """
+    A Class describing a typed Value of a Configuration Section.
+
+    Attributes:
+        __types__ (tuple): Accepted Types, or COLOR for an RGB List and MAPPING for a Dictionary of Numbers.
+        __default__ (object): Value used if the Key is missing, REQUIRED if the Key must be given.
+        __choices__ (tuple): Allowed Values, None if any Value of the Types is allowed.
+        __positive__ (bool): Whether Numbers, or all Numbers of a Mapping, must be greater than 0.
+    """
+    __types__: tuple
+    __default__: object
+    __choices__: tuple
+    __positive__: bool
+
+    def __init__(self, types, default=REQUIRED, choices: tuple = None, positive: bool = False):
+        """
+        Initialize a ConfigField.
+
+        Args:
+            types (type | tuple | str): Accepted Type or Types, COLOR or MAPPING. float also accepts int Values and converts them.
+            default (object): Value used if the Key is missing, REQUIRED if the Key must be given.
+            choices (tuple): Allowed Values, None if any Value of the Types is allowed.
+            positive (bool): Whether Numbers must be greater than 0, e.g. Rates and Sizes the Game divides by.
+        """
+        self.__types__ = types if isinstance(types, tuple) else (types,)
+        self.__default__ = default
+        self.__choices__ = choices
+        self.__positive__ = positive
+
+    def compile(self, value, path: str):
+        """
+        Validate a Value and convert it to its compiled Form, e.g. a Color List to a Tuple.
+
+        Args:
+            value (object): The Value from the Configuration File.
+            path (str): Path of the Key for Error Messages, e.g. "simulationConfig.tickRate".
+
+        Returns:
+            object: The validated Value.
+
+        Raises:
+            ValueError: If the Value has the wrong Type, is not one of the Choices or not positive.
+        """
+        if COLOR in self.__types__:
+            if not (isinstance(value, list) and len(value) in (3, 4) and all(type(channel) is int and 0 <= channel <= 255 for channel in value)):
+                raise ValueError(f"{path} must be a List of 3 or 4 Color Channels from 0 to 255, not {value!r}")
+            return tuple(value)
+        if MAPPING in self.__types__:
+            if not (isinstance(value, dict) and all(type(entry) in NUMBER for entry in value.values())):
+                raise ValueError(f"{path} must map Names to Numbers, not {value!r}")
+            if self.__positive__:
+                for name, entry in value.items():
+                    if entry <= 0:
+                        raise ValueError(f"{path}.{name} must be greater than 0, not {entry!r}")
+            return dict(value)
+        # bool is a Subclass of int, but no Number in the Configuration
+        if type(value) is int and float in self.__types__ and int not in self.__types__:
+            value = float(value)
+        if type(value) not in self.__types__:
+            typeNames = " or ".join("null" if valueType is type(None) else valueType.__name__ for valueType in self.__types__)
+            raise ValueError(f"{path} must be {typeNames}, not {value!r}")
+        if self.__choices__ is not None and value not in self.__choices__:
+            raise ValueError(f"{path} must be one of {', '.join(map(repr, self.__choices__))}, not {value!r}")
+        if self.__positive__ and value is not None and value <= 0:
+            raise ValueError(f"{path} must be greater than 0, not {value!r}")
+        return value
+
+    def getDefault(self):
+        return self.__default__
+
+    def isRequired(self) -> bool:
+        return self.__default__ is REQUIRED
+
+    def __repr__(self) -> str:
+        typeNames = ", ".join(valueType if isinstance(valueType, str) else valueType.__name__ for valueType in self.__types__)
+        return f"{type(self).__name__}(({typeNames}), {self.__default__!r}, {self.__choices__!r}, positive={self.__positive__!r})"
+
+
+class ConfigSectionSchema:
+    """
+    A Class describing a Section of the Configuration, compiled into a frozen Class with one Getter per Key.
+
+    Attributes:
+        __className__ (str): Name of the compiled Section Class, e.g. "SideHudConfig".
+        __fields__ (dict[str, ConfigField | ConfigSectionSchema]): The Values and nested Sections by Key.
+        __derivedKeys__ (tuple[str, ...]): Keys computed from the other Values while compiling, see derive.
+    """
+    __className__: str
+    __fields__: dict
+    __derivedKeys__: tuple[str, ...]
+
+    def __init__(self, className: str, fields: dict, derivedKeys: tuple[str, ...] = ()):
+        self.__className__ = className
+        self.__fields__ = fields
+        self.__derivedKeys__ = derivedKeys
+
+    def compile(self, values: dict, path: str) -> dict:
+        """
+        Validate a Section, fill in the Defaults and compute the derived Values.
+
+        Args:
+            values (dict): The Section from the Configuration File.
+            path (str): Path of the Section for Error Messages.
+
+        Returns:
+            dict: The compiled Section, nested Sections as nested Dictionaries.
+
+        Raises:
+            ValueError: If a Key is unknown or missing, or a Value is invalid.
+        """
+        if not isinstance(values, dict):
+            raise ValueError(f"{path} must be a Section, not {values!r}")
+        unknownKeys = sorted(set(values) - set(self.__fields__))
+        if unknownKeys:
+            raise ValueError(f"Unknown Key {path}.{unknownKeys[0]}" if path else f"Unknown Key {unknownKeys[0]}")
+        compiled = {}
+        for key, field in self.__fields__.items():
+            keyPath = f"{path}.{key}" if path else key
+            if isinstance(field, ConfigSectionSchema):
+                compiled[key] = field.compile(values.get(key, {}), keyPath)
+            elif key in values:
+                compiled[key] = field.compile(values[key], keyPath)
+            elif field.isRequired():
+                raise ValueError(f"Missing Key {keyPath}")
+            else:
+                compiled[key] = field.getDefault()
+        compiled.update(self.derive(compiled))
+        return compiled
+
+    def derive(self, compiled: dict) -> dict:
+        """
+        Compute the derived Values of a compiled Section, none by Default.
+        """
+        return {}
+
+    def getClassName(self) -> str:
+        return self.__className__
+
+    def getFields(self) -> dict:
+        return self.__fields__
+
+    def getKeys(self) -> tuple[str, ...]:
+        return tuple(self.__fields__) + self.__derivedKeys__
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.__className__!r}, {self.__fields__!r}, {self.__derivedKeys__!r})"
+
+
+class ScreenConfigSchema(ConfigSectionSchema):
+    """
+    The Schema of a Screen Profile, which derives the Size of the Game Area beside the Side HUD.
+    """
+
+    def __init__(self, fields: dict):
+        super().__init__("ScreenConfig", fields, derivedKeys=("gameWidth", "gameHeight"))
+
+    def derive(self, compiled: dict) -> dict:
+        return {
+            "gameWidth": compiled["screenWidth"] - compiled["hudConfig"]["sideHudConfig"]["width"],
+            "gameHeight": compiled["screenHeight"],
+        }
+
+
+def createScreenSchema() -> ScreenConfigSchema:
+    """
+    Create the Schema shared by the small and the big Screen Profile.
+    """
+    return ScreenConfigSchema({
+        "screenWidth": ConfigField(int),
+        "screenHeight": ConfigField(int),
+        "fontConfig": ConfigSectionSchema("FontConfig", {
+            "mainMenuBigFont": ConfigField(int),
+            "mainMenuSmallFont": ConfigField(int),
+            "topHudFont": ConfigField(int),
+        }),
+        "hudConfig": ConfigSectionSchema("HudConfig", {
+            "sideHudConfig": ConfigSectionSchema("SideHudConfig", {
+                "progressBarConfig": ConfigSectionSchema("ProgressBarConfig", {
+                    "width": ConfigField(int),
+                    "height": ConfigField(int),
+                }),
+                "width": ConfigField(int),
+                "bigFont": ConfigField(int),
+                "smallFont": ConfigField(int),
+                "yOffset": ConfigField(int),
+                "smallTextSeparation": ConfigField(int),
+                "bigTextSeparation": ConfigField(int),
+            }),
+            "topHudConfig": ConfigSectionSchema("TopHudConfig", {
+                "yCoordinate": ConfigField(int),
+                "fuelBarConfig": ConfigSectionSchema("FuelBarConfig", {
+                    "fontSize": ConfigField(int),
+                    "width": ConfigField(int),
+                    "height": ConfigField(int),
+                }),
+                "loadBarConfig": ConfigSectionSchema("LoadBarConfig", {
+                    "fontSize": ConfigField(int),
+                    "width": ConfigField(int),
+                    "height": ConfigField(int),
+                }),
+                "oreTransportStatusConfig": ConfigSectionSchema("OreTransportStatusConfig", {
+                    "fontSize": ConfigField(int),
+                }),
+            }),
+            "difficultySelectionConfig": ConfigSectionSchema("DifficultySelectionConfig", {
+                "bigFont": ConfigField(int),
+                "smallFont": ConfigField(int),
+            }),
+        }),
+    })
+
+
+# Schema of config.json, the Defaults are the ones the Game used before the Keys were configurable
+CONFIG_SCHEMA = ConfigSectionSchema("GameConfigSections", {
+    "fps": ConfigField(int, 60, positive=True),
+    "difficultySelection": ConfigField(bool, True),
+    "renderConfig": ConfigSectionSchema("RenderConfig", {
+        "rotationCacheAngleStep": ConfigField(float, 1.0, positive=True),
+        "rotationCacheMaxBytes": ConfigField(int, 64 * 1024 * 1024),
+        "rotationCachePrewarm": ConfigField(bool, False),
+        "renderMode": ConfigField(str, "full", choices=("full", "dirty")),
+        "dirtyAreaThreshold": ConfigField(float, 0.5),
+        "assetPack": ConfigField(str, "Assets/assets.pack"),
+    }),
+    "simulationConfig": ConfigSectionSchema("SimulationConfig", {
+        "tickRate": ConfigField(int, 60, positive=True),
+        "maxTicksPerFrame": ConfigField(int, 5, positive=True),
+        "renderInterpolation": ConfigField(bool, True),
+        "vehiclePhysicsBackend": ConfigField(str, "python", choices=("python", "numpy")),
+        "collisionCellSize": ConfigField(NUMBER, 128, positive=True),
+        "aiDecisionRate": ConfigField(NUMBER, 20, positive=True),
+        "triggerStayRates": ConfigField(MAPPING, {}, positive=True),
+        "headlessRounds": ConfigField(int, 1),
+        "headlessMaxTicks": ConfigField(int, 36000),
+        "seed": ConfigField((int, type(None)), None),
+    }),
+    "profilerConfig": ConfigSectionSchema("ProfilerConfig", {
+        "enabled": ConfigField(bool, True),
+        "frames": ConfigField(int, 600, positive=True),
+        "overlayRefreshFrames": ConfigField(int, 15, positive=True),
+        "csvExportPath": ConfigField((str, type(None)), None),
+    }),
+    "errorMessageConfig": ConfigSectionSchema("ErrorMessageConfig", {
+        "errorTextSize": ConfigField(int),
+        "footerMessage": ConfigField(str),
+        "footerFontSize": ConfigField(int),
+        "footerFontColor": ConfigField(COLOR),
+        "messageFontColor": ConfigField(COLOR),
+    }),
+    "finalMessageConfig": ConfigSectionSchema("FinalMessageConfig", {
+        "errorTextSize": ConfigField(int),
+        "footerMessage": ConfigField(str),
+        "footerFontSize": ConfigField(int),
+        "footerFontColor": ConfigField(COLOR),
+        "messageFontColorWin": ConfigField(COLOR),
+        "messageFontColorLoose": ConfigField(COLOR),
+    }),
+    "gameConfig": ConfigSectionSchema("GameplayConfig", {
+        "difficultyConfig": ConfigSectionSchema("DifficultyConfig", {
+            "totalOre": ConfigField(NUMBER),
+            "percentageToCollect": ConfigField(NUMBER),
+            "transporterCapacity": ConfigField(NUMBER),
+            "fuelConsumption": ConfigField(NUMBER),
+            "helicopterMaxSpeed": ConfigField(NUMBER),
+            "transporterMaxSpeed": ConfigField(NUMBER),
+        }),
+        "helicopterConfig": ConfigSectionSchema("HelicopterConfig", {
+            "helicopterRandomDeviation": ConfigField(NUMBER),
+            "helicopterEscapeY": ConfigField(NUMBER),
+            "oreCapacity": ConfigField(NUMBER),
+        }),
+        "oreTransportConfig": ConfigSectionSchema("OreTransportConfig", {
+            "turningSpeed": ConfigField(NUMBER),
+            "acceleration": ConfigField(NUMBER),
+        }),
+        "oreMineConfig": ConfigSectionSchema("OreMineConfig", {
+            "transferRate": ConfigField(NUMBER),
+        }),
+        "gasStationConfig": ConfigSectionSchema("GasStationConfig", {
+            "transferRate": ConfigField(NUMBER),
+        }),
+    }),
+    "smallScreenConfig": createScreenSchema(),
+    "bigScreenConfig": createScreenSchema(),
+})
\ No newline at end of file
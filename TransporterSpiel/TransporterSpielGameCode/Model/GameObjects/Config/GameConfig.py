@@ -0,0 +1,217 @@
+import hashlib
+import json
+import marshal
+import os
+from types import MappingProxyType
+
+from Model.GameObjects.Config.ConfigSchema import CONFIG_SCHEMA, ConfigSectionSchema
+
+# Changes of the Schema invalidate compiled Configurations, as their Digest covers it
+SCHEMA_DIGEST = hashlib.sha256(repr(CONFIG_SCHEMA).encode("utf-8")).digest()
+COMPILED_CONFIG_SUFFIX = ".compiled"
+
+
+def getGetterName(key: str) -> str:
+    return f"get{key[0].upper()}{key[1:]}"
+
+
+class ConfigSection:
+    """
+    Base Class of the frozen Configuration Sections generated from the ConfigSchema by createSectionClass.
+
+    Every Key of a Section is a Slot with a Getter, e.g. getScreenWidth for screenWidth. The Getters
+    are generated once per Section Class as plain Methods, so reading a Value costs the same as a
+    hand-written Getter. Nested Sections are Instances of their own Section Class, Mappings like
+    triggerStayRates are read-only. Assigning or deleting Attributes after Loading raises an
+    AttributeError.
+
+    Attributes:
+        __keys__ (tuple[str, ...]): The Keys of the Section, including derived ones.
+        __sectionClasses__ (dict[str, type]): Section Class of every nested Section by Key.
+    """
+    __slots__ = ()
+    __keys__: tuple[str, ...] = ()
+    __sectionClasses__: dict[str, type] = {}
+
+    def __init__(self, values: dict):
+        """
+        Initialize a ConfigSection from its compiled Values.
+
+        Args:
+            values (dict): The compiled Section, see ConfigSectionSchema.compile.
+        """
+        for key in self.__keys__:
+            value = values[key]
+            sectionClass = self.__sectionClasses__.get(key)
+            if sectionClass is not None:
+                value = sectionClass(value)
+            elif isinstance(value, dict):
+                value = MappingProxyType(value)
+            object.__setattr__(self, key, value)
+
+    def get(self, key: str, default=None):
+        """
+        Retrieve a Value by Key, the Default if the Section has no such Key.
+        """
+        return getattr(self, key, default)
+
+    def toDictionary(self) -> dict:
+        """
+        Return the Values as Dictionary, nested Sections as nested Dictionaries.
+        """
+        return {
+            key: value.toDictionary() if isinstance(value, ConfigSection) else dict(value) if isinstance(value, MappingProxyType) else value
+            for key, value in ((key, getattr(self, key)) for key in self.__keys__)
+        }
+
+    def __setattr__(self, key: str, value) -> None:
+        raise AttributeError(f"{type(self).__name__} is frozen, change {key} in the Configuration File instead")
+
+    def __delattr__(self, key: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is frozen")
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.toDictionary()}>"
+
+
+def createSectionClass(schema: ConfigSectionSchema) -> type:
+    """
+    Generate the frozen Section Class of a Schema Section and its nested Sections.
+
+    Args:
+        schema (ConfigSectionSchema): The Schema of the Section.
+
+    Returns:
+        type: The Section Class with one Slot and one Getter per Key.
+    """
+    keys = schema.getKeys()
+    namespace = {
+        "__slots__": keys,
+        "__keys__": keys,
+        "__sectionClasses__": {
+            key: createSectionClass(field)
+            for key, field in schema.getFields().items()
+            if isinstance(field, ConfigSectionSchema)
+        },
+        "__module__": __name__,
+    }
+    exec("".join(f"def {getGetterName(key)}(self):\n    return self.{key}\n" for key in keys), {}, namespace)
+    return type(schema.getClassName(), (ConfigSection,), namespace)
+
+
+class GameConfig(createSectionClass(CONFIG_SCHEMA)):
+    """
+    The validated and frozen Game Configuration with the Screen Profile selected at Loading.
+
+    Besides the Getters of the Sections of config.json, e.g. getSimulationConfig, it provides the
+    selected Screen Profile, whose getGameWidth and getGameHeight are computed once while compiling.
+
+    Attributes:
+        __screenConfig__ (ConfigSection): The selected Screen Profile.
+        __smallScreen__ (bool): Whether the small Screen Profile is selected.
+    """
+    __slots__ = ("__screenConfig__", "__smallScreen__")
+    __screenConfig__: ConfigSection
+    __smallScreen__: bool
+
+    def __init__(self, values: dict, useSmallScreen: bool = False):
+        """
+        Initialize a GameConfig.
+
+        Args:
+            values (dict): The compiled Configuration, see compileConfig.
+            useSmallScreen (bool): Whether to select the small Screen Profile.
+        """
+        super().__init__(values)
+        object.__setattr__(self, "__smallScreen__", useSmallScreen)
+        object.__setattr__(self, "__screenConfig__", self.smallScreenConfig if useSmallScreen else self.bigScreenConfig)
+
+    def getFPS(self) -> int:
+        return self.fps
+
+    def getScreenConfig(self) -> ConfigSection:
+        return self.__screenConfig__
+
+    def isSmallScreen(self) -> bool:
+        return self.__smallScreen__
+
+    def __repr__(self) -> str:
+        mode = "SmallScreenConfig" if self.__smallScreen__ else "BigScreenConfig"
+        return f"<GameConfig {mode}: FPS={self.fps}, DifficultySelection={self.difficultySelection}>"
+
+
+def compileConfig(source: bytes, path: str) -> dict:
+    """
+    Parse and validate a Configuration File, fill in the Defaults and compute the derived Values.
+
+    Raises:
+        ValueError: If the File is no valid JSON or does not match the Schema.
+    """
+    try:
+        values = json.loads(source)
+    except json.JSONDecodeError as error:
+        raise ValueError(f"{path} is no valid JSON: {error}") from error
+    try:
+        return CONFIG_SCHEMA.compile(values, "")
+    except ValueError as error:
+        raise ValueError(f"Invalid Configuration {path}: {error}") from error
+
+
+def getCompiledConfigPath(path: str) -> str:
+    directory, fileName = os.path.split(os.path.abspath(path))
+    return os.path.join(directory, "__pycache__", fileName + COMPILED_CONFIG_SUFFIX)
+
+
+def loadCompiledConfig(path: str) -> dict:
+    """
+    Return the compiled Configuration of a File, reusing the one cached in __pycache__ if neither the File nor the Schema changed.
+
+    Args:
+        path (str): Path of the Configuration File.
+
+    Returns:
+        dict: The compiled Configuration.
+
+    Raises:
+        ValueError: If the File does not match the Schema.
+    """
+    with open(path, "rb") as file:
+        source = file.read()
+    digest = hashlib.sha256(SCHEMA_DIGEST + source).digest()
+    compiledPath = getCompiledConfigPath(path)
+    try:
+        with open(compiledPath, "rb") as file:
+            cachedDigest, compiled = marshal.load(file)
+        if cachedDigest == digest:
+            return compiled
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    compiled = compileConfig(source, path)
+    try:
+        os.makedirs(os.path.dirname(compiledPath), exist_ok=True)
+        temporaryPath = f"{compiledPath}.{os.getpid()}"
+        with open(temporaryPath, "wb") as file:
+            marshal.dump((digest, compiled), file)
+        os.replace(temporaryPath, compiledPath)
+    except OSError:
+        # A read-only Game Directory only costs compiling at every Start
+        pass
+    return compiled
+
+
+def loadConfigFromFile(path: str = "config.json", useSmallScreen: bool = False) -> GameConfig:
+    """
+    Load, validate and freeze a Configuration File.
+
+    Args:
+        path (str): Path of the Configuration File.
+        useSmallScreen (bool): Whether to select the small Screen Profile.
+
+    Returns:
+        GameConfig: The frozen Configuration.
+
+    Raises:
+        ValueError: If the File does not match the Schema.
+    """
+    return GameConfig(loadCompiledConfig(path), useSmallScreen)
\ No newline at end of file
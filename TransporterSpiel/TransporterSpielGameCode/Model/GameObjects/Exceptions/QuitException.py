@@ -1,2 +1,2 @@
-class QuitException(Exception):
+class QuitException(Exception):
     pass
\ No newline at end of file
@@ -0,0 +1,86 @@
+from Model.GameObjects.Game.SimulationClock import SimulationClock
+
+
+class AiScheduler:
+    """
+    A Class running the Decisions of AI Agents at a lower Rate than the Simulation Ticks.
+
+    Every registered Agent has a think Method for its Decision Logic, e.g. Target Selection and
+    Steering Intent, while its update Method only integrates the last Intent every Tick. The Agents
+    decide every decisionInterval Ticks, staggered by their Registration Order, so with many Agents
+    only a Fraction of them plans in any single Tick. The Schedule is based on the Simulation Clock,
+    so it pauses with the Round and is identical in a Replay.
+
+    Attributes:
+        __simulationClock__ (SimulationClock): Clock of the Round the Schedule is based on.
+        __decisionInterval__ (int): Number of Ticks between two Decisions of an Agent.
+        __agents__ (list): The registered Agents with a think Method.
+        __offsets__ (list[int]): Tick Offset of every Agent within the Decision Interval.
+        __decisionCount__ (int): Number of Decisions made so far.
+    """
+    __simulationClock__: SimulationClock
+    __decisionInterval__: int
+    __agents__: list
+    __offsets__: list[int]
+    __decisionCount__: int
+
+    def __init__(self, simulationClock: SimulationClock, decisionRate: float = 20):
+        """
+        Initialize an AiScheduler without Agents.
+
+        Args:
+            simulationClock (SimulationClock): Clock of the Round the Schedule is based on.
+            decisionRate (float): Decisions per Second of every Agent. Rates at or above the Tick Rate of
+                the Clock let the Agents decide every Tick.
+        """
+        self.__simulationClock__ = simulationClock
+        self.__decisionInterval__ = max(1, round(simulationClock.getTickRate() / decisionRate))
+        self.__agents__ = []
+        self.__offsets__ = []
+        self.__decisionCount__ = 0
+
+    def register(self, agent) -> None:
+        """
+        Register an Agent, which decides first in the next free Slot of the Decision Interval.
+
+        Args:
+            agent: An Object with a think Method, e.g. a Helicopter.
+        """
+        self.__agents__.append(agent)
+        self.__offsets__.append(len(self.__offsets__) % self.__decisionInterval__)
+
+    def unregister(self, agent) -> None:
+        """
+        Remove an Agent from the Schedule, the other Agents keep their Slots.
+        """
+        index = self.__agents__.index(agent)
+        del self.__agents__[index]
+        del self.__offsets__[index]
+
+    def tick(self) -> None:
+        """
+        Let every Agent whose Slot is due in the current Tick of the Simulation Clock make its Decisions.
+        """
+        slot = self.__simulationClock__.getTicks() % self.__decisionInterval__
+        for agent, offset in zip(self.__agents__, self.__offsets__):
+            if offset == slot:
+                agent.think()
+                self.__decisionCount__ += 1
+
+    def reset(self) -> None:
+        """
+        Start counting the Decisions from 0 again for a restarted Round, the Agents keep their Slots.
+        """
+        self.__decisionCount__ = 0
+
+    def getDecisionInterval(self) -> int:
+        return self.__decisionInterval__
+
+    def getAgentCount(self) -> int:
+        return len(self.__agents__)
+
+    def getDecisionCount(self) -> int:
+        return self.__decisionCount__
+
+    def __str__(self) -> str:
+        return f"{type(self).__name__} (agents={len(self.__agents__)}, decisionInterval={self.__decisionInterval__}, decisions={self.__decisionCount__})"
\ No newline at end of file
@@ -0,0 +1,99 @@
+from Model.GameObjects.Base.GameObject import GameObject
+
+
+class EntityRegistry:
+    """
+    A Class representing a Registry of the Game Objects of a Game Round, indexed by their Class.
+
+    Every Object is registered under its own Class and all of its Base Classes, so asking for the
+    OreTransport or for all Vehicles is a single Dictionary Lookup instead of an isinstance Scan.
+    Within a Class, Objects keep their Registration Order.
+
+    Attributes:
+        __objectsByType__ (dict[type, list[GameObject]]): Registered Objects by Class and Base Class.
+    """
+    __objectsByType__: dict[type, list[GameObject]]
+
+    def __init__(self, gameObjects: list[GameObject] = None):
+        """
+        Initialize an EntityRegistry.
+
+        Args:
+            gameObjects (list[GameObject]): Optional Objects to register in the given Order.
+        """
+        self.__objectsByType__ = {}
+        if gameObjects is not None:
+            for gameObject in gameObjects:
+                self.add(gameObject)
+
+    def add(self, gameObject: GameObject) -> None:
+        """
+        Register a Game Object under its Class and all Base Classes.
+
+        Args:
+            gameObject (GameObject): The Object to register.
+        """
+        for objectType in self.__getIndexedTypes__(gameObject):
+            self.__objectsByType__.setdefault(objectType, []).append(gameObject)
+
+    def remove(self, gameObject: GameObject) -> None:
+        """
+        Remove a Game Object from the Registry.
+
+        Args:
+            gameObject (GameObject): The Object to remove.
+
+        Raises:
+            ValueError: If the Object is not registered.
+        """
+        for objectType in self.__getIndexedTypes__(gameObject):
+            gameObjects = self.__objectsByType__.get(objectType)
+            if gameObjects is None:
+                raise ValueError(f"{type(gameObject).__name__} is not registered")
+            gameObjects.remove(gameObject)
+            if not gameObjects:
+                del self.__objectsByType__[objectType]
+
+    def getFirst(self, objectType: type):
+        """
+        Retrieve the first registered Object of the given Class or one of its Subclasses.
+
+        Args:
+            objectType (type): The Class to look for.
+
+        Returns:
+            GameObject | None: The first matching Object or None.
+        """
+        gameObjects = self.__objectsByType__.get(objectType)
+        return gameObjects[0] if gameObjects else None
+
+    def getAll(self, objectType: type) -> list:
+        """
+        Retrieve all registered Objects of the given Class or one of its Subclasses.
+
+        Args:
+            objectType (type): The Class to look for.
+
+        Returns:
+            list[GameObject]: A new List of the matching Objects in Registration Order.
+        """
+        return list(self.__objectsByType__.get(objectType, ()))
+
+    def count(self, objectType: type) -> int:
+        return len(self.__objectsByType__.get(objectType, ()))
+
+    def clear(self) -> None:
+        self.__objectsByType__ = {}
+
+    @staticmethod
+    def __getIndexedTypes__(gameObject: GameObject) -> tuple[type, ...]:
+        """
+        Return the Classes an Object is registered under, i.e. its Method Resolution Order without object.
+        """
+        return type(gameObject).__mro__[:-1]
+
+    def __contains__(self, gameObject: GameObject) -> bool:
+        return gameObject in self.__objectsByType__.get(type(gameObject), ())
+
+    def __str__(self) -> str:
+        return f"{type(self).__name__} ({ {objectType.__name__: len(objects) for objectType, objects in self.__objectsByType__.items()} })"
\ No newline at end of file
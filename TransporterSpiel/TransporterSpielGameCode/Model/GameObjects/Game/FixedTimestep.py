@@ -0,0 +1,94 @@
+from Services.ConfigService import getConfig
+
+# Tick Rate the per-Tick Gameplay Values (Speeds, Acceleration, Friction, Turning, Fuel Consumption
+# and the Interaction Cadence) are tuned for. It equals the original Frame Rate of one Tick per Frame.
+REFERENCE_TICK_RATE = 60
+
+
+def getTickScale() -> float:
+    """
+    Return the Factor to scale per-Tick Gameplay Values with, so they describe the same Motion per Second
+    at the configured Tick Rate as at the Reference Tick Rate.
+
+    Returns:
+        float: 1.0 at the Reference Tick Rate, 0.5 at twice the Tick Rate.
+    """
+    return REFERENCE_TICK_RATE / getConfig().getSimulationConfig().getTickRate()
+
+
+class FixedTimestep:
+    """
+    A Class accumulating elapsed Frame Time into a whole Number of fixed-length Simulation Ticks.
+
+    Each Frame the Game Loop passes the elapsed Time to advance() and runs the returned Number of
+    Ticks, so the Simulation advances at the configured Tick Rate whatever the Frame Rate is.
+    The Remainder that did not fill a whole Tick stays in the Accumulator and is exposed as the
+    Interpolation Factor, with which the Frame is rendered between the last two Tick States.
+
+    If a Frame took so long that more than the allowed Number of Ticks is due, the Backlog is dropped
+    instead of being caught up, so a slow Machine runs the Game slower instead of freezing.
+
+    Attributes:
+        __tickRate__ (int): Simulation Ticks per Second.
+        __tickDuration__ (float): Length of one Tick in Milliseconds.
+        __maxTicksPerFrame__ (int): Maximum Number of Ticks run in a single Frame.
+        __accumulator__ (float): Elapsed Milliseconds not yet consumed by a Tick.
+    """
+    __tickRate__: int
+    __tickDuration__: float
+    __maxTicksPerFrame__: int
+    __accumulator__: float
+
+    def __init__(self, tickRate: int = 60, maxTicksPerFrame: int = 5):
+        """
+        Initialize a FixedTimestep.
+
+        Args:
+            tickRate (int): Simulation Ticks per Second.
+            maxTicksPerFrame (int): Maximum Number of Ticks run in a single Frame.
+        """
+        self.__tickRate__ = tickRate
+        self.__tickDuration__ = 1000 / tickRate
+        self.__maxTicksPerFrame__ = maxTicksPerFrame
+        self.__accumulator__ = 0.0
+
+    def advance(self, elapsedMilliseconds: float) -> int:
+        """
+        Add the elapsed Frame Time and return the Number of Ticks that are due.
+
+        Args:
+            elapsedMilliseconds (float): Time since the previous Frame, e.g. the Result of pygame.time.Clock.tick.
+
+        Returns:
+            int: The Number of Ticks to run in this Frame.
+        """
+        self.__accumulator__ += elapsedMilliseconds
+        ticks = int(self.__accumulator__ // self.__tickDuration__)
+        if ticks > self.__maxTicksPerFrame__:
+            # Drop the Backlog but keep the Fraction of the current Tick
+            ticks = self.__maxTicksPerFrame__
+            self.__accumulator__ %= self.__tickDuration__
+        else:
+            self.__accumulator__ -= ticks * self.__tickDuration__
+        return ticks
+
+    def getInterpolation(self) -> float:
+        """
+        Return how far the current Frame lies between the last Tick and the next one, from 0 to 1.
+        """
+        return self.__accumulator__ / self.__tickDuration__
+
+    def reset(self) -> None:
+        """
+        Discard the accumulated Time, e.g. at the Start of a Game Round.
+        """
+        self.__accumulator__ = 0.0
+
+    def getTickRate(self) -> int:
+        return self.__tickRate__
+
+    def getTickDuration(self) -> float:
+        return self.__tickDuration__
+
+    def getMaxTicksPerFrame(self) -> int:
+        return self.__maxTicksPerFrame__
\ No newline at end of file
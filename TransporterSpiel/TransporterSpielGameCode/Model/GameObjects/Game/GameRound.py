@@ -1,352 +1,744 @@
-import sys
-from typing import cast
-
-import pygame
-
-from Model.GameObjects.Base.GameObject import GameObject
-from Model.GameObjects.Game.GameDifficulty import GameDifficulty
-from Model.GameObjects.Buildings.GasStation import GasStation
-from Model.GameObjects.Vehicles.Helicopter import Helicopter
-from Model.GameObjects.Messages.FinalMessage import FinalTextGameObject
-from Model.GameObjects.Messages.TimedMessage import TimedTextGameObject
-from Model.GameObjects.Buildings.OreMine import OreMine
-from Model.GameObjects.Vehicles.OreTransport import OreTransport
-from Model.GameObjects.Buildings.OreUnloadStation import OreUnloadStation
-from Model.GameObjects.MenuElements.Hud import Hud
-from Model.GameObjects.MenuElements.MainMenu import MainMenu
-from Services.ConfigService import getConfig
-from Services.GameObjectCreationService import GameObjectCreationService
-
-
-class GameRound:
-    """
-    A Class representing a single Round of the Game.
-
-    Attributes:
-        __gameObjects__ (list[GameObject]): List of all active Game Objects.
-        __screen__ (pygame.Surface): Game Surface where Objects are drawn.
-        __paused__ (bool): Flag indicating whether the Game is paused.
-        __oreDelivered__ (float): Amount of Ore delivered so far.
-        __oreToCollect__ (float): Total Ore required to win.
-        __gameWidth__ (int): Width of the active Game Area.
-        __gameHeight__ (int): Height of the Game Screen.
-        __playing__ (bool): Flag indicating if the Game is running.
-        __difficulty__ (GameDifficulty): Difficulty Settings of the Game.
-        __interactionCheckCounter__ (int): Counter to control frequency of interaction checks.
-    """
-    __gameObjects__ : list[GameObject]
-    __screen__ : pygame.Surface
-    __paused__ : bool
-    __oreDelivered__ : float
-    __oreToCollect__ : float
-    __gameWidth__ : int
-    __gameHeight__ : int
-    __playing__ : bool
-    __difficulty__ : GameDifficulty
-    __interactionCheckCounter__: int
-
-    def __init__(self, difficulty : GameDifficulty, gameObjectCreationService : GameObjectCreationService, mainMenu : MainMenu, screen : pygame.Surface):
-        """
-        Initialize a GameRound Object.
-
-        Args:
-            difficulty (GameDifficulty): Difficulty Configuration.
-            gameObjectCreationService (GameObjectCreationService): Service to create Game Objects.
-            mainMenu (MainMenu): Main Menu Game Object.
-            screen (pygame.Surface): Screen Surface for rendering.
-        """
-        screenConfig = getConfig().getScreenConfig()
-        windowWidth: int = screenConfig.getScreenWidth()
-        hudWidth: int = screenConfig.getHudConfig().getSideHudConfig().getWidth()
-        self.__gameWidth__ = windowWidth - hudWidth
-        self.__gameHeight__ = screenConfig.getScreenHeight()
-
-        self.__gameObjects__ = gameObjectCreationService.createGameObjects(difficulty)
-        self.__difficulty__ = difficulty
-        self.__screen__ = screen
-        self.__paused__ = False
-        self.__oreDelivered__ = 0.0
-        self.__oreToCollect__ = difficulty.getOreToCollect()
-        self.__playing__ = True
-        self.__hud__ = Hud(
-            screen=screen,
-            oreToCollect=difficulty.getOreToCollect(),
-            gameObjects=self.__gameObjects__
-        )
-
-        # Make sure the Main Menu is closed at the Beginning
-        mainMenu.close()
-        self.__gameObjects__.append(mainMenu)
-        self.__interactionCheckCounter__ = 0
-
-    def isPlaying(self) -> bool:
-        return self.__playing__
-
-    def update(self):
-        """
-        Update the Game Round including Input, Collisions, Game Logic and Rendering.
-        """
-        self.__handleGameInput__()
-        if not self.__paused__:
-            oreTransport = cast(OreTransport, self.__filterGameObjects__(OreTransport))
-            helicopter = cast(Helicopter, self.__filterGameObjects__(Helicopter))
-            gasStation = cast(GasStation, self.__filterGameObjects__(GasStation))
-            oreMine = cast(OreMine, self.__filterGameObjects__(OreMine))
-            oreUnloadStation = cast(OreUnloadStation, self.__filterGameObjects__(OreUnloadStation))
-
-            self.__handleCollisions__(
-                oreTransport=oreTransport,
-                helicopter=helicopter,
-                gasStation=gasStation,
-                oreMine=oreMine,
-                oreUnloadStation=oreUnloadStation
-            )
-
-        self.__updateGameScreen__()
-
-    def __isOreGoalReached__(self):
-        """
-        Check whether the Goal for Ore Delivery has been reached.
-
-        Returns:
-            bool: True if Goal is reached, else False.
-        """
-        if self.__oreDelivered__ >= self.__oreToCollect__:
-            return True
-        return False
-
-    def __filterGameObjects__(self, typeToFilterFor):
-        """
-        Filter for a single Object of a given Type from all Game Objects.
-
-        Args:
-            typeToFilterFor (Type): The Type to filter for.
-
-        Returns:
-            GameObject | None: The first matching Object or None.
-        """
-        return next(filter(lambda obj: isinstance(obj, typeToFilterFor), self.__gameObjects__), None)
-
-    def __checkGameStatus__(self):
-        """
-        Check the Game Status and append a Final Message if Game ends.
-        """
-        if self.__isOreGoalReached__():
-            finalMessage : FinalTextGameObject = FinalTextGameObject(
-                screen=self.__screen__,
-                message="Congratulations, you have reached the ore goal!",
-                backgroundColor=(10, 50, 10),
-                isWinMessage=True
-            )
-            self.__gameObjects__.append(finalMessage)
-
-        elif not self.__isGameWinnable__():
-            finalMessage : FinalTextGameObject = FinalTextGameObject(
-                screen=self.__screen__,
-                message="Game over! The game is no longer winnable.",
-                backgroundColor=(50, 10, 10),
-                isWinMessage=False
-            )
-            self.__gameObjects__.append(finalMessage)
-
-    def __isGameWinnable__(self):
-        """
-        Check whether it is still possible to win the Game.
-
-        Returns:
-            bool: True if Game is Winnable, else False.
-        """
-        oreTransport: OreTransport = cast(OreTransport, self.__filterGameObjects__(OreTransport))
-        oreMine: OreMine = cast(OreMine, self.__filterGameObjects__(OreMine))
-
-        # Check if OreTransport can still deliver enough Ore
-        if oreTransport.getLoadedOreAmount() + oreMine.getTotalResourceStored() + self.__oreDelivered__ < self.__oreToCollect__:
-            return False
-        # Check if OreTransport has Fuel left
-        if oreTransport.getFuelLevel() == 0.00:
-            return False
-        return True
-
-    def __updateGameScreen__(self):
-        """
-        Update and Render the complete Game Screen.
-        """
-        self.__screen__.fill((10, 40, 10))
-        self.__checkGameStatus__()
-        self.__hud__.__updateGameObjects__()
-        self.__renderGameObjects__()
-
-    def __renderGameObjects__(self):
-        """
-        Render all Game Objects based on Layer and update the Display Buffer.
-        """
-        # Sort by layer
-        self.__gameObjects__.sort(key=lambda obj: obj.getLayer())
-        updatedGameObjects : list[GameObject] = []
-        # Draw in order
-        for gameObject in self.__gameObjects__:
-            if isinstance(gameObject, FinalTextGameObject):
-                gameObject.draw()
-                self.__playing__ = False
-                return
-
-            # Only Update non MainMenu Game Objects if the Game is not paused
-            if type(gameObject) is not MainMenu:
-                if not self.__paused__:
-                    gameObject.update()
-
-            if isinstance(gameObject, TimedTextGameObject):
-                if gameObject.isExpired():
-                    continue
-
-            gameObject.draw()
-            updatedGameObjects.append(gameObject)
-
-        # Replace GameObjects list with filtered updated list
-        self.__gameObjects__ = updatedGameObjects
-
-        # Update the Display Buffers
-        pygame.display.update()
-
-    def __handleGameInput__(self):
-        """
-        Handle Player Input Events such as Keyboard Presses and Quitting.
-        """
-        oreTransport : OreTransport = next(filter(lambda obj: isinstance(obj, OreTransport), self.__gameObjects__), None)
-        if type(oreTransport) is None:
-            return
-        mainMenu :MainMenu = next(filter(lambda obj: isinstance(obj, MainMenu), self.__gameObjects__), None)
-        if type(mainMenu) is None:
-            return
-
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.__running__ = False
-
-            if event.type == pygame.KEYDOWN:
-
-                if event.key == pygame.K_ESCAPE:
-                    if self.__paused__:
-                        mainMenu.close()
-                        self.__paused__ = False
-                    else:
-                        mainMenu.open()
-                        self.__paused__ = True
-
-                if self.__paused__:
-                    if event.key == pygame.K_r:
-                        self.__playing__ = False
-                        self.__paused__ = False
-                    if event.key == pygame.K_q:
-                        self.__playing__ = False
-                        self.__running__ = False
-                        pygame.quit()
-                        sys.exit()
-
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_a]:
-            oreTransport.steer("right")
-        if keys[pygame.K_d]:
-            oreTransport.steer("left")
-        if keys[pygame.K_w]:
-            oreTransport.accelerate()
-        if keys[pygame.K_s]:
-            oreTransport.decelerate()
-
-    def __handleCollisions__(self, oreTransport: OreTransport, helicopter : Helicopter, gasStation: GasStation, oreMine : OreMine, oreUnloadStation: OreUnloadStation):
-        """
-        Handle all Collision-based Interactions between Vehicles and Stations.
-
-        Args:
-            oreTransport (OreTransport): The Ore Transport Vehicle.
-            helicopter (Helicopter): The Helicopter attempting to steal Ore.
-            gasStation (GasStation): The Gas Station for refueling.
-            oreMine (OreMine): The Ore Mine to load Ore from.
-            oreUnloadStation (OreUnloadStation): The Station to unload Ore to.
-        """
-        # Check for collisions with walls
-        if oreTransport.getXCoordinate() < 0.0:
-            oreTransport.handleCollisionWithWall('left')
-        if oreTransport.getXCoordinate() + oreTransport.getWidth() > self.__gameWidth__:
-            oreTransport.handleCollisionWithWall('right')
-        if oreTransport.getYCoordinate() < 0.0:
-            oreTransport.handleCollisionWithWall('top')
-        if oreTransport.getYCoordinate() + oreTransport.getHeight() > self.__gameHeight__:
-            oreTransport.handleCollisionWithWall('bottom')
-
-        # Increment loop counter
-        self.__interactionCheckCounter__ += 1
-        # Only process interaction logic every 10 Frames/ Loops
-        if self.__interactionCheckCounter__ % 10 == 0:
-            # Check for Helicopter Interaction
-            helicopterCounter: int
-            if helicopter.areColliding(oreTransport, True) and not helicopter.getIsEscaping() and oreTransport.getLoadedOreAmount() > 0.0:
-                stolenAmount : float = helicopter.stealOre(oreTransport)
-                self.__gameObjects__.append(
-                    TimedTextGameObject(
-                        message=f"Helicopter Stole {stolenAmount} Ore",
-                        xCoordinate=oreTransport.getXCoordinate(),
-                        yCoordinate=oreTransport.getYCoordinate(),
-                        fontSize=24,
-                        screen=self.__screen__,
-                        duration=3
-                    )
-                )
-
-            # Check for GasStation Interaction
-            if oreTransport.areColliding(gasStation, True) and not oreTransport.fuelIsFull():
-                oreTransport.refuel(gasStation.giveResource())
-                self.__gameObjects__.append(
-                    TimedTextGameObject(
-                        message="Refueled!",
-                        xCoordinate=oreTransport.getXCoordinate(),
-                        yCoordinate=oreTransport.getYCoordinate(),
-                        fontSize=24,
-                        screen=self.__screen__,
-                        duration=1
-                    )
-                )
-
-            # Check for OreMine Interaction
-            if oreMine.areColliding(oreTransport, True) and not oreTransport.oreIsFull():
-                loaded = oreMine.giveResource()
-                if loaded > 0:
-                    surplus: float = oreTransport.loadOre(loaded)
-                    oreMine.takeResource(surplus)
-                    self.__gameObjects__.append(
-                        TimedTextGameObject(
-                            message=f"Loaded {loaded} Ore",
-                            xCoordinate=oreTransport.getXCoordinate(),
-                            yCoordinate=oreTransport.getYCoordinate(),
-                            fontSize=24,
-                            screen=self.__screen__,
-                            duration=1
-                        )
-                    )
-
-            # Check for OreUnloadStation Interaction
-            if oreUnloadStation.areColliding(oreTransport, True) and not oreTransport.isEmpty():
-                delivered = oreTransport.unloadOre(oreTransport.getLoadedOreAmount())
-                oreUnloadStation.takeResource(delivered)
-                self.__updateOreDelivered__(delivered)
-                self.__gameObjects__.append(
-                    TimedTextGameObject(
-                        message=f"Delivered {delivered} Ore",
-                        xCoordinate=oreTransport.getXCoordinate(),
-                        yCoordinate=oreTransport.getYCoordinate(),
-                        fontSize=24,
-                        screen=self.__screen__,
-                        duration=2
-                    )
-                )
-
-            self.__interactionCheckCounter__ = 0
-
-    def __updateOreDelivered__(self, amount):
-        """
-        Increase the Delivered Ore Count by the given Amount.
-
-        Args:
-            amount (float): Amount of Ore delivered.
-        """
+import random
+import sys
+import time
+from typing import cast
+
+import pygame
+
+from Model.GameObjects.Base.GameObject import GameObject
+from Model.GameObjects.Base.RenderList import RenderList
+from Model.GameObjects.Base.SpatialHashGrid import SpatialHashGrid
+from Model.GameObjects.Game.AiScheduler import AiScheduler
+from Model.GameObjects.Game.EntityRegistry import EntityRegistry
+from Model.GameObjects.Game.FixedTimestep import getTickScale
+from Model.GameObjects.Game.GameDifficulty import GameDifficulty
+from Model.GameObjects.Game.InputRecording import (
+    InputRecording, INPUT_STEER_RIGHT, INPUT_STEER_LEFT, INPUT_ACCELERATE, INPUT_DECELERATE,
+    INPUT_TOGGLE_MENU, INPUT_RESTART, INPUT_QUIT
+)
+from Model.GameObjects.Game.SimulationClock import SimulationClock
+from Model.GameObjects.Game.TriggerZone import TriggerZone
+from Model.GameObjects.Buildings.GasStation import GasStation
+from Model.GameObjects.Vehicles.Helicopter import Helicopter
+from Model.GameObjects.Vehicles.Vehicle import Vehicle
+from Model.GameObjects.Messages.FinalMessage import FinalTextGameObject, LOSE_MESSAGE, WIN_MESSAGE
+from Model.GameObjects.Messages.TimedMessage import TimedTextGameObject
+from Model.GameObjects.Buildings.OreMine import OreMine
+from Model.GameObjects.Vehicles.OreTransport import OreTransport
+from Model.GameObjects.Buildings.OreUnloadStation import OreUnloadStation
+from Model.GameObjects.MenuElements.FrameProfilerOverlay import FrameProfilerOverlay
+from Model.GameObjects.MenuElements.Hud import Hud
+from Model.GameObjects.MenuElements.MainMenu import MainMenu
+from Services.ConfigService import getConfig
+from Services.FrameProfilerService import FrameProfilerService
+from Services.GameObjectCreationService import GameObjectCreationService
+from Services.RenderService import RenderService
+from Services.TimedMessagePoolService import TimedMessagePoolService
+from Services.TriggerZoneService import TriggerZoneService
+from Services.VehiclePhysicsService import VehiclePhysicsService, isVectorizedPhysicsAvailable
+
+
+class GameRound:
+    """
+    A Class representing a single Round of the Game.
+
+    Attributes:
+        __gameObjects__ (RenderList): All active, non-static Game Objects in Layer Order.
+        __entityRegistry__ (EntityRegistry): All Game Objects of the Round, including static ones, indexed by Class.
+        __screen__ (pygame.Surface): Game Surface where Objects are drawn.
+        __paused__ (bool): Flag indicating whether the Game is paused.
+        __oreDelivered__ (float): Amount of Ore delivered so far.
+        __oreToCollect__ (float): Total Ore required to win.
+        __gameWidth__ (int): Width of the active Game Area.
+        __gameHeight__ (int): Height of the Game Screen.
+        __playing__ (bool): Flag indicating if the Game is running.
+        __difficulty__ (GameDifficulty): Difficulty Settings of the Game.
+        __renderInterpolation__ (bool): Whether Frames are drawn interpolated between the last two Ticks.
+        __vehiclePhysicsService__ (VehiclePhysicsService): Moves all Vehicles at once, None for the "python" Backend.
+        __collisionGrid__ (SpatialHashGrid): Broadphase for the Interactions between Vehicles and Buildings.
+        __triggerZoneService__ (TriggerZoneService): Emits the Interactions of the Ore Transport with the Trigger Zones.
+        __renderService__ (RenderService): Service drawing the Game Objects and updating the Display, None if headless.
+        __timedMessagePool__ (TimedMessagePoolService): Recycles the Timed Messages of the Interactions, None if headless.
+        __headless__ (bool): Whether the Round runs without HUD, Messages and Rendering.
+        __outcome__ (str): "won" or "lost" once the Round has ended, otherwise None.
+        __seed__ (int): Seed of the Random Generator, which makes the Round repeatable.
+        __randomGenerator__ (random.Random): Source of all Randomness in the Round.
+        __simulationClock__ (SimulationClock): Time of the Round in simulated Ticks.
+        __aiScheduler__ (AiScheduler): Runs the Decisions of the AI Agents at the configured Decision Rate.
+        __inputRecording__ (InputRecording): Records the Input of every Tick, None if not recording.
+        __replay__ (InputRecording): Recording whose Input is fed back instead of the Player Input, None if live.
+        __inputTick__ (int): Number of Ticks whose Input was handled.
+        __frameProfiler__ (FrameProfilerService): Receives the Phase Times of every Frame, None if not profiling.
+        __frameProfilerOverlay__ (FrameProfilerOverlay): Shows the Profiler Statistics, toggled with F3.
+    """
+    __gameObjects__ : RenderList
+    __entityRegistry__ : EntityRegistry
+    __screen__ : pygame.Surface
+    __paused__ : bool
+    __oreDelivered__ : float
+    __oreToCollect__ : float
+    __gameWidth__ : int
+    __gameHeight__ : int
+    __playing__ : bool
+    __difficulty__ : GameDifficulty
+    __renderInterpolation__: bool
+    __vehiclePhysicsService__: VehiclePhysicsService
+    __collisionGrid__: SpatialHashGrid
+    __triggerZoneService__: TriggerZoneService
+    __renderService__: RenderService
+    __timedMessagePool__: TimedMessagePoolService
+    __headless__: bool
+    __outcome__: str
+    __seed__: int
+    __randomGenerator__: random.Random
+    __simulationClock__: SimulationClock
+    __aiScheduler__: AiScheduler
+    __inputRecording__: InputRecording
+    __replay__: InputRecording
+    __inputTick__: int
+    __frameProfiler__: FrameProfilerService
+    __frameProfilerOverlay__: FrameProfilerOverlay
+
+    def __init__(
+            self,
+            difficulty : GameDifficulty,
+            gameObjectCreationService : GameObjectCreationService,
+            mainMenu : MainMenu,
+            screen : pygame.Surface,
+            headless : bool = False,
+            seed : int = None,
+            recordInput : bool = False,
+            replay : InputRecording = None,
+            frameProfiler : FrameProfilerService = None
+    ):
+        """
+        Initialize a GameRound Object.
+
+        Args:
+            difficulty (GameDifficulty): Difficulty Configuration.
+            gameObjectCreationService (GameObjectCreationService): Service to create Game Objects.
+            mainMenu (MainMenu): Main Menu Game Object.
+            screen (pygame.Surface): Screen Surface for rendering.
+            headless (bool): Run only the Game Logic, without HUD, Timed Messages, Final Message and Rendering.
+            seed (int): Seed of the Random Generator. If None, the configured Seed is used, or a random one if
+                none is configured.
+            recordInput (bool): Record the Input of every Tick, see getInputRecording.
+            replay (InputRecording): Feed back a recorded Input instead of the Player Input. The Seed and the
+                Difficulty should be taken from the Recording.
+            frameProfiler (FrameProfilerService): Profiler that receives the Phase Times of every Frame and
+                whose Overlay is toggled with F3. Ignored in headless Mode, which has no Frames.
+
+        Raises:
+            ValueError: If the Replay was recorded with other Simulation Settings.
+        """
+        screenConfig = getConfig().getScreenConfig()
+        self.__gameWidth__ = screenConfig.getGameWidth()
+        self.__gameHeight__ = screenConfig.getGameHeight()
+        simulationConfig = getConfig().getSimulationConfig()
+        tickRate: int = simulationConfig.getTickRate()
+
+        if replay is not None and replay.getSettings() != self.getSimulationSettings():
+            raise ValueError(f"The Replay was recorded with {replay.getSettings()}, but the Game runs with {self.getSimulationSettings()}")
+        seed = self.__chooseSeed__(seed)
+        self.__seed__ = seed
+        self.__randomGenerator__ = random.Random(seed)
+        self.__simulationClock__ = SimulationClock(tickRate)
+        self.__aiScheduler__ = AiScheduler(self.__simulationClock__, decisionRate=simulationConfig.getAiDecisionRate())
+        self.__replay__ = replay
+        self.__inputTick__ = 0
+        self.__inputRecording__ = None
+        if recordInput:
+            self.__inputRecording__ = InputRecording(seed=seed, difficulty=difficulty, settings=self.getSimulationSettings())
+
+        gameObjects: list[GameObject] = gameObjectCreationService.createGameObjects(
+            difficulty,
+            randomGenerator=self.__randomGenerator__,
+            simulationClock=self.__simulationClock__,
+            aiScheduler=self.__aiScheduler__
+        )
+        self.__headless__ = headless
+        self.__outcome__ = None
+        self.__frameProfiler__ = None if headless else frameProfiler
+        self.__frameProfilerOverlay__ = None
+        if self.__frameProfiler__ is not None:
+            self.__frameProfilerOverlay__ = FrameProfilerOverlay(
+                screen=screen,
+                frameProfiler=self.__frameProfiler__,
+                refreshInterval=getConfig().getProfilerConfig().getOverlayRefreshFrames()
+            )
+        self.__renderService__ = None if headless else RenderService(screen=screen, backgroundColor=(10, 40, 10), frameProfiler=self.__frameProfiler__)
+        self.__timedMessagePool__ = None if headless else TimedMessagePoolService(screen=screen, fontSize=24)
+        self.__gameObjects__ = RenderList()
+        self.__entityRegistry__ = EntityRegistry()
+        for gameObject in gameObjects:
+            self.__addGameObject__(gameObject)
+        self.__difficulty__ = difficulty
+        self.__screen__ = screen
+        self.__paused__ = False
+        self.__oreDelivered__ = 0.0
+        self.__oreToCollect__ = difficulty.getOreToCollect()
+        self.__playing__ = True
+        self.__hud__ = None
+        if not headless:
+            self.__hud__ = Hud(
+                screen=screen,
+                oreToCollect=difficulty.getOreToCollect(),
+                entityRegistry=self.__entityRegistry__
+            )
+
+        # Make sure the Main Menu is closed at the Beginning
+        mainMenu.close()
+        self.__addGameObject__(mainMenu)
+        self.__renderInterpolation__ = simulationConfig.getRenderInterpolation()
+        self.__vehiclePhysicsService__ = self.__createVehiclePhysicsService__(simulationConfig.getVehiclePhysicsBackend())
+        self.__collisionGrid__ = SpatialHashGrid(cellSize=simulationConfig.getCollisionCellSize())
+        self.__triggerZoneService__ = TriggerZoneService(self.__collisionGrid__)
+        self.__addTriggerZones__(tickRate)
+
+    def reset(self, difficulty: GameDifficulty, seed: int = None) -> None:
+        """
+        Restart the Round in place with the given Difficulty, instead of creating a new Round.
+
+        The Game Objects, the HUD, the Render Service and the Trigger Zones of the Round are kept and
+        restored to their Start State, so a Restart allocates almost nothing and re-renders only the
+        HUD Lines whose Text changes. Timed Messages and the Final Message of the previous Round are dropped.
+
+        Args:
+            difficulty (GameDifficulty): Difficulty of the restarted Round, it may differ from the previous one.
+            seed (int): Seed of the Random Generator. If None, it is chosen like in the Constructor.
+        """
+        seed = self.__chooseSeed__(seed)
+        self.__seed__ = seed
+        # The Helicopter holds the Random Generator, so it is seeded again instead of replaced
+        self.__randomGenerator__.seed(seed)
+        self.__simulationClock__.reset()
+        self.__aiScheduler__.reset()
+        self.__inputTick__ = 0
+        if self.__inputRecording__ is not None:
+            self.__inputRecording__ = InputRecording(seed=seed, difficulty=difficulty, settings=self.getSimulationSettings())
+
+        for transientType in (TimedTextGameObject, FinalTextGameObject):
+            for transientObject in self.__entityRegistry__.getAll(transientType):
+                self.__gameObjects__.remove(transientObject)
+                self.__entityRegistry__.remove(transientObject)
+                if transientType is TimedTextGameObject:
+                    self.__timedMessagePool__.release(transientObject)
+
+        self.__difficulty__ = difficulty
+        self.__outcome__ = None
+        self.__paused__ = False
+        self.__oreDelivered__ = 0.0
+        self.__oreToCollect__ = difficulty.getOreToCollect()
+        self.__playing__ = True
+        for gameObject in self.__entityRegistry__.getAll(GameObject):
+            gameObject.reset(difficulty)
+        self.__entityRegistry__.getFirst(MainMenu).close()
+        # The Ore Transport was put back, so its Contacts of the previous Round are gone
+        self.__triggerZoneService__.clearContacts()
+        self.__collisionGrid__.refresh()
+        if self.__hud__ is not None:
+            self.__hud__.reset(difficulty)
+        if self.__renderService__ is not None:
+            # Something else, e.g. the Difficulty Selection Screen, was drawn since the last Frame
+            self.__renderService__.invalidate()
+
+    def isPlaying(self) -> bool:
+        return self.__playing__
+
+    def isHeadless(self) -> bool:
+        return self.__headless__
+
+    def getOutcome(self) -> str:
+        return self.__outcome__
+
+    def getOreDelivered(self) -> float:
+        return self.__oreDelivered__
+
+    def getSeed(self) -> int:
+        return self.__seed__
+
+    def getSimulationClock(self) -> SimulationClock:
+        return self.__simulationClock__
+
+    def getTimedMessagePool(self) -> TimedMessagePoolService:
+        """
+        Return the Pool of the Timed Messages, whose Hit and Miss Counters show how often Messages were reused.
+
+        Returns:
+            TimedMessagePoolService | None: The Pool, or None in headless Mode, which shows no Messages.
+        """
+        return self.__timedMessagePool__
+
+    def getInputRecording(self) -> InputRecording:
+        """
+        Return the Recording of the Input so far, with the Result set once the Round has an Outcome.
+
+        Returns:
+            InputRecording | None: The Recording, or None if the Round was not created with recordInput.
+        """
+        return self.__inputRecording__
+
+    def getSimulationSettings(self) -> dict:
+        """
+        Return the Settings besides Seed, Difficulty and Input that the Course of a Round depends on.
+
+        Returns:
+            dict: The Tick Rate, the AI Decision Rate, the Trigger Zone Stay Rates, the Vehicle Physics Backend
+                and the Size of the Game Area.
+        """
+        simulationConfig = getConfig().getSimulationConfig()
+        return {
+            "tickRate": simulationConfig.getTickRate(),
+            "aiDecisionRate": simulationConfig.getAiDecisionRate(),
+            "triggerStayRates": self.__getTriggerStayRates__(),
+            "vehiclePhysicsBackend": simulationConfig.getVehiclePhysicsBackend(),
+            "gameWidth": self.__gameWidth__,
+            "gameHeight": self.__gameHeight__,
+        }
+
+    def update(self):
+        """
+        Run a single Simulation Tick and render its Result, for Callers without own Timing.
+        """
+        self.tick()
+        self.render()
+
+    def tick(self):
+        """
+        Advance the Game Round by one fixed Simulation Tick: Input, Collisions, Game Status and Object Updates.
+
+        Nothing is simulated any more once the Round has an Outcome.
+        """
+        if self.__outcome__ is not None:
+            return
+        phaseStart = time.perf_counter() if self.__frameProfiler__ is not None else 0.0
+        self.__handleGameInput__()
+        phaseStart = self.__recordPhase__("input", phaseStart)
+        if not self.__paused__:
+            for gameObject in self.__gameObjects__:
+                gameObject.storePreviousState()
+            oreTransport = cast(OreTransport, self.__filterGameObjects__(OreTransport))
+            self.__handleCollisions__(oreTransport=oreTransport)
+            phaseStart = self.__recordPhase__("collisions", phaseStart)
+
+        self.__checkGameStatus__()
+        phaseStart = self.__recordPhase__("status", phaseStart)
+        if self.__playing__ and not self.__paused__ and self.__outcome__ is None:
+            self.__aiScheduler__.tick()
+            self.__updateGameObjects__()
+            if self.__vehiclePhysicsService__ is not None:
+                self.__vehiclePhysicsService__.step()
+            self.__simulationClock__.advance()
+            self.__recordPhase__("updates", phaseStart)
+        if self.__inputRecording__ is not None and self.__outcome__ is not None:
+            self.__inputRecording__.setResult(self.__outcome__, self.__inputTick__, self.__oreDelivered__)
+
+    def render(self, interpolation: float = 1.0):
+        """
+        Render the HUD and the Game Objects. Does nothing in headless Mode.
+
+        Args:
+            interpolation (float): How far the Frame lies between the previous and the current Tick,
+                from 0 to 1. Moving Objects are drawn at the interpolated Position.
+        """
+        if self.__headless__:
+            return
+        if self.__paused__ or not self.__renderInterpolation__:
+            interpolation = 1.0
+        for gameObject in self.__gameObjects__:
+            gameObject.setInterpolation(interpolation)
+        phaseStart = time.perf_counter() if self.__frameProfiler__ is not None else 0.0
+        self.__hud__.update()
+        self.__recordPhase__("hud", phaseStart)
+        self.__renderGameObjects__()
+        # The Frame showing the Final Message waits for Input, which is no Frame Time
+        if self.__frameProfiler__ is not None and self.__playing__:
+            self.__frameProfiler__.endFrame()
+
+    @staticmethod
+    def __chooseSeed__(seed: int) -> int:
+        """
+        Return the given Seed, or else the configured one, or else a random one.
+        """
+        if seed is None:
+            seed = getConfig().getSimulationConfig().getSeed()
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+        return seed
+
+    def __recordPhase__(self, phase: str, phaseStart: float) -> float:
+        """
+        Report the Time since phaseStart to the Frame Profiler, if the Round is profiled.
+
+        Args:
+            phase (str): The finished Phase, see FRAME_PHASES.
+            phaseStart (float): perf_counter Value when the Phase began.
+
+        Returns:
+            float: The Start of the next Phase.
+        """
+        if self.__frameProfiler__ is None:
+            return 0.0
+        phaseEnd = time.perf_counter()
+        self.__frameProfiler__.addPhaseTime(phase, phaseEnd - phaseStart)
+        return phaseEnd
+
+    def __addGameObject__(self, gameObject: GameObject):
+        """
+        Add a Game Object to the Round.
+
+        Every Object is registered in the Entity Registry. Static Objects are baked into the World
+        Layer of the Render Service, so they are neither updated nor drawn every Frame.
+
+        Args:
+            gameObject (GameObject): The Object to add.
+        """
+        self.__entityRegistry__.add(gameObject)
+        if gameObject.isStatic() and self.__renderService__ is not None:
+            self.__renderService__.addStaticGameObject(gameObject)
+        elif not gameObject.isStatic():
+            self.__gameObjects__.add(gameObject)
+
+    def __createVehiclePhysicsService__(self, backend: str):
+        """
+        Attach all Vehicles of the Round to a VehiclePhysicsService if the "numpy" Backend is configured.
+
+        Args:
+            backend (str): The configured Vehicle Physics Backend, "python" or "numpy".
+
+        Returns:
+            VehiclePhysicsService | None: The Service, or None if every Vehicle moves itself.
+        """
+        if backend != "numpy":
+            return None
+        if not isVectorizedPhysicsAvailable():
+            print("NumPy is not installed, falling back to the python Vehicle Physics Backend.")
+            return None
+        vehiclePhysicsService = VehiclePhysicsService(columns=list(Vehicle.PHYSICS_COLUMNS), tickScale=getTickScale())
+        for vehicle in self.__entityRegistry__.getAll(Vehicle):
+            vehiclePhysicsService.attach(vehicle)
+        return vehiclePhysicsService
+
+    def __isOreGoalReached__(self):
+        """
+        Check whether the Goal for Ore Delivery has been reached.
+
+        Returns:
+            bool: True if Goal is reached, else False.
+        """
+        if self.__oreDelivered__ >= self.__oreToCollect__:
+            return True
+        return False
+
+    def __filterGameObjects__(self, typeToFilterFor):
+        """
+        Filter for a single Object of a given Type from all Game Objects.
+
+        Args:
+            typeToFilterFor (Type): The Type to filter for.
+
+        Returns:
+            GameObject | None: The first matching Object or None.
+        """
+        return self.__entityRegistry__.getFirst(typeToFilterFor)
+
+    def __checkGameStatus__(self):
+        """
+        Check the Game Status, set the Outcome and append a Final Message if Game ends.
+
+        In headless Mode the Round ends immediately instead, as the Final Message waits for Input.
+        """
+        if self.__isOreGoalReached__():
+            self.__outcome__ = "won"
+        elif not self.__isGameWinnable__():
+            self.__outcome__ = "lost"
+        else:
+            return
+
+        if self.__headless__:
+            self.__playing__ = False
+            return
+
+        if self.__outcome__ == "won":
+            finalMessage : FinalTextGameObject = FinalTextGameObject(
+                screen=self.__screen__,
+                message=WIN_MESSAGE,
+                backgroundColor=(10, 50, 10),
+                isWinMessage=True
+            )
+            self.__addGameObject__(finalMessage)
+
+        else:
+            finalMessage : FinalTextGameObject = FinalTextGameObject(
+                screen=self.__screen__,
+                message=LOSE_MESSAGE,
+                backgroundColor=(50, 10, 10),
+                isWinMessage=False
+            )
+            self.__addGameObject__(finalMessage)
+
+    def __isGameWinnable__(self):
+        """
+        Check whether it is still possible to win the Game.
+
+        Returns:
+            bool: True if Game is Winnable, else False.
+        """
+        oreTransport: OreTransport = cast(OreTransport, self.__filterGameObjects__(OreTransport))
+        oreMine: OreMine = cast(OreMine, self.__filterGameObjects__(OreMine))
+
+        # Check if OreTransport can still deliver enough Ore
+        if oreTransport.getLoadedOreAmount() + oreMine.getTotalResourceStored() + self.__oreDelivered__ < self.__oreToCollect__:
+            return False
+        # Check if OreTransport has Fuel left
+        if oreTransport.getFuelLevel() == 0.00:
+            return False
+        return True
+
+    def __updateGameObjects__(self):
+        """
+        Update all Game Objects except the Main Menu without rendering them.
+        """
+        for gameObject in self.__gameObjects__:
+            if type(gameObject) is not MainMenu:
+                gameObject.update()
+
+    def __renderGameObjects__(self):
+        """
+        Drop expired Game Objects and render the rest with the HUD based on Layer.
+
+        The Render List is already in Layer Order, so no Sorting is needed.
+        """
+        expiredGameObjects : list[GameObject] = []
+        # Draw in order
+        for index, gameObject in enumerate(self.__gameObjects__):
+            if isinstance(gameObject, FinalTextGameObject):
+                # Draw the complete last Frame below the Final Message, which waits for Input
+                visibleGameObjects = [obj for obj in self.__gameObjects__[:index] if obj not in expiredGameObjects]
+                self.__renderService__.renderFull([self.__hud__] + visibleGameObjects, updateDisplay=False)
+                gameObject.draw()
+                self.__playing__ = False
+                return
+
+            if isinstance(gameObject, TimedTextGameObject):
+                if gameObject.isExpired():
+                    expiredGameObjects.append(gameObject)
+
+        # Remove expired Objects after iterating, so the Render List is not changed while in Use, and recycle them
+        for expiredGameObject in expiredGameObjects:
+            self.__gameObjects__.remove(expiredGameObject)
+            self.__entityRegistry__.remove(expiredGameObject)
+            self.__timedMessagePool__.release(expiredGameObject)
+
+        # Draw the HUD below the Game Objects and the Profiler Overlay above them, then update the Display Buffers
+        if self.__frameProfiler__ is not None and self.__frameProfiler__.isOverlayVisible():
+            self.__frameProfilerOverlay__.update()
+            self.__renderService__.render([self.__hud__, *self.__gameObjects__, self.__frameProfilerOverlay__])
+        else:
+            self.__renderService__.render([self.__hud__, *self.__gameObjects__])
+
+    def __handleGameInput__(self):
+        """
+        Handle the Input of the current Tick, read from the Player or from the Replay, and record it.
+        """
+        if self.__replay__ is not None:
+            inputFlags = self.__replay__.getInputFlags(self.__inputTick__)
+        else:
+            inputFlags = self.__readInput__()
+        if self.__inputRecording__ is not None:
+            self.__inputRecording__.append(inputFlags)
+        self.__inputTick__ += 1
+        self.__applyInput__(inputFlags)
+
+    def __readInput__(self) -> int:
+        """
+        Read the Player Input Events such as Keyboard Presses and Quitting.
+
+        Returns:
+            int: The Input Flags of the Tick, see InputRecording.
+        """
+        inputFlags = 0
+        paused = self.__paused__
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self.__running__ = False
+
+            if event.type == pygame.KEYDOWN:
+
+                if event.key == pygame.K_ESCAPE:
+                    inputFlags ^= INPUT_TOGGLE_MENU
+                    paused = not paused
+
+                # The Profiler Overlay does not affect the Simulation, so it is not part of the Input Flags
+                if event.key == pygame.K_F3 and self.__frameProfiler__ is not None:
+                    self.__frameProfiler__.toggleOverlay()
+
+                if paused:
+                    if event.key == pygame.K_r:
+                        inputFlags |= INPUT_RESTART
+                    if event.key == pygame.K_q:
+                        inputFlags |= INPUT_QUIT
+
+        keys = pygame.key.get_pressed()
+        if keys[pygame.K_a]:
+            inputFlags |= INPUT_STEER_RIGHT
+        if keys[pygame.K_d]:
+            inputFlags |= INPUT_STEER_LEFT
+        if keys[pygame.K_w]:
+            inputFlags |= INPUT_ACCELERATE
+        if keys[pygame.K_s]:
+            inputFlags |= INPUT_DECELERATE
+        return inputFlags
+
+    def __applyInput__(self, inputFlags: int):
+        """
+        Apply the Input Flags of a Tick: open or close the Main Menu, restart, quit and steer the Ore Transport.
+
+        Args:
+            inputFlags (int): The Input Flags, see InputRecording.
+        """
+        oreTransport : OreTransport = self.__entityRegistry__.getFirst(OreTransport)
+        mainMenu :MainMenu = self.__entityRegistry__.getFirst(MainMenu)
+
+        if inputFlags & INPUT_TOGGLE_MENU:
+            if self.__paused__:
+                mainMenu.close()
+                self.__paused__ = False
+            else:
+                mainMenu.open()
+                self.__paused__ = True
+
+        if inputFlags & INPUT_RESTART:
+            self.__playing__ = False
+            self.__paused__ = False
+        if inputFlags & INPUT_QUIT:
+            self.__playing__ = False
+            self.__running__ = False
+            # A Replay only ends the Round, the Player quits the Game
+            if self.__replay__ is None:
+                pygame.quit()
+                sys.exit()
+
+        if inputFlags & INPUT_STEER_RIGHT:
+            oreTransport.steer("right")
+        if inputFlags & INPUT_STEER_LEFT:
+            oreTransport.steer("left")
+        if inputFlags & INPUT_ACCELERATE:
+            oreTransport.accelerate()
+        if inputFlags & INPUT_DECELERATE:
+            oreTransport.decelerate()
+
+    def __handleCollisions__(self, oreTransport: OreTransport):
+        """
+        Handle the Collisions of the Ore Transport with the Walls and emit the Events of the Trigger Zones.
+
+        Args:
+            oreTransport (OreTransport): The Ore Transport Vehicle.
+        """
+        # Check for collisions with walls
+        if oreTransport.getXCoordinate() < 0.0:
+            oreTransport.handleCollisionWithWall('left')
+        if oreTransport.getXCoordinate() + oreTransport.getWidth() > self.__gameWidth__:
+            oreTransport.handleCollisionWithWall('right')
+        if oreTransport.getYCoordinate() < 0.0:
+            oreTransport.handleCollisionWithWall('top')
+        if oreTransport.getYCoordinate() + oreTransport.getHeight() > self.__gameHeight__:
+            oreTransport.handleCollisionWithWall('bottom')
+
+        self.__triggerZoneService__.tick()
+
+    def __addTriggerZones__(self, tickRate: int):
+        """
+        Register the Trigger Zones of the Helicopter and the Stations, with the Ore Transport as Activator.
+
+        Every Zone interacts when the Ore Transport enters it and then at its Stay Rate while it stays.
+        Leaving and entering again does not interact more often than the Stay Rate.
+
+        Args:
+            tickRate (int): Simulation Ticks per Second.
+        """
+        stayRates = self.__getTriggerStayRates__()
+        interactions = [
+            (self.__filterGameObjects__(Helicopter), self.__stealOre__),
+            (self.__filterGameObjects__(GasStation), self.__refuel__),
+            (self.__filterGameObjects__(OreMine), self.__loadOre__),
+            (self.__filterGameObjects__(OreUnloadStation), self.__unloadOre__),
+        ]
+        for owner, interaction in interactions:
+            stayRate = stayRates[type(owner).__name__]
+            handler = lambda activator, owner=owner, interaction=interaction: interaction(owner, activator)
+            self.__triggerZoneService__.addZone(
+                TriggerZone(owner=owner, stayInterval=max(1, round(tickRate / stayRate)), onEnter=handler, onStay=handler)
+            )
+        self.__triggerZoneService__.addActivator(self.__filterGameObjects__(OreTransport))
+
+    def __getTriggerStayRates__(self) -> dict[str, float]:
+        """
+        Return the configured Interactions per Second while staying in a Trigger Zone, by Class Name of the Zone Owner.
+
+        Raises:
+            ValueError: If a configured Rate is not positive.
+        """
+        configuredRates = getConfig().getSimulationConfig().getTriggerStayRates()
+        stayRates = {}
+        for owner in (Helicopter, GasStation, OreMine, OreUnloadStation):
+            # 6 Interactions per Second by Default, i.e. every 10 Ticks at the Reference Tick Rate
+            stayRate = configuredRates.get(owner.__name__, 6)
+            if stayRate <= 0:
+                raise ValueError(f"triggerStayRates.{owner.__name__} must be positive, got {stayRate}")
+            stayRates[owner.__name__] = stayRate
+        return stayRates
+
+    def __stealOre__(self, helicopter: Helicopter, oreTransport: OreTransport):
+        if not helicopter.getIsEscaping() and oreTransport.getLoadedOreAmount() > 0.0:
+            stolenAmount : float = helicopter.stealOre(oreTransport)
+            self.__showTimedMessage__(f"Helicopter Stole {stolenAmount} Ore", oreTransport, duration=3)
+
+    def __refuel__(self, gasStation: GasStation, oreTransport: OreTransport):
+        if not oreTransport.fuelIsFull():
+            oreTransport.refuel(gasStation.giveResource())
+            self.__showTimedMessage__("Refueled!", oreTransport, duration=1)
+
+    def __loadOre__(self, oreMine: OreMine, oreTransport: OreTransport):
+        if not oreTransport.oreIsFull():
+            loaded = oreMine.giveResource()
+            if loaded > 0:
+                surplus: float = oreTransport.loadOre(loaded)
+                oreMine.takeResource(surplus)
+                self.__showTimedMessage__(f"Loaded {loaded} Ore", oreTransport, duration=1)
+
+    def __unloadOre__(self, oreUnloadStation: OreUnloadStation, oreTransport: OreTransport):
+        if not oreTransport.isEmpty():
+            delivered = oreTransport.unloadOre(oreTransport.getLoadedOreAmount())
+            oreUnloadStation.takeResource(delivered)
+            self.__updateOreDelivered__(delivered)
+            self.__showTimedMessage__(f"Delivered {delivered} Ore", oreTransport, duration=2)
+
+    def __showTimedMessage__(self, message: str, oreTransport: OreTransport, duration: float):
+        """
+        Show a Timed Message from the Pool at the Position of the Ore Transport. Skipped in headless Mode.
+
+        Args:
+            message (str): The Text to show.
+            oreTransport (OreTransport): The Ore Transport the Message refers to.
+            duration (float): Seconds until the Message expires.
+        """
+        if self.__headless__:
+            return
+        self.__addGameObject__(
+            self.__timedMessagePool__.acquire(
+                message=message,
+                xCoordinate=oreTransport.getXCoordinate(),
+                yCoordinate=oreTransport.getYCoordinate(),
+                duration=duration
+            )
+        )
+
+    def __updateOreDelivered__(self, amount):
+        """
+        Increase the Delivered Ore Count by the given Amount.
+
+        Args:
+            amount (float): Amount of Ore delivered.
+        """
         self.__oreDelivered__ += amount
\ No newline at end of file
@@ -0,0 +1,143 @@
+import json
+import zlib
+
+from Model.GameObjects.Game.GameDifficulty import GameDifficulty
+
+# Input Flags of a single Tick, combined into one Byte
+INPUT_STEER_RIGHT = 1       # A held
+INPUT_STEER_LEFT = 2        # D held
+INPUT_ACCELERATE = 4        # W held
+INPUT_DECELERATE = 8        # S held
+INPUT_TOGGLE_MENU = 16      # ESC pressed an odd Number of Times
+INPUT_RESTART = 32          # R pressed while paused
+INPUT_QUIT = 64             # Q pressed while paused
+
+RECORDING_FORMAT = "TransporterSpielInput"
+RECORDING_VERSION = 1
+
+
+class InputRecording:
+    """
+    A Class holding the Player Input of a Game Round, one Byte of Input Flags per simulated Tick.
+
+    Together with the Seed of the Round, the Difficulty and the Simulation Settings, the Input
+    Flags determine the Round completely, so a Replay feeding them back reproduces it Tick by Tick.
+    Recordings are saved as a JSON Header Line followed by the zlib-compressed Input Flags, which
+    needs a few Bytes per Minute while the Player holds the same Keys.
+
+    Attributes:
+        __seed__ (int): Seed of the Random Generator of the Round.
+        __difficulty__ (GameDifficulty): Difficulty of the Round.
+        __settings__ (dict): Simulation Settings the Round depends on, e.g. the Tick Rate and the Screen Size.
+        __inputFlags__ (bytearray): The Input Flags of every Tick.
+        __result__ (dict): Outcome, Ticks and delivered Ore of the recorded Round, None until set.
+    """
+    __seed__: int
+    __difficulty__: GameDifficulty
+    __settings__: dict
+    __inputFlags__: bytearray
+    __result__: dict
+
+    def __init__(self, seed: int, difficulty: GameDifficulty, settings: dict, inputFlags: bytes = b"", result: dict = None):
+        """
+        Initialize an InputRecording.
+
+        Args:
+            seed (int): Seed of the Random Generator of the Round.
+            difficulty (GameDifficulty): Difficulty of the Round.
+            settings (dict): Simulation Settings the Round depends on, see getSimulationSettings.
+            inputFlags (bytes): Already recorded Input Flags, one Byte per Tick.
+            result (dict): Outcome of the recorded Round, if known.
+        """
+        self.__seed__ = seed
+        self.__difficulty__ = difficulty
+        self.__settings__ = settings
+        self.__inputFlags__ = bytearray(inputFlags)
+        self.__result__ = result
+
+    def append(self, inputFlags: int) -> None:
+        """
+        Record the Input Flags of the next Tick.
+        """
+        self.__inputFlags__.append(inputFlags)
+
+    def getInputFlags(self, tick: int) -> int:
+        """
+        Return the Input Flags of a Tick, no Input after the Recording ended.
+        """
+        if tick < len(self.__inputFlags__):
+            return self.__inputFlags__[tick]
+        return 0
+
+    def getTickCount(self) -> int:
+        return len(self.__inputFlags__)
+
+    def getSeed(self) -> int:
+        return self.__seed__
+
+    def getDifficulty(self) -> GameDifficulty:
+        return self.__difficulty__
+
+    def getSettings(self) -> dict:
+        return self.__settings__
+
+    def getResult(self) -> dict:
+        return self.__result__
+
+    def setResult(self, outcome: str, ticks: int, oreDelivered: float) -> None:
+        self.__result__ = {"outcome": outcome, "ticks": ticks, "oreDelivered": oreDelivered}
+
+    def save(self, path: str) -> None:
+        """
+        Write the Recording to a File.
+
+        Args:
+            path (str): Path of the Recording File.
+        """
+        header = {
+            "format": RECORDING_FORMAT,
+            "version": RECORDING_VERSION,
+            "seed": self.__seed__,
+            "difficulty": self.__difficulty__.toDictionary(),
+            "settings": self.__settings__,
+            "result": self.__result__,
+        }
+        with open(path, "wb") as file:
+            file.write(json.dumps(header).encode("utf-8") + b"\n")
+            file.write(zlib.compress(bytes(self.__inputFlags__), 9))
+
+    def __str__(self) -> str:
+        return f"{type(self).__name__} (seed={self.__seed__}, ticks={len(self.__inputFlags__)}, result={self.__result__})"
+
+
+def loadInputRecording(path: str) -> InputRecording:
+    """
+    Read a Recording written by InputRecording.save.
+
+    Args:
+        path (str): Path of the Recording File.
+
+    Returns:
+        InputRecording: The loaded Recording.
+
+    Raises:
+        ValueError: If the File is no Recording or has an unsupported Version.
+    """
+    with open(path, "rb") as file:
+        headerLine = file.readline()
+        body = file.read()
+    try:
+        header = json.loads(headerLine)
+    except ValueError:
+        raise ValueError(f"{path} is not an Input Recording")
+    if not isinstance(header, dict) or header.get("format") != RECORDING_FORMAT:
+        raise ValueError(f"{path} is not an Input Recording")
+    if header.get("version") != RECORDING_VERSION:
+        raise ValueError(f"Unsupported Input Recording Version {header.get('version')} in {path}")
+    return InputRecording(
+        seed=header["seed"],
+        difficulty=GameDifficulty(**header["difficulty"]),
+        settings=header["settings"],
+        inputFlags=zlib.decompress(body),
+        result=header.get("result")
+    )
\ No newline at end of file
@@ -0,0 +1,58 @@
+class RoundResult:
+    """
+    A Class holding the Result of a simulated Game Round.
+
+    Attributes:
+        __outcome__ (str): "won", "lost" or "timeout" if the Tick Limit was reached first.
+        __ticks__ (int): Number of simulated Ticks.
+        __seconds__ (float): Wall Clock Time the Simulation took.
+        __oreDelivered__ (float): Amount of Ore delivered during the Round.
+        __seed__ (int): Seed of the Round, to repeat it.
+    """
+    __outcome__: str
+    __ticks__: int
+    __seconds__: float
+    __oreDelivered__: float
+    __seed__: int
+
+    def __init__(self, outcome: str, ticks: int, seconds: float, oreDelivered: float, seed: int = None):
+        """
+        Initialize a RoundResult.
+
+        Args:
+            outcome (str): "won", "lost" or "timeout".
+            ticks (int): Number of simulated Ticks.
+            seconds (float): Wall Clock Time the Simulation took.
+            oreDelivered (float): Amount of Ore delivered during the Round.
+            seed (int): Seed of the Round, to repeat it.
+        """
+        self.__outcome__ = outcome
+        self.__ticks__ = ticks
+        self.__seconds__ = seconds
+        self.__oreDelivered__ = oreDelivered
+        self.__seed__ = seed
+
+    def getOutcome(self) -> str:
+        return self.__outcome__
+
+    def getTicks(self) -> int:
+        return self.__ticks__
+
+    def getSeconds(self) -> float:
+        return self.__seconds__
+
+    def getOreDelivered(self) -> float:
+        return self.__oreDelivered__
+
+    def getSeed(self) -> int:
+        return self.__seed__
+
+    def getTicksPerSecond(self) -> float:
+        return self.__ticks__ / self.__seconds__ if self.__seconds__ > 0 else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{type(self).__name__} (outcome={self.__outcome__}, ticks={self.__ticks__}, "
+            f"seconds={self.__seconds__:.3f}, ticksPerSecond={self.getTicksPerSecond():.0f}, "
+            f"oreDelivered={self.__oreDelivered__:.1f}, seed={self.__seed__})"
+        )
\ No newline at end of file
@@ -0,0 +1,48 @@
+class SimulationClock:
+    """
+    A Class measuring the Time of a Game Round in simulated Ticks instead of Wall Clock Time.
+
+    The Clock only advances when the Round simulates a Tick, so Timers based on it expire after the
+    same Number of Ticks in every Run, whatever the Frame Rate, a Pause or a headless Replay at
+    maximum Speed.
+
+    Attributes:
+        __tickRate__ (int): Simulation Ticks per Second.
+        __ticks__ (int): Number of Ticks simulated so far.
+    """
+    __tickRate__: int
+    __ticks__: int
+
+    def __init__(self, tickRate: int = 60):
+        """
+        Initialize a SimulationClock at Tick 0.
+
+        Args:
+            tickRate (int): Simulation Ticks per Second, used to convert Ticks into Milliseconds.
+        """
+        self.__tickRate__ = tickRate
+        self.__ticks__ = 0
+
+    def advance(self) -> None:
+        """
+        Advance the Clock by one Tick.
+        """
+        self.__ticks__ += 1
+
+    def reset(self) -> None:
+        self.__ticks__ = 0
+
+    def getTicks(self) -> int:
+        return self.__ticks__
+
+    def getMilliseconds(self) -> float:
+        """
+        Return the simulated Time since Tick 0, the Replacement for pygame.time.get_ticks in the Game Logic.
+        """
+        return self.__ticks__ * 1000 / self.__tickRate__
+
+    def getTickRate(self) -> int:
+        return self.__tickRate__
+
+    def __str__(self) -> str:
+        return f"{type(self).__name__} (ticks={self.__ticks__}, tickRate={self.__tickRate__})"
\ No newline at end of file
@@ -0,0 +1,81 @@
+from typing import Callable
+
+from Model.GameObjects.Base.ImageGameObject import ImageGameObject
+
+
+class TriggerZone:
+    """
+    A Class representing the Collision Circle of a Game Object as Zone that reacts to Activators entering it.
+
+    The TriggerZoneService calls onEnter in the Tick an Activator starts touching the Owner, onStay
+    every stayInterval Ticks while it keeps touching, and onExit in the Tick it stops touching.
+    An Activator that re-enters within stayInterval Ticks of its last Enter or Stay enters only once
+    the Interval passed.
+    Every Handler receives the Activator, a missing Handler ignores the Event.
+
+    Attributes:
+        __owner__ (ImageGameObject): The Game Object whose Collision Circle is the Zone.
+        __stayInterval__ (int): Number of Ticks between two Stay Events of an Activator.
+        __onEnter__ (Callable): Handler of the Enter Event, None to ignore it.
+        __onStay__ (Callable): Handler of the Stay Event, None to ignore it.
+        __onExit__ (Callable): Handler of the Exit Event, None to ignore it.
+        __priority__ (int): Registration Order in the TriggerZoneService, Zones touched in the same Tick handle their Events in this Order.
+    """
+    __owner__: ImageGameObject
+    __stayInterval__: int
+    __onEnter__: Callable
+    __onStay__: Callable
+    __onExit__: Callable
+    __priority__: int
+
+    def __init__(
+            self,
+            owner: ImageGameObject,
+            stayInterval: int = 10,
+            onEnter: Callable[[ImageGameObject], None] = None,
+            onStay: Callable[[ImageGameObject], None] = None,
+            onExit: Callable[[ImageGameObject], None] = None
+    ):
+        """
+        Initialize a TriggerZone.
+
+        Args:
+            owner (ImageGameObject): The Game Object whose Collision Circle is the Zone.
+            stayInterval (int): Minimum Number of Ticks between two Enter or Stay Events of an Activator, at least 1.
+            onEnter (Callable[[ImageGameObject], None]): Called with the Activator when it enters the Zone.
+            onStay (Callable[[ImageGameObject], None]): Called with the Activator every stayInterval Ticks inside the Zone.
+            onExit (Callable[[ImageGameObject], None]): Called with the Activator when it leaves the Zone.
+        """
+        self.__owner__ = owner
+        self.__stayInterval__ = max(1, stayInterval)
+        self.__onEnter__ = onEnter
+        self.__onStay__ = onStay
+        self.__onExit__ = onExit
+        self.__priority__ = 0
+
+    def enter(self, activator: ImageGameObject) -> None:
+        if self.__onEnter__ is not None:
+            self.__onEnter__(activator)
+
+    def stay(self, activator: ImageGameObject) -> None:
+        if self.__onStay__ is not None:
+            self.__onStay__(activator)
+
+    def exit(self, activator: ImageGameObject) -> None:
+        if self.__onExit__ is not None:
+            self.__onExit__(activator)
+
+    def getOwner(self) -> ImageGameObject:
+        return self.__owner__
+
+    def getStayInterval(self) -> int:
+        return self.__stayInterval__
+
+    def getPriority(self) -> int:
+        return self.__priority__
+
+    def setPriority(self, priority: int) -> None:
+        self.__priority__ = priority
+
+    def __str__(self) -> str:
+        return f"{type(self).__name__} (owner={type(self.__owner__).__name__}, stayInterval={self.__stayInterval__})"
\ No newline at end of file
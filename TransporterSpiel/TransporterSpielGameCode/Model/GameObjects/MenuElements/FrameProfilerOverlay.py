@@ -0,0 +1,113 @@
+import pygame
+
+from Model.GameObjects.Base.ImageGameObject import ImageGameObject
+from Services.FontRegistryService import getFontRegistry
+from Services.FrameProfilerService import FrameProfilerService, FRAME_PHASES
+
+
+class FrameProfilerOverlay(ImageGameObject):
+    """
+    A Class showing the Statistics of a FrameProfilerService in the Top Left Corner of the Game Area.
+
+    Shows the Frame Time Percentiles, the mean Time per Phase and a rolling Graph of the last Frame
+    Times, one Pixel Column per Frame, with Marks at 60 and 30 Frames per Second. The Image is only
+    rendered again every few Frames, so the Overlay hardly shows up in its own Measurements.
+
+    Inherits from:
+        ImageGameObject (Model.GameObjects.Base.ImageGameObject)
+
+    Attributes:
+        __frameProfiler__ (FrameProfilerService): The Profiler whose Statistics are shown.
+        __refreshInterval__ (int): Number of Frames between two Renderings of the Image.
+        __renderedFrameCount__ (int): Frame Count of the Profiler when the Image was last rendered.
+        __font__ (pygame.font.Font): The shared Font of the Text Lines.
+        __graphHeight__ (int): Height of the Frame Time Graph in Pixels.
+    """
+    __frameProfiler__: FrameProfilerService
+    __refreshInterval__: int
+    __renderedFrameCount__: int
+    __font__: pygame.font.Font
+    __graphHeight__: int
+
+    WIDTH = 300
+    PADDING = 6
+    BACKGROUND_COLOR = (0, 0, 0, 170)
+    TEXT_COLOR = (230, 230, 230)
+    GRAPH_COLOR = (90, 220, 90)
+    SLOW_FRAME_COLOR = (230, 80, 60)
+    MARK_COLOR = (120, 120, 120)
+
+    def __init__(self, screen: pygame.Surface, frameProfiler: FrameProfilerService, refreshInterval: int = 15, fontSize: int = 16, graphHeight: int = 60):
+        """
+        Initialize a FrameProfilerOverlay.
+
+        Args:
+            screen (pygame.Surface): The Screen Surface to draw the Overlay on.
+            frameProfiler (FrameProfilerService): The Profiler whose Statistics are shown.
+            refreshInterval (int): Number of Frames between two Renderings of the Image.
+            fontSize (int): Font Size of the Text Lines.
+            graphHeight (int): Height of the Frame Time Graph in Pixels.
+        """
+        self.__frameProfiler__ = frameProfiler
+        self.__refreshInterval__ = refreshInterval
+        self.__renderedFrameCount__ = -refreshInterval
+        self.__font__ = getFontRegistry().getFont(fontSize)
+        self.__graphHeight__ = graphHeight
+        super().__init__(
+            image=self.__renderImage__(),
+            screen=screen,
+            collision=False,
+            layer=2000,
+            identifier="frameProfilerOverlay"
+        )
+        self.setTopLeft((10, 10))
+
+    def update(self) -> None:
+        """
+        Render the Statistics again once the Refresh Interval has passed.
+        """
+        frameCount = self.__frameProfiler__.getFrameCount()
+        if frameCount - self.__renderedFrameCount__ >= self.__refreshInterval__:
+            self.__renderedFrameCount__ = frameCount
+            topLeft = self.getTopLeft()
+            self.setImage(self.__renderImage__())
+            self.setTopLeft(topLeft)
+
+    def __renderImage__(self) -> pygame.Surface:
+        """
+        Render the Text Lines and the Frame Time Graph onto a new translucent Surface.
+        """
+        profiler = self.__frameProfiler__
+        p50, p95, p99 = profiler.getFrameTimePercentiles()
+        phaseMeans = profiler.getPhaseMeans()
+        lines = [
+            f"F3 Profiler, last {profiler.getBufferedFrameCount()} Frames",
+            f"frame p50 {p50:.2f}  p95 {p95:.2f}  p99 {p99:.2f} ms",
+        ] + [f"{phase:<10} {phaseMeans[phase]:7.3f} ms" for phase in FRAME_PHASES]
+
+        lineHeight = self.__font__.get_linesize()
+        padding = self.PADDING
+        height = 2 * padding + len(lines) * lineHeight + padding + self.__graphHeight__
+        image = pygame.Surface((self.WIDTH, height), pygame.SRCALPHA)
+        image.fill(self.BACKGROUND_COLOR)
+        for index, line in enumerate(lines):
+            image.blit(self.__font__.render(line, True, self.TEXT_COLOR), (padding, padding + index * lineHeight))
+
+        # Rolling Graph of the newest Frames, scaled so 30 Frames per Second fit at least
+        graphTop = 2 * padding + len(lines) * lineHeight
+        graphBottom = graphTop + self.__graphHeight__
+        graphWidth = self.WIDTH - 2 * padding
+        frameTimes = profiler.getFrameTimes()[-graphWidth:]
+        scaleMilliseconds = max([1000 / 30] + frameTimes)
+        for markMilliseconds in (1000 / 60, 1000 / 30):
+            markY = graphBottom - round(markMilliseconds / scaleMilliseconds * self.__graphHeight__)
+            pygame.draw.line(image, self.MARK_COLOR, (padding, markY), (padding + graphWidth - 1, markY))
+        for offset, frameTime in enumerate(frameTimes):
+            barHeight = max(1, round(frameTime / scaleMilliseconds * self.__graphHeight__))
+            color = self.SLOW_FRAME_COLOR if frameTime > 1000 / 30 else self.GRAPH_COLOR
+            columnX = padding + offset
+            pygame.draw.line(image, color, (columnX, graphBottom - 1), (columnX, graphBottom - barHeight))
+        return image
+
+    def __str__(self) -> str:
+        return f"{type(self).__name__} (profiler={self.__frameProfiler__}, refreshInterval={self.__refreshInterval__})"
\ No newline at end of file
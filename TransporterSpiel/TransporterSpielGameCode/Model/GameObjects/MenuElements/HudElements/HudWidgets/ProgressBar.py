@@ -0,0 +1,164 @@
+import pygame
+
+from Model.GameObjects.Base.GameObjectContainer import GameObjectContainer
+from Model.GameObjects.Base.ImageGameObject import ImageGameObject
+from Model.GameObjects.Messages.TextGameObject import TextGameObject
+
+
+class ProgressBar(GameObjectContainer):
+    """
+    A Class representing a horizontal Progress Bar made up of a Background, a Fill and an optional Text Label.
+
+    The Fill Surface is allocated once in full Width. Each visible Width is shown through a Subsurface
+    of it, which shares the Pixels and is cached per Width, so updating the Bar never allocates or
+    fills Pixels. The Label is only re-rendered when the displayed Percentage changes.
+    Subclasses provide the current Progress by overriding getProgress().
+
+    Inherits from:
+        GameObjectContainer (Model.GameObjects.Base.GameObjectContainer) to manage the visual Elements.
+
+    Attributes:
+        __barMaxWidth__ (int): Width of the Bar when full.
+        __barHeight__ (int): Height of the Bar.
+        __fillSurface__ (pygame.Surface): Pre-allocated Fill in full Width.
+        __fillImages__ (dict[int, pygame.Surface]): Subsurfaces of the Fill, by Width.
+        __background__ (ImageGameObject): The Background showing the empty Bar.
+        __fill__ (ImageGameObject): The Fill showing the current Progress.
+        __label__ (TextGameObject): The Text Label, None if the Bar has no Label.
+        __labelFormat__ (str): Format String for the Label, receiving the Percentage as Integer.
+        __displayedWidth__ (int): Width of the currently shown Fill.
+        __displayedPercent__ (int): Percentage currently shown by the Label.
+    """
+    __barMaxWidth__: int
+    __barHeight__: int
+    __fillSurface__: pygame.Surface
+    __fillImages__: dict[int, pygame.Surface]
+    __background__: ImageGameObject
+    __fill__: ImageGameObject
+    __label__: TextGameObject
+    __labelFormat__: str
+    __displayedWidth__: int
+    __displayedPercent__: int
+
+    def __init__(
+            self,
+            screen: pygame.Surface,
+            xCoordinate: float,
+            yCoordinate: float,
+            width: int,
+            height: int,
+            fillColor: tuple,
+            backgroundColor: tuple = (255, 255, 255),
+            baseLayer: int = 100,
+            labelFormat: str = None,
+            fontSize: int = 20,
+            labelColor: tuple = (0, 0, 0),
+            identifierPrefix: str = "progressBar"
+    ):
+        """
+        Initialize a ProgressBar with its Background, Fill and optional Label.
+
+        Args:
+            screen (pygame.Surface): The Surface to render all Elements to.
+            xCoordinate (float): X-Coordinate of the Center of the Bar.
+            yCoordinate (float): Y-Coordinate of the Center of the Bar.
+            width (int): Width of the Bar when full.
+            height (int): Height of the Bar.
+            fillColor (tuple): RGB Color of the Fill.
+            backgroundColor (tuple): RGB Color of the empty Bar.
+            baseLayer (int): Layer of the Background, the Fill and Label are drawn above.
+            labelFormat (str): Format String for the Label, e.g. "{}% Fuel". None for no Label.
+            fontSize (int): Font Size of the Label.
+            labelColor (tuple): RGB Color of the Label.
+            identifierPrefix (str): Prefix for the Identifiers of the contained Objects.
+        """
+        super().__init__(
+            screen=screen,
+            xCoordinate=xCoordinate,
+            yCoordinate=yCoordinate,
+            baseLayer=baseLayer
+        )
+        self.__barMaxWidth__ = width
+        self.__barHeight__ = height
+
+        backgroundImage: pygame.Surface = pygame.Surface((width, height))
+        backgroundImage.fill(backgroundColor)
+        self.__background__ = ImageGameObject(
+            screen=screen,
+            xCoordinate=xCoordinate,
+            yCoordinate=yCoordinate,
+            layer=baseLayer,
+            image=backgroundImage,
+            identifier=f"{identifierPrefix}Background"
+        )
+        self.addGameObject(self.__background__)
+
+        self.__fillSurface__ = pygame.Surface((width, height))
+        self.__fillSurface__.fill(fillColor)
+        self.__fillImages__ = {}
+        self.__displayedWidth__ = 0
+        self.__fill__ = ImageGameObject(
+            screen=screen,
+            layer=baseLayer + 1,
+            collision=False,
+            image=self.__getFillImage__(0),
+            identifier=f"{identifierPrefix}Fill"
+        )
+        self.__fill__.setTopLeft(self.__background__.getTopLeft())
+        self.addGameObject(self.__fill__)
+
+        self.__labelFormat__ = labelFormat
+        self.__displayedPercent__ = -1
+        self.__label__ = None
+        if labelFormat is not None:
+            self.__label__ = TextGameObject(
+                message="",
+                xCoordinate=xCoordinate,
+                yCoordinate=yCoordinate,
+                fontSize=fontSize,
+                screen=screen,
+                layer=baseLayer + 2,
+                identifier=f"{identifierPrefix}Label",
+                color=labelColor
+            )
+            self.addGameObject(self.__label__)
+
+    def getProgress(self) -> float:
+        """
+        Return the current Progress between 0 and 1. Subclasses override this.
+        """
+        return 0.0
+
+    def update(self):
+        """
+        Show the current Progress, touching the Fill and Label only if their Appearance changes.
+        """
+        progress = min(max(self.getProgress(), 0.0), 1.0)
+
+        # Round the Width to an even Number to avoid visual Jitter
+        width = round(self.__barMaxWidth__ * progress / 2) * 2
+        if width != self.__displayedWidth__:
+            self.__displayedWidth__ = width
+            self.__fill__.setImage(self.__getFillImage__(width))
+            self.__fill__.setTopLeft(self.__background__.getTopLeft())
+
+        percent = int(progress * 100)
+        if self.__label__ is not None and percent != self.__displayedPercent__:
+            self.__displayedPercent__ = percent
+            self.__label__.updateMessage(self.__labelFormat__.format(percent))
+
+    def __getFillImage__(self, width: int) -> pygame.Surface:
+        """
+        Return the Subsurface of the Fill with the given Width, creating it on first Use.
+        """
+        fillImage = self.__fillImages__.get(width)
+        if fillImage is None:
+            fillImage = self.__fillSurface__.subsurface((0, 0, width, self.__barHeight__))
+            self.__fillImages__[width] = fillImage
+        return fillImage
+
+    def getHeight(self):
+        return self.__barHeight__
+
+    def getWidth(self):
+        return self.__barMaxWidth__
\ No newline at end of file
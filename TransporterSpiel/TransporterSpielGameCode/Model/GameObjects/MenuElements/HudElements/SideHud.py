@@ -1,167 +1,203 @@
-from typing import cast
-
-import pygame
-
-from Model.GameObjects.Base.GameObject import GameObject
-from Model.GameObjects.Base.GameObjectContainer import GameObjectContainer
-from Model.GameObjects.Buildings.OreMine import OreMine
-from Model.GameObjects.Buildings.OreUnloadStation import OreUnloadStation
-from Model.GameObjects.Base.ImageGameObject import ImageGameObject
-from Model.GameObjects.MenuElements.HudElements.HudWidgets.OreProgressBar import OreProgressBar
-from Model.GameObjects.Messages.TextGameObject import TextGameObject
-from Model.GameObjects.Vehicles.Helicopter import Helicopter
-from Model.GameObjects.Vehicles.OreTransport import OreTransport
-
-from Services.ConfigService import getConfig
-
-
-class SideHud(GameObjectContainer):
-    """
-    A Class representing the Side Heads-Up Display (HUD) in the Game.
-
-    Inherits from:
-        GameObjectContainer (Model.GameObjects.Base.GameObjectContainer):
-            Provides a Container for Game Objects including Layout and Layer Handling.
-
-    Attributes:
-        __gamePlayObjects__ (list[ImageGameObject]): List of GamePlay Objects tracked for status display.
-        __hudElements__ (list[ImageGameObject]): HUD UI Elements.
-        __bigFont__ (int): Font Size used for larger Text Entries.
-        __smallFont__ (int): Font Size used for smaller Text Entries.
-        __oreToCollect__ (float): Total Ore Goal for Win Condition.
-        __xOffset__ (int): X Coordinate Offset for HUD Alignment.
-    """
-    __gamePlayObjects__: list[ImageGameObject]
-    __hudElements__: list[ImageGameObject]
-    __bigFont__: int
-    __smallFont__: int
-    __oreToCollect__: float
-    __xOffset__:int
-
-    def __init__(
-            self,
-            screen: pygame.Surface,
-            gameObjects : list[ImageGameObject],
-            oreToCollect : float = 800,
-            baseLayer : int = 100
-    ):
-        """
-        Initialize the SideHud Object and create its visual Elements.
-
-        Args:
-            screen (pygame.Surface): Screen Surface to render to.
-            oreToCollect (float): Total Amount of Ore to be Collected.
-            gameObjects (list[ImageGameObject]): List of GamePlay Objects (e.g., Vehicles, Buildings).
-            baseLayer (int): Drawing Layer used as Base for HUD Elements.
-        """
-        config = getConfig()
-        screenConfig = config.getScreenConfig()
-        sideHudConfig = screenConfig.getHudConfig().getSideHudConfig()
-        super().__init__(
-            screen=screen,
-            baseLayer=baseLayer
-        )
-
-        screenWidth = screenConfig.getScreenWidth()
-        hudWidth: int = sideHudConfig.getWidth()
-        gameWidth: int = screenWidth - hudWidth
-
-        # Settings for toggling HUD parts
-        self.__bigFont__ = sideHudConfig.getBigFont()
-        self.__smallFont__ = sideHudConfig.getSmallFont()
-        self.__oreToCollect__ = oreToCollect
-        self.__xOffset__ = screenWidth - (hudWidth // 2)
-        self.__hudGameObjects__ = []
-        self.__hudTextObjects__ = []
-
-        self.__createSideHudElements__(baseLayer, gameObjects, gameWidth, hudWidth, sideHudConfig)
-
-    def update(self):
-        """
-        Update all HUD Elements with current Game Data from relevant GamePlay Objects.
-        """
-        helicopter: Helicopter = next(filter(lambda obj: isinstance(obj, Helicopter), self.__gamePlayObjects__), None)
-        oreTransport: OreTransport = next(filter(lambda obj: isinstance(obj, OreTransport), self.__gamePlayObjects__),None)
-        oreMine: OreMine = next(filter(lambda obj: isinstance(obj, OreMine), self.__gamePlayObjects__), None)
-        oreUnloadStation: OreUnloadStation = next(filter(lambda obj: isinstance(obj, OreUnloadStation), self.__gamePlayObjects__), None)
-
-        cast(TextGameObject, self.getGameObjectById("%OreGoalProgressText%")).updateMessage(f"Progress: {oreUnloadStation.getTotalResourceStored():.1f}/{self.__oreToCollect__:.1f} Ore")
-        cast(TextGameObject, self.getGameObjectById("%StolenAmountText%")).updateMessage(f"Helicopter Stole {helicopter.getStolenAmount():.1f} Ore")
-
-        cast(TextGameObject, self.getGameObjectById("%HeliStatusText%")).updateMessage(f"Heli Status: {helicopter.getStatus()}")
-        cast(TextGameObject, self.getGameObjectById("%HeliStatusText%")).updateMessage(f"Transport Ore: {oreTransport.getLoadedOreAmount():.1f}")
-        cast(TextGameObject, self.getGameObjectById("%DeliveredOreText%")).updateMessage(f"Delivered Ore: {oreUnloadStation.getTotalResourceStored():.1f}")
-        cast(TextGameObject, self.getGameObjectById("%OreLeftInMineText%")).updateMessage(f"Ore Left in Mine: {oreMine.getTotalResourceStored():.1f}")
-        cast(TextGameObject, self.getGameObjectById("%TransporterSpeed%")).updateMessage(f"Transporter Speed: {oreTransport.getSpeed() * 10:.1f} km/h")
-
-        for gameObject in self.getGameObjects():
-            gameObject.update()
-
-    def __createSideHudElements__(self, baseLayer, gameObjects, gameWidth, hudWidth, sideHudConfig):
-        """
-        Create and Add all Static HUD Components including Background, Divider,
-        Progress Bar and Status Text Fields.
-        """
-        hudBackground: pygame.Surface = pygame.Surface((hudWidth, gameWidth))
-        hudBackground.fill((50, 50, 50))
-        backgroundImage = ImageGameObject(
-            screen=self.__screen__,
-            xCoordinate=0,
-            yCoordinate=0,
-            layer=baseLayer,
-            collision=True,
-            image=hudBackground
-
-        )
-        backgroundImage.setTopLeft((gameWidth, 0))
-        self.addGameObject(backgroundImage)
-
-        # Draw the background and divider
-        dividerImage: pygame.Surface = pygame.Surface((2, gameWidth))
-        dividerImage.fill((200, 200, 200))
-        dividerImage: ImageGameObject = ImageGameObject(
-            screen=self.__screen__,
-            xCoordinate=0,
-            yCoordinate=0,
-            layer=baseLayer + 1,
-            collision=True,
-            image=dividerImage
-        )
-        dividerImage.setTopLeft((gameWidth, 0))
-        self.addGameObject(dividerImage)
-        self.__gamePlayObjects__ = gameObjects
-        oreUnloadStation = next(filter(lambda obj: isinstance(obj, OreUnloadStation), gameObjects), None)
-
-        # Progress towards ore goal
-        oreProgressBar = OreProgressBar(
-            screen=self.__screen__,
-            xCoordinate=self.__xOffset__,
-            yCoordinate=sideHudConfig.getYOffset(),
-            oreUnloadStation=oreUnloadStation,
-            oreToCollect=self.__oreToCollect__,
-            baseLayer=baseLayer + 10,
-        )
-        self.addGameObject(oreProgressBar)
-
-        verticalOffset: int = sideHudConfig.getYOffset() + oreProgressBar.getHeight() + sideHudConfig.getSmallTextSeparation()
-        textEntries = [
-            ("%OreGoalProgressText%", self.__bigFont__, sideHudConfig.getBigTextSeparation()),
-            ("%StolenAmountText%", self.__bigFont__, sideHudConfig.getBigTextSeparation()),
-            ("%HeliStatusText%", self.__smallFont__, sideHudConfig.getSmallTextSeparation()),
-            ("%TransportOreText%", self.__smallFont__, sideHudConfig.getSmallTextSeparation()),
-            ("%DeliveredOreText%", self.__smallFont__, sideHudConfig.getSmallTextSeparation()),
-            ("%OreLeftInMineText%", self.__smallFont__, sideHudConfig.getSmallTextSeparation()),
-            ("%TransporterSpeed%", self.__smallFont__, sideHudConfig.getBigTextSeparation())
-        ]
-        for text, fontSize, offset in textEntries:
-            textObj = TextGameObject(
-                message="",
-                identifier=text,
-                xCoordinate=self.__xOffset__,
-                yCoordinate=verticalOffset,
-                fontSize=fontSize,
-                screen=self.__screen__,
-                layer=baseLayer + 2
-            )
-            verticalOffset = verticalOffset + textObj.getHeight() + offset
-            self.addGameObject(textObj)
\ No newline at end of file
+from typing import Callable
+
+import pygame
+
+from Model.GameObjects.Base.GameObject import GameObject
+from Model.GameObjects.Base.GameObjectContainer import GameObjectContainer
+from Model.GameObjects.Buildings.OreMine import OreMine
+from Model.GameObjects.Game.EntityRegistry import EntityRegistry
+from Model.GameObjects.Game.GameDifficulty import GameDifficulty
+from Model.GameObjects.Buildings.OreUnloadStation import OreUnloadStation
+from Model.GameObjects.Base.ImageGameObject import ImageGameObject
+from Model.GameObjects.MenuElements.HudElements.HudWidgets.OreProgressBar import OreProgressBar
+from Model.GameObjects.Messages.TextGameObject import TextGameObject
+from Model.GameObjects.Vehicles.Helicopter import Helicopter
+from Model.GameObjects.Vehicles.OreTransport import OreTransport
+
+from Services.ConfigService import getConfig
+
+
+class SideHud(GameObjectContainer):
+    """
+    A Class representing the Side Heads-Up Display (HUD) in the Game.
+
+    Inherits from:
+        GameObjectContainer (Model.GameObjects.Base.GameObjectContainer):
+            Provides a Container for Game Objects including Layout and Layer Handling.
+
+    Attributes:
+        __entityRegistry__ (EntityRegistry): Registry of the GamePlay Objects tracked for status display.
+        __lineBindings__ (list[tuple[TextGameObject, GameObject, Callable[[], str]]]): Each Text Line with the
+            Object it displays and the Function formatting its Message.
+        __boundChangeCounts__ (dict[TextGameObject, int]): Change Count of the Source when each Line was last formatted.
+        __hudElements__ (list[ImageGameObject]): HUD UI Elements.
+        __bigFont__ (int): Font Size used for larger Text Entries.
+        __smallFont__ (int): Font Size used for smaller Text Entries.
+        __oreToCollect__ (float): Total Ore Goal for Win Condition.
+        __xOffset__ (int): X Coordinate Offset for HUD Alignment.
+    """
+    __entityRegistry__: EntityRegistry
+    __lineBindings__: list[tuple[TextGameObject, GameObject, Callable[[], str]]]
+    __boundChangeCounts__: dict[TextGameObject, int]
+    __hudElements__: list[ImageGameObject]
+    __bigFont__: int
+    __smallFont__: int
+    __oreToCollect__: float
+    __xOffset__:int
+
+    def __init__(
+            self,
+            screen: pygame.Surface,
+            entityRegistry : EntityRegistry,
+            oreToCollect : float = 800,
+            baseLayer : int = 100
+    ):
+        """
+        Initialize the SideHud Object and create its visual Elements.
+
+        Args:
+            screen (pygame.Surface): Screen Surface to render to.
+            oreToCollect (float): Total Amount of Ore to be Collected.
+            entityRegistry (EntityRegistry): Registry of the GamePlay Objects (e.g., Vehicles, Buildings).
+            baseLayer (int): Drawing Layer used as Base for HUD Elements.
+        """
+        config = getConfig()
+        screenConfig = config.getScreenConfig()
+        sideHudConfig = screenConfig.getHudConfig().getSideHudConfig()
+        super().__init__(
+            screen=screen,
+            baseLayer=baseLayer
+        )
+
+        screenWidth = screenConfig.getScreenWidth()
+        hudWidth: int = sideHudConfig.getWidth()
+        gameWidth: int = screenWidth - hudWidth
+
+        # Settings for toggling HUD parts
+        self.__bigFont__ = sideHudConfig.getBigFont()
+        self.__smallFont__ = sideHudConfig.getSmallFont()
+        self.__oreToCollect__ = oreToCollect
+        self.__xOffset__ = screenWidth - (hudWidth // 2)
+        self.__hudGameObjects__ = []
+        self.__hudTextObjects__ = []
+
+        self.__createSideHudElements__(baseLayer, entityRegistry, gameWidth, hudWidth, sideHudConfig)
+
+    def update(self):
+        """
+        Update all HUD Elements with current Game Data from relevant GamePlay Objects.
+
+        A Line is only formatted again when the Change Count of its Source Object changed,
+        and only re-rendered when the formatted Message differs (see TextGameObject.updateMessage).
+        """
+        for textObject, source, formatMessage in self.__lineBindings__:
+            changeCount = source.getChangeCount()
+            if changeCount != self.__boundChangeCounts__[textObject]:
+                self.__boundChangeCounts__[textObject] = changeCount
+                textObject.updateMessage(formatMessage())
+
+        for gameObject in self.getGameObjects():
+            gameObject.update()
+
+    def reset(self, difficulty: GameDifficulty):
+        """
+        Show the Ore Goal of the new Difficulty and format every Line again at the next Update.
+
+        The Lines keep their Text Objects, each is only re-rendered if its Message differs.
+
+        Args:
+            difficulty (GameDifficulty): Difficulty of the restarted Round.
+        """
+        self.__oreToCollect__ = difficulty.getOreToCollect()
+        for textObject in self.__boundChangeCounts__:
+            self.__boundChangeCounts__[textObject] = -1
+        super().reset(difficulty)
+
+    def __createSideHudElements__(self, baseLayer, entityRegistry, gameWidth, hudWidth, sideHudConfig):
+        """
+        Create and Add all Static HUD Components including Background, Divider,
+        Progress Bar and Status Text Fields.
+        """
+        hudBackground: pygame.Surface = pygame.Surface((hudWidth, gameWidth))
+        hudBackground.fill((50, 50, 50))
+        backgroundImage = ImageGameObject(
+            screen=self.__screen__,
+            xCoordinate=0,
+            yCoordinate=0,
+            layer=baseLayer,
+            collision=True,
+            image=hudBackground
+
+        )
+        backgroundImage.setTopLeft((gameWidth, 0))
+        self.addGameObject(backgroundImage)
+
+        # Draw the background and divider
+        dividerImage: pygame.Surface = pygame.Surface((2, gameWidth))
+        dividerImage.fill((200, 200, 200))
+        dividerImage: ImageGameObject = ImageGameObject(
+            screen=self.__screen__,
+            xCoordinate=0,
+            yCoordinate=0,
+            layer=baseLayer + 1,
+            collision=True,
+            image=dividerImage
+        )
+        dividerImage.setTopLeft((gameWidth, 0))
+        self.addGameObject(dividerImage)
+        self.__entityRegistry__ = entityRegistry
+        oreUnloadStation = entityRegistry.getFirst(OreUnloadStation)
+
+        # Progress towards ore goal
+        oreProgressBar = OreProgressBar(
+            screen=self.__screen__,
+            xCoordinate=self.__xOffset__,
+            yCoordinate=sideHudConfig.getYOffset(),
+            oreUnloadStation=oreUnloadStation,
+            oreToCollect=self.__oreToCollect__,
+            baseLayer=baseLayer + 10,
+        )
+        self.addGameObject(oreProgressBar)
+
+        verticalOffset: int = sideHudConfig.getYOffset() + oreProgressBar.getHeight() + sideHudConfig.getSmallTextSeparation()
+        textEntries = [
+            ("%OreGoalProgressText%", self.__bigFont__, sideHudConfig.getBigTextSeparation()),
+            ("%StolenAmountText%", self.__bigFont__, sideHudConfig.getBigTextSeparation()),
+            ("%HeliStatusText%", self.__smallFont__, sideHudConfig.getSmallTextSeparation()),
+            ("%TransportOreText%", self.__smallFont__, sideHudConfig.getSmallTextSeparation()),
+            ("%DeliveredOreText%", self.__smallFont__, sideHudConfig.getSmallTextSeparation()),
+            ("%OreLeftInMineText%", self.__smallFont__, sideHudConfig.getSmallTextSeparation()),
+            ("%TransporterSpeed%", self.__smallFont__, sideHudConfig.getBigTextSeparation())
+        ]
+        helicopter: Helicopter = entityRegistry.getFirst(Helicopter)
+        oreTransport: OreTransport = entityRegistry.getFirst(OreTransport)
+        oreMine: OreMine = entityRegistry.getFirst(OreMine)
+        lineSources = {
+            "%OreGoalProgressText%": (oreUnloadStation, lambda: f"Progress: {oreUnloadStation.getTotalResourceStored():.1f}/{self.__oreToCollect__:.1f} Ore"),
+            "%StolenAmountText%": (helicopter, lambda: f"Helicopter Stole {helicopter.getStolenAmount():.1f} Ore"),
+            "%HeliStatusText%": (helicopter, lambda: f"Heli Status: {helicopter.getStatus()}"),
+            "%TransportOreText%": (oreTransport, lambda: f"Transport Ore: {oreTransport.getLoadedOreAmount():.1f}"),
+            "%DeliveredOreText%": (oreUnloadStation, lambda: f"Delivered Ore: {oreUnloadStation.getTotalResourceStored():.1f}"),
+            "%OreLeftInMineText%": (oreMine, lambda: f"Ore Left in Mine: {oreMine.getTotalResourceStored():.1f}"),
+            "%TransporterSpeed%": (oreTransport, lambda: f"Transporter Speed: {oreTransport.getSpeed() * 10:.1f} km/h")
+        }
+        self.__lineBindings__ = []
+        self.__boundChangeCounts__ = {}
+
+        for text, fontSize, offset in textEntries:
+            textObj = TextGameObject(
+                message="",
+                identifier=text,
+                xCoordinate=self.__xOffset__,
+                yCoordinate=verticalOffset,
+                fontSize=fontSize,
+                screen=self.__screen__,
+                layer=baseLayer + 2
+            )
+            verticalOffset = verticalOffset + textObj.getHeight() + offset
+            self.addGameObject(textObj)
+
+            source, formatMessage = lineSources[text]
+            self.__lineBindings__.append((textObj, source, formatMessage))
+            # Force the first Update to format every Line
+            self.__boundChangeCounts__[textObj] = -1
\ No newline at end of file
@@ -0,0 +1,224 @@
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pygame
+
+from Services.AssetPackService import getAssetPack
+from Services.RotationCacheService import getRotationCache
+
+ASSET_LOADER_INSTANCE = None
+
+
+class AssetTiming:
+    """
+    A Class recording when an Asset was requested, loaded and awaited.
+
+    Attributes:
+        __key__ (str): The Key of the Asset, e.g. "image:helicopter".
+        __submitTime__ (float): perf_counter Seconds when the Asset was requested.
+        __startTime__ (float): perf_counter Seconds when the Worker started loading it, None while queued.
+        __endTime__ (float): perf_counter Seconds when the Worker finished loading it, None while loading.
+        __waitTime__ (float): Seconds the Game blocked on the Asset, 0.0 if it was ready when needed.
+    """
+    __key__: str
+    __submitTime__: float
+    __startTime__: float
+    __endTime__: float
+    __waitTime__: float
+
+    def __init__(self, key: str):
+        self.__key__ = key
+        self.__submitTime__ = time.perf_counter()
+        self.__startTime__ = None
+        self.__endTime__ = None
+        self.__waitTime__ = 0.0
+
+    def start(self) -> None:
+        self.__startTime__ = time.perf_counter()
+
+    def finish(self) -> None:
+        self.__endTime__ = time.perf_counter()
+
+    def addWaitTime(self, seconds: float) -> None:
+        self.__waitTime__ += seconds
+
+    def getKey(self) -> str:
+        return self.__key__
+
+    def isFinished(self) -> bool:
+        return self.__endTime__ is not None
+
+    def getQueueMs(self) -> float:
+        """
+        Return the Milliseconds the Asset waited for the Worker, None while queued.
+        """
+        return None if self.__startTime__ is None else (self.__startTime__ - self.__submitTime__) * 1000
+
+    def getLoadMs(self) -> float:
+        """
+        Return the Milliseconds the Worker spent loading the Asset, None while not finished.
+        """
+        return None if self.__endTime__ is None else (self.__endTime__ - self.__startTime__) * 1000
+
+    def getWaitMs(self) -> float:
+        return self.__waitTime__ * 1000
+
+    def __str__(self) -> str:
+        loadMs = self.getLoadMs()
+        loaded = "pending" if loadMs is None else f"{loadMs:.2f} ms"
+        return f"{self.__key__}: load {loaded}, waited {self.getWaitMs():.2f} ms"
+
+
+class AssetLoaderService:
+    """
+    A Class loading Images and pre-rendering static Text on a Worker Thread.
+
+    The Game submits its Assets before the Difficulty Selection Screen and the Worker decodes, scales
+    and pre-rotates them while the Player enters the Difficulty, so the Window appears without waiting
+    for them. Every Submission returns a Future; waitFor returns its Result and only blocks, and counts
+    the blocked Time, if the Asset is still pending when it is needed. The Worker processes the Assets in
+    Submission Order, so a Job may depend on Futures submitted before it.
+
+    The Worker must not touch Objects the Game Loop uses at the same Time: a Round waits until the
+    Rotation Cache is filled before it rotates any Image, and Text is rendered with private Fonts of the
+    Worker, as a pygame Font must not render in two Threads at once.
+
+    Attributes:
+        __executor__ (ThreadPoolExecutor): The single Worker Thread, created on the first Submission.
+        __timings__ (dict[Future, AssetTiming]): The Timing of every submitted Asset by its Future.
+        __texts__ (dict[tuple[str, int, tuple], Future]): Pre-rendered Text Surfaces not taken yet, by Message, Font Size and Color.
+        __fonts__ (dict[int, pygame.font.Font]): The private Fonts of the Worker by Size.
+    """
+    __executor__: ThreadPoolExecutor
+    __timings__: dict[Future, AssetTiming]
+    __texts__: dict[tuple[str, int, tuple], Future]
+    __fonts__: dict[int, pygame.font.Font]
+
+    def __init__(self):
+        """
+        Initialize an AssetLoaderService without Worker Thread.
+        """
+        self.__executor__ = None
+        self.__timings__ = {}
+        self.__texts__ = {}
+        self.__fonts__ = {}
+
+    def submit(self, key: str, loader, *arguments) -> Future:
+        """
+        Load an Asset on the Worker Thread and record its Timing.
+
+        Args:
+            key (str): Name of the Asset in the Timings.
+            loader (Callable): Function loading the Asset, called with the Arguments on the Worker.
+            *arguments: Arguments of the Loader.
+
+        Returns:
+            Future: The Future of the Loader Result.
+        """
+        if self.__executor__ is None:
+            self.__executor__ = ThreadPoolExecutor(max_workers=1, thread_name_prefix="AssetLoader")
+        timing = AssetTiming(key)
+
+        def load():
+            timing.start()
+            try:
+                return loader(*arguments)
+            finally:
+                timing.finish()
+
+        future = self.__executor__.submit(load)
+        self.__timings__[future] = timing
+        return future
+
+    def loadImage(self, name: str, assetDirectory: str, fileName: str, size: tuple[int, int]) -> Future:
+        """
+        Load a scaled Image in the Display Format on the Worker, see AssetPackService.loadImage.
+        """
+        return self.submit(f"image:{name}", getAssetPack().loadImage, assetDirectory, fileName, size)
+
+    def prewarmRotations(self, name: str, imageFuture: Future) -> Future:
+        """
+        Fill the Rotation Cache with every Rotation of an Image on the Worker, after the Image is loaded.
+        """
+        return self.submit(f"rotations:{name}", lambda: getRotationCache().prewarm(imageFuture.result()))
+
+    def prerenderText(self, message: str, fontSize: int, color: tuple) -> None:
+        """
+        Render a static Text on the Worker, unless the same Text is already pre-rendered and not taken.
+
+        Args:
+            message (str): The Text.
+            fontSize (int): Size of the pygame Default Font, as in TextGameObject.
+            color (tuple): RGB Color of the Text.
+        """
+        textKey = (message, fontSize, tuple(color))
+        if textKey in self.__texts__:
+            return
+        font = self.__fonts__.get(fontSize)
+        if font is None:
+            # Loaded here, as loading Fonts is not thread-safe either
+            font = pygame.font.Font(None, fontSize)
+            self.__fonts__[fontSize] = font
+        self.__texts__[textKey] = self.submit(f"text:{fontSize}:{message}", font.render, message, True, textKey[2])
+
+    def takeText(self, message: str, fontSize: int, color: tuple) -> pygame.Surface:
+        """
+        Take a pre-rendered Text Surface, which then belongs to the Caller.
+
+        Returns:
+            pygame.Surface | None: The Surface, or None if the Text was not pre-rendered.
+        """
+        future = self.__texts__.pop((message, fontSize, tuple(color)), None)
+        if future is None:
+            return None
+        return self.waitFor(future)
+
+    def waitFor(self, future: Future):
+        """
+        Return the Result of a submitted Asset, blocking only if it is still pending.
+
+        Args:
+            future (Future): The Future returned by the Submission.
+
+        Returns:
+            The Result of the Loader. Exceptions of the Loader are raised here.
+        """
+        if future.done():
+            return future.result()
+        start = time.perf_counter()
+        result = future.result()
+        self.__timings__[future].addWaitTime(time.perf_counter() - start)
+        return result
+
+    def getTimings(self) -> list[AssetTiming]:
+        return list(self.__timings__.values())
+
+    def getPendingCount(self) -> int:
+        return sum(not timing.isFinished() for timing in self.__timings__.values())
+
+    def shutdown(self) -> None:
+        """
+        Stop the Worker Thread, dropping Assets that did not start loading yet.
+        """
+        if self.__executor__ is not None:
+            self.__executor__.shutdown(wait=True, cancel_futures=True)
+            self.__executor__ = None
+        self.__texts__.clear()
+
+    def __str__(self) -> str:
+        loadMs = sum(timing.getLoadMs() or 0.0 for timing in self.__timings__.values())
+        waitMs = sum(timing.getWaitMs() for timing in self.__timings__.values())
+        return f"{type(self).__name__} (assets={len(self.__timings__)}, pending={self.getPendingCount()}, loadMs={loadMs:.1f}, waitMs={waitMs:.1f})"
+
+
+def getAssetLoader() -> AssetLoaderService:
+    """
+    Retrieve the process-wide AssetLoaderService Instance, creating it on first Use.
+
+    Returns:
+        AssetLoaderService: The shared Asset Loader.
+    """
+    global ASSET_LOADER_INSTANCE
+    if ASSET_LOADER_INSTANCE is None:
+        ASSET_LOADER_INSTANCE = AssetLoaderService()
+    return ASSET_LOADER_INSTANCE
\ No newline at end of file
@@ -0,0 +1,256 @@
+import json
+import mmap
+import os
+import struct
+import zlib
+
+import pygame
+
+from Services.ConfigService import getConfig
+
+ASSET_PACK_INSTANCE = None
+
+ASSET_PACK_MAGIC = b"TSASSETS"
+ASSET_PACK_VERSION = 1
+# Pixel Data starts at Multiples of this, so every Row of every Image is aligned in the Mapping
+ASSET_PACK_ALIGNMENT = 64
+# Pixel Formats of pygame.image.tobytes and frombuffer by the Channel Masks of a 32 Bit Surface
+PIXEL_FORMATS_BY_MASKS = {
+    (0xff0000, 0xff00, 0xff, 0xff000000): "BGRA",
+    (0xff, 0xff00, 0xff0000, 0xff000000): "RGBA",
+}
+
+
+def getDisplayPixelFormat() -> str:
+    """
+    Return the Byte Order of the Pixels convert_alpha produces for the current Display, "RGBA" if it has none of the known ones.
+    """
+    converted = pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha()
+    return PIXEL_FORMATS_BY_MASKS.get(tuple(converted.get_masks()), "RGBA")
+
+
+def getAssetKey(fileName: str, size: tuple[int, int]) -> str:
+    return f"{fileName}@{size[0]}x{size[1]}"
+
+
+def loadScaledImage(assetDirectory: str, fileName: str, size: tuple[int, int]) -> pygame.Surface:
+    """
+    Decode an Image File, convert it to the Display Format and scale it, the Work the Asset Pack saves at Startup.
+    """
+    return pygame.transform.scale(pygame.image.load(os.path.join(assetDirectory, fileName)).convert_alpha(), size)
+
+
+def getFileChecksum(path: str) -> int:
+    with open(path, "rb") as file:
+        return zlib.crc32(file.read())
+
+
+def buildAssetPack(path: str, assetDirectory: str, assets) -> int:
+    """
+    Write the scaled Images in the Pixel Format of the current Display into a single indexed Asset Pack File.
+
+    The File starts with the Magic, the Length of the JSON Index and the Index itself, followed by the
+    raw Pixel Data of every Image at aligned Offsets. The Index stores Offset, Size and the Checksum of
+    the Source File of every Image, keyed by File Name and Size, so Images scaled to different Sizes,
+    e.g. for different Screen Profiles, can share one Pack. Needs an initialized Display.
+
+    Args:
+        path (str): Path of the Asset Pack File.
+        assetDirectory (str): Directory of the Source Images.
+        assets (Iterable[tuple[str, tuple[int, int]]]): File Name and scaled Size of every Image.
+
+    Returns:
+        int: Size of the written File in Bytes.
+    """
+    pixelFormat = getDisplayPixelFormat()
+    entries = {}
+    blobs = []
+    dataSize = 0
+    for fileName, size in assets:
+        key = getAssetKey(fileName, size)
+        if key in entries:
+            continue
+        pixels = pygame.image.tobytes(loadScaledImage(assetDirectory, fileName, size), pixelFormat)
+        entries[key] = {
+            "offset": dataSize,
+            "width": size[0],
+            "height": size[1],
+            "sourceChecksum": getFileChecksum(os.path.join(assetDirectory, fileName)),
+        }
+        blobs.append(pixels + bytes(-len(pixels) % ASSET_PACK_ALIGNMENT))
+        dataSize += len(blobs[-1])
+
+    index = json.dumps({"version": ASSET_PACK_VERSION, "pixelFormat": pixelFormat, "entries": entries}).encode("utf-8")
+    headerSize = len(ASSET_PACK_MAGIC) + 4 + len(index)
+    padding = bytes(-headerSize % ASSET_PACK_ALIGNMENT)
+    # Write next to the Pack and replace it at once, so an interrupted Build never leaves a partial Pack
+    temporaryPath = f"{path}.tmp"
+    try:
+        with open(temporaryPath, "wb") as file:
+            file.write(ASSET_PACK_MAGIC + struct.pack("<I", len(index)) + index + padding)
+            for blob in blobs:
+                file.write(blob)
+        os.replace(temporaryPath, path)
+    finally:
+        if os.path.exists(temporaryPath):
+            os.remove(temporaryPath)
+    return headerSize + len(padding) + dataSize
+
+
+class AssetPackService:
+    """
+    A Class providing scaled Images from a memory-mapped Asset Pack built by buildAssetPack.
+
+    The Surfaces are created with pygame.image.frombuffer directly on the mapped Pages, so an Image
+    from the Pack needs neither Decoding nor Scaling, and Processes mapping the same Pack share its
+    Pages. Images missing in the Pack, or whose Source File changed since the Pack was built, are
+    decoded and scaled as before, just like all Images if the Pack is truncated or corrupt. The Mapping stays open for the Lifetime of the Process, as the
+    Surfaces reference it.
+
+    Attributes:
+        __path__ (str): Path of the Asset Pack File.
+        __mapping__ (mmap.mmap): The read-only Mapping of the Pack, None if no valid Pack exists.
+        __entries__ (dict[str, dict]): Index Entry of every packed Image by Asset Key.
+        __pixelFormat__ (str): Byte Order of the packed Pixels, see PIXEL_FORMATS_BY_MASKS.
+        __dataOffset__ (int): Offset of the Pixel Data in the File.
+        __hits__ (int): Number of Images loaded from the Pack.
+        __misses__ (int): Number of Images decoded from their Source File.
+    """
+    __path__: str
+    __mapping__: mmap.mmap
+    __entries__: dict[str, dict]
+    __pixelFormat__: str
+    __dataOffset__: int
+    __hits__: int
+    __misses__: int
+
+    def __init__(self, path: str):
+        """
+        Initialize an AssetPackService and map the Pack, if a valid one exists at the Path.
+
+        Args:
+            path (str): Path of the Asset Pack File.
+        """
+        self.__path__ = path
+        self.__mapping__ = None
+        self.__entries__ = {}
+        self.__pixelFormat__ = None
+        self.__dataOffset__ = 0
+        self.__hits__ = 0
+        self.__misses__ = 0
+        self.__open__()
+
+    def loadImage(self, assetDirectory: str, fileName: str, size: tuple[int, int]) -> pygame.Surface:
+        """
+        Return an Image scaled to the given Size in the Display Format, from the Pack if possible.
+
+        Args:
+            assetDirectory (str): Directory of the Source Image.
+            fileName (str): File Name of the Source Image.
+            size (tuple[int, int]): Width and Height of the scaled Image.
+
+        Returns:
+            pygame.Surface: The scaled Image. Packed Images reference the Mapping and must not be drawn on.
+        """
+        entry = self.__entries__.get(getAssetKey(fileName, size))
+        pixels = None
+        if isinstance(entry, dict) and entry.get("sourceChecksum") == getFileChecksum(os.path.join(assetDirectory, fileName)):
+            pixels = self.__getPixels__(entry, size)
+        if pixels is not None:
+            image = pygame.image.frombuffer(pixels, size, self.__pixelFormat__)
+            self.__hits__ += 1
+            if self.__pixelFormat__ != getDisplayPixelFormat():
+                # Packed for another Display, converting copies the Pixels but still saves Decoding and Scaling
+                return image.convert_alpha()
+            return image
+        self.__misses__ += 1
+        return loadScaledImage(assetDirectory, fileName, size)
+
+    def isMapped(self) -> bool:
+        return self.__mapping__ is not None
+
+    def getHits(self) -> int:
+        return self.__hits__
+
+    def getMisses(self) -> int:
+        return self.__misses__
+
+    def __getPixels__(self, entry: dict, size: tuple[int, int]) -> memoryview:
+        """
+        Return the mapped Pixels of an Index Entry, None if they lie outside the mapped File, e.g. of a truncated Pack.
+        """
+        width, height = size
+        offset = entry.get("offset")
+        if not isinstance(offset, int) or offset < 0:
+            return None
+        start = self.__dataOffset__ + offset
+        end = start + width * height * 4
+        if end > self.__mapping__.size():
+            print(f"{self.__path__} is truncated, loading the Source Images of the missing Pixels.")
+            return None
+        return memoryview(self.__mapping__)[start:end]
+
+    def __open__(self) -> None:
+        """
+        Map the Pack and read its Index. A missing, foreign, outdated or corrupt File leaves the Service without Pack.
+        """
+        if not os.path.isfile(self.__path__):
+            return
+        try:
+            with open(self.__path__, "rb") as file:
+                mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as error:
+            # mmap raises ValueError for an empty File
+            print(f"Cannot map {self.__path__} ({error}), loading the Source Images.")
+            return
+        magicSize = len(ASSET_PACK_MAGIC)
+        if mapping.size() < magicSize + 4 or mapping[:magicSize] != ASSET_PACK_MAGIC:
+            print(f"{self.__path__} is not an Asset Pack, loading the Source Images.")
+            mapping.close()
+            return
+        indexSize = struct.unpack_from("<I", mapping, magicSize)[0]
+        try:
+            # json.JSONDecodeError and the UnicodeDecodeError of a damaged Index are both ValueErrors
+            index = json.loads(mapping[magicSize + 4:magicSize + 4 + indexSize])
+        except ValueError as error:
+            print(f"Corrupt Index in {self.__path__} ({error}), loading the Source Images.")
+            mapping.close()
+            return
+        if not isinstance(index, dict) or not isinstance(index.get("entries"), dict) or index.get("pixelFormat") not in PIXEL_FORMATS_BY_MASKS.values():
+            print(f"Corrupt Index in {self.__path__}, loading the Source Images.")
+            mapping.close()
+            return
+        if index.get("version") != ASSET_PACK_VERSION:
+            print(f"Unsupported Asset Pack Version {index.get('version')} in {self.__path__}, loading the Source Images.")
+            mapping.close()
+            return
+        headerSize = magicSize + 4 + indexSize
+        self.__dataOffset__ = headerSize + (-headerSize % ASSET_PACK_ALIGNMENT)
+        self.__entries__ = index["entries"]
+        self.__pixelFormat__ = index["pixelFormat"]
+        self.__mapping__ = mapping
+
+    def __str__(self) -> str:
+        return f"{type(self).__name__} (path={self.__path__}, mapped={self.isMapped()}, images={len(self.__entries__)}, hits={self.__hits__}, misses={self.__misses__})"
+
+
+def getAssetPackPath() -> str:
+    """
+    Return the configured Path of the Asset Pack, relative Paths are resolved against the Game Directory.
+    """
+    path = getConfig().getRenderConfig().getAssetPack()
+    gameDirectory = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(gameDirectory, path)
+
+
+def getAssetPack() -> AssetPackService:
+    """
+    Retrieve the process-wide AssetPackService Instance, mapping the configured Pack on first Use.
+
+    Returns:
+        AssetPackService: The shared Asset Pack.
+    """
+    global ASSET_PACK_INSTANCE
+    if ASSET_PACK_INSTANCE is None:
+        ASSET_PACK_INSTANCE = AssetPackService(getAssetPackPath())
+    return ASSET_PACK_INSTANCE
\ No newline at end of file
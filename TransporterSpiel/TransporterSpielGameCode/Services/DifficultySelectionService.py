@@ -1,340 +1,467 @@
-import pygame
-
-from Model.GameObjects.Base.ImageGameObject import ImageGameObject
-from Model.GameObjects.MenuElements.BorderBox import BorderOnlySurfaceFactory
-from Model.GameObjects.Messages.ErrorMessage import ErrorTextGameObject
-from Model.GameObjects.Game.GameDifficulty import GameDifficulty
-from Model.GameObjects.Messages.TextGameObject import TextGameObject
-from Model.GameObjects.Exceptions.QuitException import QuitException
-from Services.ConfigService import getConfig
-
-
-def getDefaultFields(presetValues) -> list[tuple[str, str]]:
-    """
-    Generate a list of default fields with their corresponding preset values.
-
-    Args:
-        presetValues (dict[str, str]): Preset values for each field.
-
-    Returns:
-        list[tuple[str, str]]: List of field names and their corresponding values.
-    """
-    return [
-        ("Total Ore", presetValues["Total Ore"]),
-        ("Percentage to Collect", presetValues["Percentage to Collect"]),
-        ("Ore to Collect", presetValues["Ore to Collect"]),
-        ("Transporter Capacity", presetValues["Transporter Capacity"]),
-        ("Fuel Consumption", presetValues["Fuel Consumption"]),
-        ("Helicopter Max Speed", presetValues["Helicopter Max Speed"]),
-        ("Transporter Max Speed", presetValues["Transporter Max Speed"])
-    ]
-
-class DifficultySelectionService:
-    """
-    A Class to manage the Difficulty Selection Screen, allowing users to input and confirm game difficulty settings.
-
-    Attributes:
-        __screen__ (pygame.display): The Pygame display surface.
-        __clock__ (pygame.time.Clock): The Pygame clock object.
-        __smallFont__ (int): Font size for small text.
-        __bigFont__ (int): Font size for large text.
-        __fields__ (list[tuple[str, str]]): List of field labels and their current values.
-        __lastInputFieldMessage__ (TextGameObject): The last input field message displayed.
-        __inputFields__ (list[ImageGameObject]): List of input field game objects.
-        __gameDifficulty__ (GameDifficulty): The configured game difficulty object.
-        __presetValues__ (dict[str, str]): Preset values for each field.
-        __inputActive__ (bool): Flag indicating if input is currently active.
-        __currentField__ (int): Index of the currently active input field.
-        __confirmMode__ (bool): Flag indicating if the confirmation mode is active.
-    """
-    __screen__ : pygame.display
-    __clock__ : pygame.time.Clock
-    __smallFont__ : int
-    __bigFont__ : int
-    __fields__: list[tuple[str, str]]
-    __lastInputFieldMessage__: TextGameObject
-    __inputFields__: list[ImageGameObject]
-    __gameDifficulty__: GameDifficulty
-
-    __presetValues__: dict[str, str]
-    __inputActive__: bool
-    __currentField__: int
-    __confirmMode__: bool
-
-    def __init__(self, screen : pygame, clock : pygame.time.Clock):
-        """
-        Initialize the DifficultySelectionService with the given screen and clock.
-
-        Args:
-            screen (pygame.Surface): The Pygame display surface.
-            clock (pygame.time.Clock): The Pygame clock object.
-        """
-        config = getConfig()
-        difficultySelectionConfig = config.getScreenConfig().getHudConfig().getDifficultySelectionConfig()
-        difficultyConfig = config.getGameConfig().getDifficultyConfig()
-        self.__screenWidth__ = config.getScreenConfig().getScreenWidth()
-        self.__presetValues__ = {
-            "Total Ore": str(difficultyConfig.getTotalOre()),
-            "Percentage to Collect": str(difficultyConfig.getPercentageToCollect()),
-            "Ore to Collect": str(difficultyConfig.getTotalOre() * difficultyConfig.getPercentageToCollect()/100),
-            "Transporter Capacity": str(difficultyConfig.getTransporterCapacity()),
-            "Fuel Consumption": str(difficultyConfig.getFuelConsumption()),
-            "Helicopter Max Speed": str(difficultyConfig.getHelicopterMaxSpeed()),
-            "Transporter Max Speed": str(difficultyConfig.getTransporterMaxSpeed())
-        }
-        self.__screen__ = screen
-        self.__clock__ = clock
-        self.__smallFont__ = difficultySelectionConfig.getSmallFont()
-        self.__bigFont__ = difficultySelectionConfig.getBigFont()
-        self.__fields__ = getDefaultFields(self.__presetValues__)
-        self.__initInputFields__()
-
-    def selectDifficulty(self) -> GameDifficulty:
-        """
-        Launch the Difficulty Selection Screen and handle user input.
-
-        Returns:
-            GameDifficulty: The configured game difficulty object.
-        """
-        self.__currentField__ = 0
-        self.__inputActive__ = True
-        self.__confirmMode__ = False
-        self.__resetInputFields__()
-
-        while self.__inputActive__:
-            self.__updateFieldValues__()
-
-            self.__screen__.fill((0, 0, 0))
-            if self.__currentField__ == 2:
-                self.__currentField__ += 1
-                continue
-            if not self.__confirmMode__:
-                self.__drawInputFields__()
-            else:
-                self.__drawConfirmFields__()
-
-            pygame.display.flip()
-            self.__handleInput__()
-
-        return self.__gameDifficulty__
-
-    def __resetInputFields__(self):
-        """
-        Reset the input fields to their default preset values.
-        """
-        self.__fields__ = getDefaultFields(self.__presetValues__)
-
-    def __updateFieldValues__(self):
-        """
-        Update the 'Ore to Collect' field based on 'Total Ore' and 'Percentage to Collect' inputs.
-        """
-        try:
-            totalOre = float(self.__fields__[0][1])
-        except ValueError as e:
-            totalOre = 0
-            if totalOre < 500:
-                totalOre = 500
-            if totalOre > 10000:
-                totalOre = 10000
-        try:
-            percentageToCollect = float(self.__fields__[1][1])
-        except ValueError as e:
-            percentageToCollect = 0
-        if percentageToCollect < 0:
-            percentageToCollect = 0
-        elif percentageToCollect > 100:
-            percentageToCollect = 100
-        newOreToCollect: str = str(int(percentageToCollect * totalOre / 100))
-        self.__presetValues__["Ore to Collect"] = newOreToCollect
-        self.__fields__[2] = ("Ore to Collect", str(newOreToCollect))
-
-    def __handleInput__(self):
-        """
-        Handle user input events for navigating and editing fields, confirming settings, or quitting.
-        """
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                raise QuitException()
-
-            if event.type == pygame.KEYDOWN:
-                if not self.__confirmMode__:
-
-                    if event.key == pygame.K_RETURN:
-                        # If no change was made, use the preset value
-                        if self.__fields__[self.__currentField__][1] == self.__presetValues__[self.__fields__[self.__currentField__][0]]:
-                            if self.__currentField__ < len(self.__fields__) - 1:
-                                self.__currentField__ += 1
-                            else:
-                                self.__confirmMode__ = True
-                        else:
-                            if self.__currentField__ < len(self.__fields__) - 1:
-                                self.__currentField__ += 1
-                            else:
-                                self.__confirmMode__ = True
-                    elif event.key == pygame.K_BACKSPACE:
-                        label, text = self.__fields__[self.__currentField__]
-                        self.__fields__[self.__currentField__] = (label, text[:-1])
-                    elif event.key == pygame.K_ESCAPE:
-                        self.__confirmMode__ = True
-                    else:
-                        label, text = self.__fields__[self.__currentField__]
-                        self.__fields__[self.__currentField__] = (label, text + event.unicode)
-                else:
-                    if event.key == pygame.K_RETURN:
-                        # Confirm and create difficulty
-                        try:
-                            self.__createGameDifficultyFromFields__()
-                        except ValueError:
-                            error: ErrorTextGameObject = ErrorTextGameObject(
-                                screen=self.__screen__,
-                                message="Invalid input! Please enter valid numbers."
-                            )
-                            error.draw()
-
-                            self.__resetInputFields__()
-                            self.__currentField__ = 0
-                            self.__confirmMode__ = False
-
-                    if event.key == pygame.K_ESCAPE:
-                        self.__resetInputFields__()
-                        self.__currentField__ = 0
-                        self.__confirmMode__ = False
-                    if event.key == pygame.K_q:
-                        raise QuitException()
-        return self.__currentField__
-
-    def __createGameDifficultyFromFields__(self):
-        """
-        Create a GameDifficulty object from the current field values and deactivate input.
-        """
-        print(self.__fields__)
-        totalOre = int(self.__fields__[0][1])
-        percentageToCollect = float(self.__fields__[1][1])
-        transporterCapacity = float(self.__fields__[3][1])
-        fuelConsumption = float(self.__fields__[4][1])
-        helicopterMaxSpeed = float(self.__fields__[5][1])
-        transporterMaxSpeed = float(self.__fields__[6][1])
-        self.__gameDifficulty__ = GameDifficulty(
-            percentageToCollect=percentageToCollect,
-            totalOre=totalOre,
-            transporterCapacity=transporterCapacity,
-            fuelConsumption=fuelConsumption,
-            helicopterMaxSpeed=helicopterMaxSpeed,
-            transporterMaxSpeed=transporterMaxSpeed
-        )
-        self.__inputActive__ = False
-
-    def __drawConfirmFields__(self):
-        """
-        Draw the confirmation screen displaying all current settings and instructions.
-        """
-        # Confirm screen
-        textMessage: TextGameObject = TextGameObject(
-            screen=self.__screen__,
-            message="Confirm the following settings?",
-            xCoordinate=self.__screenWidth__ / 2,
-            yCoordinate=50,
-            fontSize=self.__smallFont__,
-        )
-        textMessage.draw()
-        for idx, (label, text) in enumerate(self.__fields__):
-            text_line = f"{label}: {text}"
-            textMessage: TextGameObject = TextGameObject(
-                screen=self.__screen__,
-                message=text_line,
-                xCoordinate=self.__screenWidth__ / 2,
-                yCoordinate=150 + idx * 60,
-                fontSize=self.__smallFont__,
-                color=(0, 255, 0)
-            )
-            textMessage.draw()
-        textMessage: TextGameObject = TextGameObject(
-            screen=self.__screen__,
-            message="Press ENTER to Confirm or ESCAPE to Restart and Q to Quit.",
-            xCoordinate=self.__screenWidth__ / 2,
-            yCoordinate=630,
-            fontSize=self.__smallFont__,
-            color=(200, 200, 200)
-        )
-        textMessage.draw()
-
-    def __drawInputFields__(self):
-        # Create all input self.__fields__
-        textMessage: TextGameObject
-        textField: TextGameObject
-        labelField: TextGameObject
-        textFields: list[TextGameObject] = [obj for obj in self.__inputFields__ if isinstance(obj, TextGameObject)]
-        entryFieldBorder: ImageGameObject = next(
-            (obj for obj in self.__inputFields__ if isinstance(obj, ImageGameObject)), None)
-        for idx, (label, text) in enumerate(self.__fields__):
-            if text is None or text == '':
-                text = ' '
-            yPos = 100 + idx * 80
-            textField: TextGameObject = next((obj for obj in textFields if obj.getIdentifier() == label), None)
-            textField.updateMessage(text)
-
-            if self.__currentField__ == 2:
-                continue
-            if idx == self.__currentField__:
-                entryFieldBorder.setYCoordinate(yPos)
-        inputFields: list[ImageGameObject] = self.__inputFields__
-        inputFields.sort(key=lambda obj: obj.getLayer())
-        for inputField in inputFields:
-            inputField.draw()
-        confirmMessage: TextGameObject = next((obj for obj in textFields if obj.getIdentifier() == "confirmMessage"), None)
-        confirmMessage.draw()
-
-    def __initInputFields__(self):
-        """
-        Creates all the Input Fields needed for the Difficulty Selection Service.
-        """
-        self.__inputFields__ = []
-        inputFieldObject: TextGameObject
-        for idx, (label, text) in enumerate(self.__fields__):
-            if text is None or text == '':
-                text = ' '
-            yPos = 100 + idx * 80
-            inputFieldObject = TextGameObject(
-                screen=self.__screen__,
-                message=label,
-                xCoordinate=self.__screenWidth__ / 2 - 150,
-                yCoordinate=yPos,
-                fontSize=self.__smallFont__,
-                color=(0, 255, 0)
-            )
-            self.__inputFields__.append(inputFieldObject)
-            inputFieldObject = TextGameObject(
-                screen=self.__screen__,
-                message=text,
-                identifier=label,
-                xCoordinate=self.__screenWidth__ / 2 + 150,
-                yCoordinate=yPos,
-                fontSize=self.__smallFont__,
-            )
-            self.__inputFields__.append(inputFieldObject)
-
-        entryFieldBorderImage: pygame.Surface = pygame.Surface((200, 50))
-        borderBox: BorderOnlySurfaceFactory = BorderOnlySurfaceFactory(
-            base_surface=pygame.Surface((200, 50)),
-            border_color=(255, 255, 255),
-            border_thickness=2
-
-        )
-        entryFieldBorderImage.fill((255, 255, 255))
-        entryFieldBorder = ImageGameObject(
-            screen=self.__screen__,
-            image=borderBox.getBorderBox(),
-            xCoordinate=self.__screenWidth__ / 2 + 150,
-            yCoordinate=0,
-        )
-        self.__inputFields__.append(entryFieldBorder)
-        inputFieldObject = TextGameObject(
-            screen=self.__screen__,
-            message="Press ENTER to confirm each field. Or ESCAPE to Start a Game with the current Settings",
-            identifier="confirmMessage",
-            xCoordinate=self.__screenWidth__ / 2,
-            yCoordinate=630,
-            fontSize=self.__smallFont__,
-            color=(0, 255, 0)
-        )
-        self.__inputFields__.append(inputFieldObject)
\ No newline at end of file
+import pygame
+
+from Model.GameObjects.Base.ImageGameObject import ImageGameObject
+from Model.GameObjects.MenuElements.BorderBox import BorderOnlySurfaceFactory
+from Model.GameObjects.Messages.ErrorMessage import ErrorTextGameObject
+from Model.GameObjects.Game.GameDifficulty import GameDifficulty
+from Model.GameObjects.Messages.TextGameObject import TextGameObject
+from Model.GameObjects.Exceptions.QuitException import QuitException
+from Services.ConfigService import getConfig
+
+# Milliseconds the Caret of the active Field stays visible or hidden, also the longest Time the Screen sleeps
+CARET_BLINK_INTERVAL = 500
+# Index of the Ore to Collect Field, computed from Total Ore and Percentage to Collect instead of entered
+ORE_TO_COLLECT_FIELD = 2
+# Window Events after which the Window Content has to be drawn again
+EXPOSE_EVENTS = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED)
+
+
+def getDefaultFields(presetValues) -> list[tuple[str, str]]:
+    """
+    Generate a list of default fields with their corresponding preset values.
+
+    Args:
+        presetValues (dict[str, str]): Preset values for each field.
+
+    Returns:
+        list[tuple[str, str]]: List of field names and their corresponding values.
+    """
+    return [
+        ("Total Ore", presetValues["Total Ore"]),
+        ("Percentage to Collect", presetValues["Percentage to Collect"]),
+        ("Ore to Collect", presetValues["Ore to Collect"]),
+        ("Transporter Capacity", presetValues["Transporter Capacity"]),
+        ("Fuel Consumption", presetValues["Fuel Consumption"]),
+        ("Helicopter Max Speed", presetValues["Helicopter Max Speed"]),
+        ("Transporter Max Speed", presetValues["Transporter Max Speed"])
+    ]
+
+class DifficultySelectionService:
+    """
+    A Class to manage the Difficulty Selection Screen, allowing users to input and confirm game difficulty settings.
+
+    The Screen sleeps in pygame.event.wait until a Key or Window Event arrives, waking only to blink the
+    Caret of the active Field. After each Wake-up only the Rows whose Value, Border or Caret changed are
+    drawn again and pushed to the Display, the whole Screen is only drawn when it is shown, switches
+    between Input and Confirmation or was exposed by the Window System.
+
+    Attributes:
+        __screen__ (pygame.display): The Pygame display surface.
+        __clock__ (pygame.time.Clock): The Pygame clock object.
+        __smallFont__ (int): Font size for small text.
+        __bigFont__ (int): Font size for large text.
+        __fields__ (list[tuple[str, str]]): List of field labels and their current values.
+        __lastInputFieldMessage__ (TextGameObject): The last input field message displayed.
+        __inputFields__ (list[ImageGameObject]): List of input field game objects, in Drawing Order.
+        __labelFields__ (list[TextGameObject]): The Label of each Field, by Field Index.
+        __valueFields__ (list[TextGameObject]): The shown Value of each Field, by Field Index.
+        __entryFieldBorder__ (ImageGameObject): The Border around the Value of the active Field.
+        __confirmFields__ (list[TextGameObject]): The Texts of the Confirmation Screen, Header first and Footer last.
+        __gameDifficulty__ (GameDifficulty): The configured game difficulty object.
+        __presetValues__ (dict[str, str]): Preset values for each field.
+        __inputActive__ (bool): Flag indicating if input is currently active.
+        __currentField__ (int): Index of the currently active input field.
+        __confirmMode__ (bool): Flag indicating if the confirmation mode is active.
+        __caretVisible__ (bool): Whether the Caret is in the visible Phase of its Blinking.
+        __fullRedrawPending__ (bool): Whether the whole Screen has to be drawn again, e.g. after it was exposed.
+        __drawnConfirmMode__ (bool): Whether the Screen currently shows the Confirmation Screen.
+        __drawnField__ (int): Index of the Field the Border and Caret are drawn at.
+        __drawnCaretVisible__ (bool): Whether the Caret is currently drawn.
+        __drawnFieldRects__ (list[pygame.Rect]): The Screen Area each Row of the Input Screen covers, by Field Index, None before it was drawn.
+    """
+    __screen__ : pygame.display
+    __clock__ : pygame.time.Clock
+    __smallFont__ : int
+    __bigFont__ : int
+    __fields__: list[tuple[str, str]]
+    __lastInputFieldMessage__: TextGameObject
+    __inputFields__: list[ImageGameObject]
+    __labelFields__: list[TextGameObject]
+    __valueFields__: list[TextGameObject]
+    __entryFieldBorder__: ImageGameObject
+    __confirmFields__: list[TextGameObject]
+    __gameDifficulty__: GameDifficulty
+
+    __presetValues__: dict[str, str]
+    __inputActive__: bool
+    __currentField__: int
+    __confirmMode__: bool
+    __caretVisible__: bool
+    __fullRedrawPending__: bool
+    __drawnConfirmMode__: bool
+    __drawnField__: int
+    __drawnCaretVisible__: bool
+    __drawnFieldRects__: list[pygame.Rect]
+
+    def __init__(self, screen : pygame, clock : pygame.time.Clock):
+        """
+        Initialize the DifficultySelectionService with the given screen and clock.
+
+        Args:
+            screen (pygame.Surface): The Pygame display surface.
+            clock (pygame.time.Clock): The Pygame clock object.
+        """
+        config = getConfig()
+        difficultySelectionConfig = config.getScreenConfig().getHudConfig().getDifficultySelectionConfig()
+        difficultyConfig = config.getGameConfig().getDifficultyConfig()
+        self.__screenWidth__ = config.getScreenConfig().getScreenWidth()
+        self.__presetValues__ = {
+            "Total Ore": str(difficultyConfig.getTotalOre()),
+            "Percentage to Collect": str(difficultyConfig.getPercentageToCollect()),
+            "Ore to Collect": str(difficultyConfig.getTotalOre() * difficultyConfig.getPercentageToCollect()/100),
+            "Transporter Capacity": str(difficultyConfig.getTransporterCapacity()),
+            "Fuel Consumption": str(difficultyConfig.getFuelConsumption()),
+            "Helicopter Max Speed": str(difficultyConfig.getHelicopterMaxSpeed()),
+            "Transporter Max Speed": str(difficultyConfig.getTransporterMaxSpeed())
+        }
+        self.__screen__ = screen
+        self.__clock__ = clock
+        self.__smallFont__ = difficultySelectionConfig.getSmallFont()
+        self.__bigFont__ = difficultySelectionConfig.getBigFont()
+        self.__fields__ = getDefaultFields(self.__presetValues__)
+        self.__initInputFields__()
+        self.__initConfirmFields__()
+
+    def selectDifficulty(self) -> GameDifficulty:
+        """
+        Launch the Difficulty Selection Screen and handle user input.
+
+        Returns:
+            GameDifficulty: The configured game difficulty object.
+        """
+        self.__startSelection__()
+
+        while self.__inputActive__:
+            self.__updateFieldValues__()
+            self.__render__()
+
+            # Sleep until the next Event, the Input Screen wakes up to blink the Caret
+            event = pygame.event.wait(0 if self.__confirmMode__ else CARET_BLINK_INTERVAL)
+            if event.type == pygame.NOEVENT:
+                self.__caretVisible__ = not self.__caretVisible__
+            else:
+                self.__handleInput__([event] + pygame.event.get())
+
+        return self.__gameDifficulty__
+
+    def __startSelection__(self):
+        """
+        Reset the Fields and the Input State for a new Selection, the first Render draws the whole Screen.
+        """
+        self.__currentField__ = 0
+        self.__inputActive__ = True
+        self.__confirmMode__ = False
+        self.__caretVisible__ = True
+        self.__fullRedrawPending__ = True
+        self.__resetInputFields__()
+
+    def __resetInputFields__(self):
+        """
+        Reset the input fields to their default preset values.
+        """
+        self.__fields__ = getDefaultFields(self.__presetValues__)
+
+    def __updateFieldValues__(self):
+        """
+        Update the 'Ore to Collect' field based on 'Total Ore' and 'Percentage to Collect' inputs.
+        """
+        try:
+            totalOre = float(self.__fields__[0][1])
+        except ValueError as e:
+            totalOre = 0
+            if totalOre < 500:
+                totalOre = 500
+            if totalOre > 10000:
+                totalOre = 10000
+        try:
+            percentageToCollect = float(self.__fields__[1][1])
+        except ValueError as e:
+            percentageToCollect = 0
+        if percentageToCollect < 0:
+            percentageToCollect = 0
+        elif percentageToCollect > 100:
+            percentageToCollect = 100
+        newOreToCollect: str = str(int(percentageToCollect * totalOre / 100))
+        self.__presetValues__["Ore to Collect"] = newOreToCollect
+        self.__fields__[ORE_TO_COLLECT_FIELD] = ("Ore to Collect", str(newOreToCollect))
+
+    def __handleInput__(self, events: list[pygame.event.Event]):
+        """
+        Handle user input events for navigating and editing fields, confirming settings, or quitting.
+
+        Args:
+            events (list[pygame.event.Event]): The Events that arrived since the Screen was drawn.
+        """
+        for event in events:
+            if event.type == pygame.QUIT:
+                raise QuitException()
+
+            if event.type in EXPOSE_EVENTS:
+                self.__fullRedrawPending__ = True
+
+            if event.type == pygame.KEYDOWN:
+                # Typing restarts the Blinking, so the Caret is visible while the Value changes
+                self.__caretVisible__ = True
+                if not self.__confirmMode__:
+
+                    if event.key == pygame.K_RETURN:
+                        if self.__currentField__ < len(self.__fields__) - 1:
+                            self.__currentField__ += 1
+                            if self.__currentField__ == ORE_TO_COLLECT_FIELD:
+                                self.__currentField__ += 1
+                        else:
+                            self.__confirmMode__ = True
+                    elif event.key == pygame.K_BACKSPACE:
+                        label, text = self.__fields__[self.__currentField__]
+                        self.__fields__[self.__currentField__] = (label, text[:-1])
+                    elif event.key == pygame.K_ESCAPE:
+                        self.__confirmMode__ = True
+                    else:
+                        label, text = self.__fields__[self.__currentField__]
+                        self.__fields__[self.__currentField__] = (label, text + event.unicode)
+                else:
+                    if event.key == pygame.K_RETURN:
+                        # Confirm and create difficulty
+                        try:
+                            self.__createGameDifficultyFromFields__()
+                        except ValueError:
+                            error: ErrorTextGameObject = ErrorTextGameObject(
+                                screen=self.__screen__,
+                                message="Invalid input! Please enter valid numbers."
+                            )
+                            error.draw()
+
+                            self.__resetInputFields__()
+                            self.__currentField__ = 0
+                            self.__confirmMode__ = False
+
+                    if event.key == pygame.K_ESCAPE:
+                        self.__resetInputFields__()
+                        self.__currentField__ = 0
+                        self.__confirmMode__ = False
+                    if event.key == pygame.K_q:
+                        raise QuitException()
+        return self.__currentField__
+
+    def __createGameDifficultyFromFields__(self):
+        """
+        Create a GameDifficulty object from the current field values and deactivate input.
+        """
+        print(self.__fields__)
+        totalOre = int(self.__fields__[0][1])
+        percentageToCollect = float(self.__fields__[1][1])
+        transporterCapacity = float(self.__fields__[3][1])
+        fuelConsumption = float(self.__fields__[4][1])
+        helicopterMaxSpeed = float(self.__fields__[5][1])
+        transporterMaxSpeed = float(self.__fields__[6][1])
+        self.__gameDifficulty__ = GameDifficulty(
+            percentageToCollect=percentageToCollect,
+            totalOre=totalOre,
+            transporterCapacity=transporterCapacity,
+            fuelConsumption=fuelConsumption,
+            helicopterMaxSpeed=helicopterMaxSpeed,
+            transporterMaxSpeed=transporterMaxSpeed
+        )
+        self.__inputActive__ = False
+
+    def __render__(self):
+        """
+        Bring the Screen up to date with the current State, drawing only what changed since the last Call.
+        """
+        if self.__fullRedrawPending__ or self.__confirmMode__ != self.__drawnConfirmMode__:
+            self.__screen__.fill((0, 0, 0))
+            if not self.__confirmMode__:
+                self.__drawInputFields__()
+            else:
+                self.__drawConfirmFields__()
+            pygame.display.flip()
+            self.__fullRedrawPending__ = False
+            self.__drawnConfirmMode__ = self.__confirmMode__
+            return
+
+        # The Confirmation Screen only changes by leaving it, which draws the whole Screen
+        if self.__confirmMode__:
+            return
+        changedFields = self.__updateValueFields__()
+        if self.__currentField__ != self.__drawnField__:
+            changedFields.update((self.__drawnField__, self.__currentField__))
+        elif self.__caretVisible__ != self.__drawnCaretVisible__:
+            changedFields.add(self.__currentField__)
+        if changedFields:
+            pygame.display.update([self.__drawField__(idx) for idx in sorted(changedFields)])
+
+    def __updateValueFields__(self) -> set[int]:
+        """
+        Render the Value of every Field whose Text changed.
+
+        Returns:
+            set[int]: The Indices of the changed Fields.
+        """
+        changedFields: set[int] = set()
+        for idx, (label, text) in enumerate(self.__fields__):
+            if text is None or text == '':
+                text = ' '
+            valueField: TextGameObject = self.__valueFields__[idx]
+            if valueField.getMessage() != text:
+                valueField.updateMessage(text)
+                changedFields.add(idx)
+        return changedFields
+
+    def __drawField__(self, idx: int) -> pygame.Rect:
+        """
+        Clear the Row of one Field and draw its Label, Value and, for the active Field, Border and Caret.
+
+        Args:
+            idx (int): Index of the Field.
+
+        Returns:
+            pygame.Rect: The Screen Area that changed, covering the Row as it was drawn before and now.
+        """
+        entryFieldBorder: ImageGameObject = self.__entryFieldBorder__
+        entryFieldBorder.setYCoordinate(self.__valueFields__[idx].getYCoordinate())
+        fieldRect: pygame.Rect = self.__getFieldRect__(idx)
+        drawnFieldRect: pygame.Rect = self.__drawnFieldRects__[idx]
+        changedRect: pygame.Rect = fieldRect if drawnFieldRect is None else fieldRect.union(drawnFieldRect)
+        self.__screen__.fill((0, 0, 0), changedRect)
+
+        active: bool = idx == self.__currentField__
+        if active:
+            entryFieldBorder.draw()
+        self.__labelFields__[idx].draw()
+        self.__valueFields__[idx].draw()
+        if active:
+            if self.__caretVisible__:
+                self.__screen__.fill((255, 255, 255), self.__getCaretRect__(idx))
+            self.__drawnField__ = idx
+            self.__drawnCaretVisible__ = self.__caretVisible__
+        self.__drawnFieldRects__[idx] = fieldRect
+        return changedRect
+
+    def __getFieldRect__(self, idx: int) -> pygame.Rect:
+        """
+        Return the Screen Area the Row of a Field covers, including the Space of the Border and Caret.
+
+        The Border has to be positioned at the Row before.
+        """
+        return self.__labelFields__[idx].getDrawRect().unionall([
+            self.__valueFields__[idx].getDrawRect(),
+            self.__entryFieldBorder__.getDrawRect(),
+            self.__getCaretRect__(idx)
+        ])
+
+    def __getCaretRect__(self, idx: int) -> pygame.Rect:
+        valueRect: pygame.Rect = self.__valueFields__[idx].getDrawRect()
+        return pygame.Rect(valueRect.right + 2, valueRect.top, 2, valueRect.height)
+
+    def __drawConfirmFields__(self):
+        """
+        Draw the confirmation screen displaying all current settings and instructions.
+        """
+        # Confirm screen, the Header and Footer never change
+        for idx, (label, text) in enumerate(self.__fields__):
+            self.__confirmFields__[idx + 1].updateMessage(f"{label}: {text}")
+        for textMessage in self.__confirmFields__:
+            textMessage.draw()
+
+    def __drawInputFields__(self):
+        """
+        Draw all Rows of the Input Screen and the Instructions below them.
+        """
+        self.__updateValueFields__()
+        for idx in range(len(self.__fields__)):
+            self.__drawField__(idx)
+        confirmMessage: TextGameObject = self.__inputFields__[-1]
+        confirmMessage.draw()
+
+    def __initInputFields__(self):
+        """
+        Creates all the Input Fields needed for the Difficulty Selection Service.
+        """
+        self.__inputFields__ = []
+        self.__labelFields__ = []
+        self.__valueFields__ = []
+        inputFieldObject: TextGameObject
+        for idx, (label, text) in enumerate(self.__fields__):
+            if text is None or text == '':
+                text = ' '
+            yPos = 100 + idx * 80
+            inputFieldObject = TextGameObject(
+                screen=self.__screen__,
+                message=label,
+                xCoordinate=self.__screenWidth__ / 2 - 150,
+                yCoordinate=yPos,
+                fontSize=self.__smallFont__,
+                color=(0, 255, 0)
+            )
+            self.__inputFields__.append(inputFieldObject)
+            self.__labelFields__.append(inputFieldObject)
+            inputFieldObject = TextGameObject(
+                screen=self.__screen__,
+                message=text,
+                identifier=label,
+                xCoordinate=self.__screenWidth__ / 2 + 150,
+                yCoordinate=yPos,
+                fontSize=self.__smallFont__,
+            )
+            self.__inputFields__.append(inputFieldObject)
+            self.__valueFields__.append(inputFieldObject)
+
+        borderBox: BorderOnlySurfaceFactory = BorderOnlySurfaceFactory(
+            base_surface=pygame.Surface((200, 50)),
+            border_color=(255, 255, 255),
+            border_thickness=2
+
+        )
+        entryFieldBorder = ImageGameObject(
+            screen=self.__screen__,
+            image=borderBox.getBorderBox(),
+            xCoordinate=self.__screenWidth__ / 2 + 150,
+            yCoordinate=0,
+        )
+        self.__inputFields__.append(entryFieldBorder)
+        self.__entryFieldBorder__ = entryFieldBorder
+        inputFieldObject = TextGameObject(
+            screen=self.__screen__,
+            message="Press ENTER to confirm each field. Or ESCAPE to Start a Game with the current Settings",
+            identifier="confirmMessage",
+            xCoordinate=self.__screenWidth__ / 2,
+            yCoordinate=630,
+            fontSize=self.__smallFont__,
+            color=(0, 255, 0)
+        )
+        self.__inputFields__.append(inputFieldObject)
+
+        # Nothing is drawn yet, so every Row starts without a drawn Area
+        self.__drawnConfirmMode__ = None
+        self.__drawnField__ = -1
+        self.__drawnCaretVisible__ = False
+        self.__drawnFieldRects__ = [None for _ in self.__fields__]
+
+    def __initConfirmFields__(self):
+        """
+        Creates the Texts of the Confirmation Screen once, the Field Lines are updated when it is drawn.
+        """
+        self.__confirmFields__ = [TextGameObject(
+            screen=self.__screen__,
+            message="Confirm the following settings?",
+            xCoordinate=self.__screenWidth__ / 2,
+            yCoordinate=50,
+            fontSize=self.__smallFont__,
+        )]
+        for idx, (label, text) in enumerate(self.__fields__):
+            self.__confirmFields__.append(TextGameObject(
+                screen=self.__screen__,
+                message=f"{label}: {text}",
+                xCoordinate=self.__screenWidth__ / 2,
+                yCoordinate=150 + idx * 60,
+                fontSize=self.__smallFont__,
+                color=(0, 255, 0)
+            ))
+        self.__confirmFields__.append(TextGameObject(
+            screen=self.__screen__,
+            message="Press ENTER to Confirm or ESCAPE to Restart and Q to Quit.",
+            xCoordinate=self.__screenWidth__ / 2,
+            yCoordinate=630,
+            fontSize=self.__smallFont__,
+            color=(200, 200, 200)
+        ))
\ No newline at end of file
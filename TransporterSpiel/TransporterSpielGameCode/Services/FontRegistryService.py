@@ -0,0 +1,105 @@
+import pygame
+
+from Services.ConfigService import getConfig
+
+FONT_REGISTRY_INSTANCE = None
+
+
+class FontRegistryService:
+    """
+    A Class representing a process-wide Registry of loaded Fonts.
+
+    pygame.font.SysFont looks up and loads the Font File on every Call. The Registry loads each
+    (Family, Size) Combination once and shares the Font Object across all Text Objects. The
+    pygame Default Font is loaded directly, as SysFont would scan the System Fonts first.
+    Shared Fonts must not be modified (e.g. with set_bold), as every User would see the Change.
+
+    Attributes:
+        __fonts__ (dict[tuple[str | None, int], pygame.font.Font]): Loaded Fonts by (Family, Size).
+    """
+    __fonts__: dict[tuple[str | None, int], pygame.font.Font]
+
+    def __init__(self):
+        """
+        Initialize an empty FontRegistryService.
+        """
+        self.__fonts__ = {}
+
+    def getFont(self, fontSize: int, family: str = None) -> pygame.font.Font:
+        """
+        Return the shared Font for the given Family and Size, loading it on first Use.
+
+        Args:
+            fontSize (int): Size of the Font.
+            family (str): System Font Family, None for the pygame Default Font.
+
+        Returns:
+            pygame.font.Font: The shared Font Object.
+        """
+        key = (family, fontSize)
+        font = self.__fonts__.get(key)
+        if font is None:
+            font = pygame.font.SysFont(family, fontSize) if family is not None else pygame.font.Font(None, fontSize)
+            self.__fonts__[key] = font
+        return font
+
+    def prewarm(self, fontSizes, family: str = None) -> None:
+        """
+        Load the Fonts for all given Sizes ahead of Time.
+
+        Args:
+            fontSizes (Iterable[int]): The Font Sizes to load.
+            family (str): System Font Family, None for the pygame Default Font.
+        """
+        for fontSize in fontSizes:
+            self.getFont(fontSize, family)
+
+    def prewarmConfiguredFonts(self) -> None:
+        """
+        Load every Font Size listed in the Configuration, so no Font is loaded during a Game Round.
+        """
+        config = getConfig()
+        screenConfig = config.getScreenConfig()
+        fontConfig = screenConfig.getFontConfig()
+        hudConfig = screenConfig.getHudConfig()
+        sideHudConfig = hudConfig.getSideHudConfig()
+        topHudConfig = hudConfig.getTopHudConfig()
+        difficultySelectionConfig = hudConfig.getDifficultySelectionConfig()
+        errorMessageConfig = config.getErrorMessageConfig()
+        finalMessageConfig = config.getFinalMessageConfig()
+
+        self.prewarm({
+            fontConfig.getMainMenuBigFont(),
+            fontConfig.getMainMenuSmallFont(),
+            fontConfig.getTopHudFont(),
+            sideHudConfig.getBigFont(),
+            sideHudConfig.getSmallFont(),
+            topHudConfig.getFuelBarConfig().getFontSize(),
+            topHudConfig.getLoadBarConfig().getFontSize(),
+            topHudConfig.getOreTransportStatusConfig().getFontSize(),
+            difficultySelectionConfig.getBigFont(),
+            difficultySelectionConfig.getSmallFont(),
+            errorMessageConfig.getErrorTextSize(),
+            errorMessageConfig.getFooterFontSize(),
+            finalMessageConfig.getErrorTextSize(),
+            finalMessageConfig.getFooterFontSize()
+        })
+
+    def getLoadedFontCount(self) -> int:
+        return len(self.__fonts__)
+
+    def __str__(self) -> str:
+        return f"{type(self).__name__} (fonts={sorted(self.__fonts__, key=lambda key: (str(key[0]), key[1]))})"
+
+
+def getFontRegistry() -> FontRegistryService:
+    """
+    Retrieve the process-wide FontRegistryService Instance, creating it on first Use.
+
+    Returns:
+        FontRegistryService: The shared Font Registry.
+    """
+    global FONT_REGISTRY_INSTANCE
+    if FONT_REGISTRY_INSTANCE is None:
+        FONT_REGISTRY_INSTANCE = FontRegistryService()
+    return FONT_REGISTRY_INSTANCE
\ No newline at end of file
@@ -0,0 +1,169 @@
+import csv
+import time
+
+# Phases of a Frame in the Order they run, with the Method each of them measures
+FRAME_PHASES = (
+    "input",        # GameRound.__handleGameInput__
+    "collisions",   # GameRound.__handleCollisions__
+    "status",       # GameRound.__checkGameStatus__
+    "updates",      # GameRound.__updateGameObjects__ and the Vehicle Physics Step
+    "hud",          # Hud.update
+    "draw",         # RenderService.render without the Display Update
+    "display",      # pygame.display.update
+)
+
+
+def percentile(sortedValues: list[float], fraction: float) -> float:
+    """
+    Return the Nearest-Rank Percentile of sorted Values, e.g. fraction 0.99 for p99, or 0 without Values.
+    """
+    if not sortedValues:
+        return 0.0
+    index = min(len(sortedValues) - 1, max(0, round(fraction * len(sortedValues)) - 1))
+    return sortedValues[index]
+
+
+class FrameProfilerService:
+    """
+    A Class collecting per-Phase Timings of the last Frames in a Ring Buffer.
+
+    The Game Round and the Render Service add the Time spent in each Phase with addPhaseTime, several
+    Ticks of one Frame add up. endFrame closes the Frame: it stores the Phase Times and the Frame Time,
+    measured from the End of the previous Frame and therefore including the Frame Rate Limiter, into
+    preallocated Rows that are overwritten once the Buffer is full. The Profiler outlives the Game
+    Rounds, so the Buffer and the Overlay Visibility carry over a Restart.
+
+    Attributes:
+        __capacity__ (int): Number of Frames kept.
+        __frameTimes__ (list[float]): Frame Time of every buffered Frame in Milliseconds.
+        __phaseTimes__ (dict[str, list[float]]): Milliseconds per Phase of every buffered Frame.
+        __currentPhaseTimes__ (dict[str, float]): Seconds per Phase of the Frame in Progress.
+        __nextIndex__ (int): Row the next Frame is written to.
+        __frameCount__ (int): Number of Frames recorded so far, also beyond the Capacity.
+        __lastFrameEnd__ (float): perf_counter Value at the End of the previous Frame, None before the first Frame.
+        __overlayVisible__ (bool): Whether the Profiler Overlay is shown.
+    """
+    __capacity__: int
+    __frameTimes__: list[float]
+    __phaseTimes__: dict[str, list[float]]
+    __currentPhaseTimes__: dict[str, float]
+    __nextIndex__: int
+    __frameCount__: int
+    __lastFrameEnd__: float
+    __overlayVisible__: bool
+
+    def __init__(self, capacity: int = 600):
+        """
+        Initialize a FrameProfilerService with an empty Ring Buffer.
+
+        Args:
+            capacity (int): Number of Frames kept for the Statistics, the Graph and the CSV Export.
+        """
+        self.__capacity__ = capacity
+        self.__frameTimes__ = [0.0] * capacity
+        self.__phaseTimes__ = {phase: [0.0] * capacity for phase in FRAME_PHASES}
+        self.__currentPhaseTimes__ = dict.fromkeys(FRAME_PHASES, 0.0)
+        self.__nextIndex__ = 0
+        self.__frameCount__ = 0
+        self.__lastFrameEnd__ = None
+        self.__overlayVisible__ = False
+
+    def addPhaseTime(self, phase: str, seconds: float) -> None:
+        """
+        Add Time spent in a Phase to the Frame in Progress.
+
+        Args:
+            phase (str): One of FRAME_PHASES.
+            seconds (float): The Duration, e.g. a Difference of time.perf_counter Values.
+        """
+        self.__currentPhaseTimes__[phase] += seconds
+
+    def endFrame(self) -> None:
+        """
+        Store the Frame in Progress into the Ring Buffer and start the next one.
+
+        The first Frame only starts the Frame Time Measurement and is not stored.
+        """
+        now = time.perf_counter()
+        if self.__lastFrameEnd__ is not None:
+            index = self.__nextIndex__
+            self.__frameTimes__[index] = (now - self.__lastFrameEnd__) * 1000
+            for phase, seconds in self.__currentPhaseTimes__.items():
+                self.__phaseTimes__[phase][index] = seconds * 1000
+            self.__nextIndex__ = (index + 1) % self.__capacity__
+            self.__frameCount__ += 1
+        self.__lastFrameEnd__ = now
+        for phase in self.__currentPhaseTimes__:
+            self.__currentPhaseTimes__[phase] = 0.0
+
+    def restartFrame(self) -> None:
+        """
+        Discard the Frame in Progress and restart the Frame Time Measurement, e.g. after the Game waited in a Menu.
+        """
+        self.__lastFrameEnd__ = None
+        for phase in self.__currentPhaseTimes__:
+            self.__currentPhaseTimes__[phase] = 0.0
+
+    def getBufferedFrameCount(self) -> int:
+        return min(self.__frameCount__, self.__capacity__)
+
+    def getFrameCount(self) -> int:
+        return self.__frameCount__
+
+    def getCapacity(self) -> int:
+        return self.__capacity__
+
+    def getFrameTimes(self) -> list[float]:
+        """
+        Return the buffered Frame Times in Milliseconds, oldest first.
+        """
+        return self.__chronological__(self.__frameTimes__)
+
+    def getPhaseMeans(self) -> dict[str, float]:
+        """
+        Return the mean Milliseconds per Frame of every Phase over the buffered Frames.
+        """
+        count = self.getBufferedFrameCount()
+        if count == 0:
+            return dict.fromkeys(FRAME_PHASES, 0.0)
+        return {phase: sum(times[:count]) / count for phase, times in self.__phaseTimes__.items()}
+
+    def getFrameTimePercentiles(self) -> tuple[float, float, float]:
+        """
+        Return p50, p95 and p99 of the buffered Frame Times in Milliseconds.
+        """
+        frameTimes = sorted(self.__frameTimes__[:self.getBufferedFrameCount()])
+        return percentile(frameTimes, 0.50), percentile(frameTimes, 0.95), percentile(frameTimes, 0.99)
+
+    def isOverlayVisible(self) -> bool:
+        return self.__overlayVisible__
+
+    def toggleOverlay(self) -> None:
+        self.__overlayVisible__ = not self.__overlayVisible__
+
+    def exportCsv(self, path: str) -> None:
+        """
+        Write the buffered Frames to a CSV File, oldest first, with one Column per Phase in Milliseconds.
+
+        Args:
+            path (str): Path of the CSV File.
+        """
+        firstFrame = self.__frameCount__ - self.getBufferedFrameCount()
+        columns = [self.getFrameTimes()] + [self.__chronological__(self.__phaseTimes__[phase]) for phase in FRAME_PHASES]
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["frame", "frameMs"] + [f"{phase}Ms" for phase in FRAME_PHASES])
+            for offset, row in enumerate(zip(*columns)):
+                writer.writerow([firstFrame + offset] + [f"{value:.4f}" for value in row])
+
+    def __chronological__(self, values: list[float]) -> list[float]:
+        """
+        Return the buffered Part of a Ring Buffer Column, oldest first.
+        """
+        if self.__frameCount__ < self.__capacity__:
+            return values[:self.__frameCount__]
+        return values[self.__nextIndex__:] + values[:self.__nextIndex__]
+
+    def __str__(self) -> str:
+        p50, p95, p99 = self.getFrameTimePercentiles()
+        return f"{type(self).__name__} (frames={self.__frameCount__}, p50={p50:.2f} ms, p95={p95:.2f} ms, p99={p99:.2f} ms)"
\ No newline at end of file
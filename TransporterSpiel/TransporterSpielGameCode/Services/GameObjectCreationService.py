@@ -1,104 +1,165 @@
-import os
-
-import pygame
-
-from Model.GameObjects.Game.GameDifficulty import GameDifficulty
-from Model.GameObjects.Base.ImageGameObject import ImageGameObject
-from Model.GameObjects.Buildings.GasStation import GasStation
-from Model.GameObjects.Vehicles.Helicopter import Helicopter
-from Model.GameObjects.Buildings.OreMine import OreMine
-from Model.GameObjects.Vehicles.OreTransport import OreTransport
-from Model.GameObjects.Buildings.OreUnloadStation import OreUnloadStation
-
-class GameObjectCreationService:
-
-    __oreTransportImg__ : pygame.Surface
-    __helicopterImg__ : pygame.Surface
-
-    __gasStationImg__ : pygame.Surface
-    __oreUnloadStationImg__ : pygame.Surface
-    __oreMineImg__ : pygame.Surface
-
-    __screen__ : pygame.Surface
-    __gameWidth__ : int
-    __gameHeight__: int
-
-    def __init__(self, screen : pygame.Surface, gameWidth : int, gameHeight : int):
-        self.__screen__ = screen
-        self.__gameWidth__ = gameWidth
-        self.__gameHeight__ = gameHeight
-        self.__loadImages__()
-
-    def __loadImages__(self):
-        baseDir = os.path.dirname(os.path.abspath(__file__))
-        assetPath = os.path.join(os.path.dirname(baseDir), "Assets")
-
-        self.__oreUnloadStationImg__ = pygame.transform.scale(
-            pygame.image.load(os.path.join(assetPath, "unloadStation.png")).convert_alpha(), (120, 120)
-        )
-        self.__helicopterImg__ = pygame.transform.scale(
-            pygame.image.load(os.path.join(assetPath, "heli.png")).convert_alpha(), (100, 100)
-        )
-        self.__oreTransportImg__ = pygame.transform.scale(
-            pygame.image.load(os.path.join(assetPath, "transporter.png")).convert_alpha(), (80, 40)
-        )
-        self.__gasStationImg__ = pygame.transform.scale(
-            pygame.image.load(os.path.join(assetPath, "gasStation.png")).convert_alpha(), (60, 120)
-        )
-        self.__oreMineImg__ = pygame.transform.scale(
-            pygame.image.load(os.path.join(assetPath, "mine2.png")).convert_alpha(), (118, 100)
-        )
-
-    def createGameObjects(self, difficulty : GameDifficulty) -> list[ImageGameObject]:
-        # Create the Helicopter object with difficulty setting
-        helicopter : Helicopter = Helicopter(
-            image=self.__helicopterImg__,
-            maxSpeed=difficulty.getHelicopterMaxSpeed(),
-            screen=self.__screen__
-        )
-
-        # Create the OreTransport object with difficulty settings
-        oreTransport : OreTransport = OreTransport(
-            xCoordinate=300,
-            yCoordinate=300,
-            image=self.__oreTransportImg__,
-            fuelConsumption=difficulty.getFuelConsumption(),
-            maxSpeed=difficulty.getTransporterMaxSpeed(),
-            oreCapacity=difficulty.getTransporterCapacity(),
-            screen=self.__screen__
-        )
-        # Set the Target of the Helicopter
-        helicopter.setTarget(oreTransport)
-
-        # Create the GasStation object
-        gasStation : GasStation = GasStation(
-            xCoordinate=(self.__gameWidth__ // 2),
-            yCoordinate=(self.__gameHeight__ // 2) + self.__gameHeight__ // 4,
-            image=self.__gasStationImg__,
-            screen=self.__screen__,
-        )
-
-        # Create the OreMine object with total ore from the difficulty
-        oreMine : OreMine= OreMine(
-            xCoordinate=self.__gameWidth__ / 10,
-            yCoordinate=self.__gameHeight__ // 2,
-            image=self.__oreMineImg__,
-            screen=self.__screen__,
-            totalOre=difficulty.getTotalOre()
-        )
-
-        # Create the OreUnloadStation object
-        oreUnloadStation : OreUnloadStation = OreUnloadStation(
-            xCoordinate=self.__gameWidth__ - self.__gameWidth__ / 10,
-            yCoordinate=self.__gameHeight__ // 2,
-            image=self.__oreUnloadStationImg__,
-            screen=self.__screen__
-        )
-
-        return [
-            gasStation,
-            oreMine,
-            oreUnloadStation,
-            helicopter,
-            oreTransport
-        ]
\ No newline at end of file
+import os
+import random
+from concurrent.futures import Future
+
+import pygame
+
+from Model.GameObjects.Game.AiScheduler import AiScheduler
+from Model.GameObjects.Game.GameDifficulty import GameDifficulty
+from Model.GameObjects.Game.SimulationClock import SimulationClock
+from Model.GameObjects.Base.ImageGameObject import ImageGameObject
+from Model.GameObjects.Buildings.GasStation import GasStation
+from Model.GameObjects.Vehicles.Helicopter import Helicopter
+from Model.GameObjects.Buildings.OreMine import OreMine
+from Model.GameObjects.Vehicles.OreTransport import OreTransport
+from Model.GameObjects.Buildings.OreUnloadStation import OreUnloadStation
+from Services.AssetLoaderService import AssetLoaderService
+from Services.AssetPackService import buildAssetPack, getAssetPack, getAssetPackPath
+from Services.ConfigService import getConfig
+from Services.RotationCacheService import getRotationCache
+
+ASSET_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Assets")
+# Source File and scaled Size of every Image, also the Content of the Asset Pack
+IMAGE_ASSETS = {
+    "oreUnloadStation": ("unloadStation.png", (120, 120)),
+    "helicopter": ("heli.png", (100, 100)),
+    "oreTransport": ("transporter.png", (80, 40)),
+    "gasStation": ("gasStation.png", (60, 120)),
+    "oreMine": ("mine2.png", (118, 100)),
+}
+
+class GameObjectCreationService:
+
+    __oreTransportImg__ : pygame.Surface
+    __helicopterImg__ : pygame.Surface
+
+    __gasStationImg__ : pygame.Surface
+    __oreUnloadStationImg__ : pygame.Surface
+    __oreMineImg__ : pygame.Surface
+
+    __screen__ : pygame.Surface
+    __gameWidth__ : int
+    __gameHeight__: int
+    __assetLoader__ : AssetLoaderService
+    __pendingAssets__ : dict[str, Future]
+
+    def __init__(self, screen : pygame.Surface, gameWidth : int, gameHeight : int, assetLoader : AssetLoaderService = None):
+        self.__screen__ = screen
+        self.__gameWidth__ = gameWidth
+        self.__gameHeight__ = gameHeight
+        self.__assetLoader__ = assetLoader
+        self.__pendingAssets__ = None
+        if assetLoader is None:
+            self.__loadImages__()
+        else:
+            self.__submitImages__()
+
+    def __submitImages__(self):
+        # Load the Images on the Worker of the Asset Loader, the first Round waits for the ones still pending
+        imageFutures = {
+            name: self.__assetLoader__.loadImage(name, ASSET_DIRECTORY, fileName, size)
+            for name, (fileName, size) in IMAGE_ASSETS.items()
+        }
+        self.__pendingAssets__ = dict(imageFutures)
+        if getConfig().getRenderConfig().getRotationCachePrewarm():
+            for name in ("helicopter", "oreTransport"):
+                self.__pendingAssets__[f"{name}Rotations"] = self.__assetLoader__.prewarmRotations(name, imageFutures[name])
+
+    def __awaitImages__(self):
+        assets = {name: self.__assetLoader__.waitFor(future) for name, future in self.__pendingAssets__.items()}
+        self.__pendingAssets__ = None
+        self.__setImages__(assets)
+
+    def __setImages__(self, images : dict[str, pygame.Surface]):
+        self.__oreUnloadStationImg__ = images["oreUnloadStation"]
+        self.__helicopterImg__ = images["helicopter"]
+        self.__oreTransportImg__ = images["oreTransport"]
+        self.__gasStationImg__ = images["gasStation"]
+        self.__oreMineImg__ = images["oreMine"]
+
+    def __loadImages__(self):
+        # Scaled Images come from the memory-mapped Asset Pack, or are decoded and scaled if it is missing or outdated
+        assetPack = getAssetPack()
+        images = {
+            name: assetPack.loadImage(ASSET_DIRECTORY, fileName, size)
+            for name, (fileName, size) in IMAGE_ASSETS.items()
+        }
+        self.__setImages__(images)
+
+        # Vehicles rotate every Frame, so their Rotations can be prepared while loading
+        if getConfig().getRenderConfig().getRotationCachePrewarm():
+            rotationCache = getRotationCache()
+            rotationCache.prewarm(self.__helicopterImg__)
+            rotationCache.prewarm(self.__oreTransportImg__)
+
+    def createGameObjects(self, difficulty : GameDifficulty, randomGenerator : random.Random = None, simulationClock : SimulationClock = None, aiScheduler : AiScheduler = None) -> list[ImageGameObject]:
+        if self.__pendingAssets__ is not None:
+            self.__awaitImages__()
+
+        # Create the Helicopter object with difficulty setting and the Randomness, Clock and AI Scheduler of the Round
+        helicopter : Helicopter = Helicopter(
+            image=self.__helicopterImg__,
+            maxSpeed=difficulty.getHelicopterMaxSpeed(),
+            screen=self.__screen__,
+            randomGenerator=randomGenerator,
+            simulationClock=simulationClock,
+            aiScheduler=aiScheduler
+        )
+
+        # Create the OreTransport object with difficulty settings
+        oreTransport : OreTransport = OreTransport(
+            xCoordinate=300,
+            yCoordinate=300,
+            image=self.__oreTransportImg__,
+            fuelConsumption=difficulty.getFuelConsumption(),
+            maxSpeed=difficulty.getTransporterMaxSpeed(),
+            oreCapacity=difficulty.getTransporterCapacity(),
+            screen=self.__screen__
+        )
+        # Set the Target of the Helicopter
+        helicopter.setTarget(oreTransport)
+
+        # Create the GasStation object
+        gasStation : GasStation = GasStation(
+            xCoordinate=(self.__gameWidth__ // 2),
+            yCoordinate=(self.__gameHeight__ // 2) + self.__gameHeight__ // 4,
+            image=self.__gasStationImg__,
+            screen=self.__screen__,
+        )
+
+        # Create the OreMine object with total ore from the difficulty
+        oreMine : OreMine= OreMine(
+            xCoordinate=self.__gameWidth__ / 10,
+            yCoordinate=self.__gameHeight__ // 2,
+            image=self.__oreMineImg__,
+            screen=self.__screen__,
+            totalOre=difficulty.getTotalOre()
+        )
+
+        # Create the OreUnloadStation object
+        oreUnloadStation : OreUnloadStation = OreUnloadStation(
+            xCoordinate=self.__gameWidth__ - self.__gameWidth__ / 10,
+            yCoordinate=self.__gameHeight__ // 2,
+            image=self.__oreUnloadStationImg__,
+            screen=self.__screen__
+        )
+
+        return [
+            gasStation,
+            oreMine,
+            oreUnloadStation,
+            helicopter,
+            oreTransport
+        ]
+
+def buildAssetPackFromConfig() -> None:
+    """
+    Build the Asset Pack with the Images of IMAGE_ASSETS at the configured Path, for the Pixel Format of this Display.
+    """
+    pygame.init()
+    # convert_alpha needs a Display, the Window itself is not needed
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    path = getAssetPackPath()
+    packSize = buildAssetPack(path, ASSET_DIRECTORY, IMAGE_ASSETS.values())
+    print(f"Built Asset Pack {path} with {len(IMAGE_ASSETS)} Images ({packSize} Bytes)")
+    pygame.quit()
\ No newline at end of file
@@ -0,0 +1,212 @@
+import os
+import time
+
+import pygame
+
+from Model.GameObjects.Game.GameDifficulty import GameDifficulty
+from Model.GameObjects.Game.InputRecording import InputRecording, loadInputRecording
+from Model.GameObjects.Game.GameRound import GameRound
+from Model.GameObjects.Game.RoundResult import RoundResult
+from Model.GameObjects.MenuElements.MainMenu import MainMenu
+from Services.ConfigService import getConfig
+from Services.GameObjectCreationService import GameObjectCreationService
+
+
+def enableHeadlessDisplay() -> None:
+    """
+    Select the SDL Dummy Drivers, so pygame runs without a Window or Audio Device.
+
+    Must be called before the pygame Display is initialized.
+    """
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+
+class HeadlessSimulationService:
+    """
+    A Class to run Game Rounds without Rendering and without a Frame Rate Limit.
+
+    The Rounds run the complete Game Logic (Input, Collisions, Vehicle Physics, Helicopter AI and
+    the Win and Lose Checks), but skip the HUD, Timed Messages and all Drawing. pygame still needs a
+    Display Surface to convert the Images, which the SDL Dummy Driver provides on Servers without Display.
+
+    Attributes:
+        __screen__ (pygame.Surface): The Surface the Game Objects are created for, never shown.
+        __gameObjectCreationService__ (GameObjectCreationService): Service to create Game Objects.
+        __mainMenu__ (MainMenu): Main Menu required by each Game Round, never opened.
+        __defaultMaxTicks__ (int): Tick Limit per Round if none is given.
+    """
+    __screen__: pygame.Surface
+    __gameObjectCreationService__: GameObjectCreationService
+    __mainMenu__: MainMenu
+    __defaultMaxTicks__: int
+
+    def __init__(self):
+        """
+        Initialize pygame with the Dummy Drivers, unless a Display is already open, and load the Assets.
+        """
+        config = getConfig()
+        screenConfig = config.getScreenConfig()
+        windowWidth: int = screenConfig.getScreenWidth()
+        windowHeight: int = screenConfig.getScreenHeight()
+        gameWidth: int = screenConfig.getGameWidth()
+        self.__defaultMaxTicks__ = config.getSimulationConfig().getHeadlessMaxTicks()
+
+        self.__screen__ = pygame.display.get_surface()
+        if self.__screen__ is None:
+            enableHeadlessDisplay()
+            pygame.init()
+            self.__screen__ = pygame.display.set_mode((windowWidth, windowHeight))
+
+        self.__gameObjectCreationService__ = GameObjectCreationService(self.__screen__, gameWidth, windowHeight)
+        self.__mainMenu__ = MainMenu(
+            screen=self.__screen__,
+            bigFont=32,
+            smallFont=22
+        )
+
+    def runRound(self, difficulty: GameDifficulty = None, maxTicks: int = None, seed: int = None) -> RoundResult:
+        """
+        Simulate a single Game Round as fast as possible.
+
+        Args:
+            difficulty (GameDifficulty): Difficulty of the Round, the Default Difficulty if None.
+            maxTicks (int): Ticks after which the Round is stopped, the configured Limit if None.
+            seed (int): Seed of the Round, the configured or a random Seed if None.
+
+        Returns:
+            RoundResult: Outcome, Tick Count and Timing of the Round.
+        """
+        if difficulty is None:
+            difficulty = GameDifficulty()
+        if maxTicks is None:
+            maxTicks = self.__defaultMaxTicks__
+
+        gameRound = GameRound(
+            difficulty=difficulty,
+            gameObjectCreationService=self.__gameObjectCreationService__,
+            mainMenu=self.__mainMenu__,
+            screen=self.__screen__,
+            headless=True,
+            seed=seed
+        )
+        return self.__simulate__(gameRound, maxTicks)
+
+    def replayRound(self, recording: InputRecording) -> RoundResult:
+        """
+        Simulate a recorded Game Round as fast as possible, feeding back the recorded Input.
+
+        Args:
+            recording (InputRecording): The Recording with Seed, Difficulty and Input of the Round.
+
+        Returns:
+            RoundResult: Outcome, Tick Count and Timing of the Replay.
+
+        Raises:
+            ValueError: If the Recording was made with other Simulation Settings.
+        """
+        gameRound = GameRound(
+            difficulty=recording.getDifficulty(),
+            gameObjectCreationService=self.__gameObjectCreationService__,
+            mainMenu=self.__mainMenu__,
+            screen=self.__screen__,
+            headless=True,
+            seed=recording.getSeed(),
+            replay=recording
+        )
+        return self.__simulate__(gameRound, recording.getTickCount())
+
+    def __simulate__(self, gameRound: GameRound, maxTicks: int) -> RoundResult:
+        """
+        Run Ticks until the Round ends or the Tick Limit is reached.
+        """
+        ticks = 0
+        startTime = time.perf_counter()
+        while gameRound.isPlaying() and ticks < maxTicks:
+            gameRound.update()
+            ticks += 1
+        seconds = time.perf_counter() - startTime
+
+        return RoundResult(
+            outcome=gameRound.getOutcome() or "timeout",
+            ticks=ticks,
+            seconds=seconds,
+            oreDelivered=gameRound.getOreDelivered(),
+            seed=gameRound.getSeed()
+        )
+
+    def runRounds(self, rounds: int, difficulty: GameDifficulty = None, maxTicks: int = None) -> list[RoundResult]:
+        """
+        Simulate several Game Rounds one after another.
+
+        Args:
+            rounds (int): Number of Rounds.
+            difficulty (GameDifficulty): Difficulty of every Round, the Default Difficulty if None.
+            maxTicks (int): Tick Limit per Round, the configured Limit if None.
+
+        Returns:
+            list[RoundResult]: The Result of every Round.
+        """
+        return [self.runRound(difficulty, maxTicks) for _ in range(rounds)]
+
+
+def formatReport(results: list[RoundResult]) -> str:
+    """
+    Summarize simulated Rounds with their Outcomes and the overall Tick Rate.
+
+    Args:
+        results (list[RoundResult]): The Results to summarize.
+
+    Returns:
+        str: A multi-line Report.
+    """
+    lines = [f"Round {index + 1}: {result}" for index, result in enumerate(results)]
+    totalTicks = sum(result.getTicks() for result in results)
+    totalSeconds = sum(result.getSeconds() for result in results)
+    outcomes = {outcome: sum(1 for result in results if result.getOutcome() == outcome) for outcome in ("won", "lost", "timeout")}
+    ticksPerSecond = totalTicks / totalSeconds if totalSeconds > 0 else 0.0
+    lines.append(
+        f"{len(results)} Rounds, {totalTicks} Ticks in {totalSeconds:.3f} s: {ticksPerSecond:.0f} Ticks/s "
+        f"(won={outcomes['won']}, lost={outcomes['lost']}, timeout={outcomes['timeout']})"
+    )
+    return "\n".join(lines)
+
+
+def runHeadlessFromConfig() -> list[RoundResult]:
+    """
+    Simulate the configured Number of Rounds headless and print the Report.
+
+    Returns:
+        list[RoundResult]: The Result of every Round.
+    """
+    simulationConfig = getConfig().getSimulationConfig()
+    simulationService = HeadlessSimulationService()
+    results = simulationService.runRounds(simulationConfig.getHeadlessRounds())
+    print(formatReport(results))
+    pygame.quit()
+    return results
+
+
+def runReplayFromFile(path: str) -> RoundResult:
+    """
+    Replay a recorded Round headless at maximum Speed, print its Result and compare it with the Recording.
+
+    Args:
+        path (str): Path of the Recording File.
+
+    Returns:
+        RoundResult: The Result of the Replay.
+    """
+    recording = loadInputRecording(path)
+    result = HeadlessSimulationService().replayRound(recording)
+    print(f"Replay: {result}")
+    recordedResult = recording.getResult()
+    if recordedResult is not None:
+        matches = (
+            recordedResult["outcome"] == result.getOutcome()
+            and recordedResult["ticks"] == result.getTicks()
+            and recordedResult["oreDelivered"] == result.getOreDelivered()
+        )
+        print(f"Recorded: {recordedResult} -> {'identical' if matches else 'DIFFERENT'}")
+    pygame.quit()
+    return result
\ No newline at end of file
@@ -0,0 +1,260 @@
+import time
+
+import pygame
+
+from Model.GameObjects.Base.GameObject import GameObject
+from Model.GameObjects.Base.RenderList import RenderList
+from Services.ConfigService import getConfig
+from Services.FrameProfilerService import FrameProfilerService
+
+
+class RenderService:
+    """
+    A Class that renders the Game Objects of a Game Round onto the Screen.
+
+    Two Render Modes can be selected with renderConfig.renderMode:
+        "full": Clear the whole Screen, draw every Object and update the whole Display each Frame.
+        "dirty": Compare the Render State of every drawn Image with the previous Frame, restore the
+            Background only inside the damaged Rectangles, redraw the Images overlapping them and pass
+            only these Rectangles to pygame.display.update.
+    The dirty Mode falls back to a full Redraw when the damaged Area exceeds renderConfig.dirtyAreaThreshold
+    (a Fraction of the Screen Area), e.g. when the Main Menu Overlay is opened or closed.
+
+    Static Objects (see GameObject.isStatic) are baked together with the Background Color into a
+    cached World Layer, which replaces clearing the Screen in both Modes. The World Layer is only
+    rebuilt when a static Object is added, removed or changes its Render State. Static Objects are
+    therefore always drawn beneath all other Objects.
+
+    Attributes:
+        __screen__ (pygame.Surface): The Surface to render on.
+        __backgroundColor__ (tuple[int, int, int]): Color of the empty Game Area.
+        __renderMode__ (str): The configured Render Mode, "full" or "dirty".
+        __dirtyAreaThreshold__ (float): Damaged Screen Fraction above which a full Redraw is done.
+        __screenRect__ (pygame.Rect): Rectangle covering the whole Screen.
+        __previousStates__ (dict[GameObject, tuple]): Render States of all Images drawn in the previous Frame.
+        __fullRedrawPending__ (bool): Whether the next Frame has to be redrawn completely.
+        __staticGameObjects__ (RenderList): Objects baked into the World Layer, in Layer Order.
+        __staticStates__ (list[tuple]): Render States of the static Images at the Time of Baking.
+        __worldLayer__ (pygame.Surface): Background and static Objects pre-composited in Screen Size.
+        __worldLayerValid__ (bool): Whether the World Layer matches the current static Objects.
+        __frameProfiler__ (FrameProfilerService): Receives the Draw and Display Times, None if not profiling.
+    """
+    __screen__: pygame.Surface
+    __backgroundColor__: tuple[int, int, int]
+    __renderMode__: str
+    __dirtyAreaThreshold__: float
+    __screenRect__: pygame.Rect
+    __previousStates__: dict[GameObject, tuple]
+    __fullRedrawPending__: bool
+    __staticGameObjects__: RenderList
+    __staticStates__: list[tuple]
+    __worldLayer__: pygame.Surface
+    __worldLayerValid__: bool
+    __frameProfiler__: FrameProfilerService
+
+    def __init__(self, screen: pygame.Surface, backgroundColor: tuple[int, int, int] = (10, 40, 10), frameProfiler: FrameProfilerService = None):
+        """
+        Initialize the RenderService with the Render Configuration.
+
+        Args:
+            screen (pygame.Surface): The Surface to render on.
+            backgroundColor (tuple[int, int, int]): Color of the empty Game Area.
+            frameProfiler (FrameProfilerService): Receives the "draw" and "display" Phase Times, if given.
+        """
+        self.__frameProfiler__ = frameProfiler
+        renderConfig = getConfig().getRenderConfig()
+        self.__screen__ = screen
+        self.__backgroundColor__ = backgroundColor
+        self.__renderMode__ = renderConfig.getRenderMode()
+        self.__dirtyAreaThreshold__ = renderConfig.getDirtyAreaThreshold()
+        self.__screenRect__ = screen.get_rect()
+        self.__previousStates__ = {}
+        self.__fullRedrawPending__ = True
+        self.__staticGameObjects__ = RenderList()
+        self.__staticStates__ = []
+        # Share the Pixel Format of the Screen so restoring the Background is a plain Copy
+        self.__worldLayer__ = pygame.Surface(screen.get_size(), 0, screen)
+        self.__worldLayerValid__ = False
+
+    def addStaticGameObject(self, gameObject: GameObject) -> None:
+        """
+        Add an Object to the pre-composited World Layer.
+
+        Args:
+            gameObject (GameObject): A static Object, it must not move or rotate on its own.
+        """
+        self.__staticGameObjects__.add(gameObject)
+        self.__worldLayerValid__ = False
+
+    def removeStaticGameObject(self, gameObject: GameObject) -> None:
+        """
+        Remove an Object from the pre-composited World Layer.
+
+        Args:
+            gameObject (GameObject): A previously added static Object.
+        """
+        self.__staticGameObjects__.remove(gameObject)
+        self.__worldLayerValid__ = False
+
+    def getStaticGameObjects(self) -> RenderList:
+        return self.__staticGameObjects__
+
+    def invalidate(self) -> None:
+        """
+        Force the next Frame to be redrawn completely, e.g. after something else drew on the Screen.
+        """
+        self.__fullRedrawPending__ = True
+
+    def render(self, gameObjects: list[GameObject]) -> None:
+        """
+        Render the given Game Objects in List Order and update the Display.
+
+        Args:
+            gameObjects (list[GameObject]): The Objects to render, already sorted by Drawing Order.
+        """
+        drawStart = time.perf_counter() if self.__frameProfiler__ is not None else 0.0
+        self.__validateWorldLayer__()
+        if self.__renderMode__ != "dirty":
+            self.__drawFull__(gameObjects)
+            self.__updateDisplay__(drawStart)
+            return
+
+        drawables: list = []
+        for gameObject in gameObjects:
+            gameObject.collectDrawables(drawables)
+        currentStates: dict[GameObject, tuple] = {drawable: drawable.getRenderState() for drawable in drawables}
+
+        damagedRects: list[pygame.Rect] = []
+        if not self.__fullRedrawPending__:
+            damagedRects = self.__mergeRects__(self.__collectDamagedRects__(currentStates))
+            damagedArea = sum(rect.width * rect.height for rect in damagedRects)
+            if damagedArea > self.__dirtyAreaThreshold__ * self.__screenRect__.width * self.__screenRect__.height:
+                self.__fullRedrawPending__ = True
+
+        self.__previousStates__ = currentStates
+        if self.__fullRedrawPending__:
+            self.__fullRedrawPending__ = False
+            self.__restoreBackground__(self.__screenRect__)
+            for drawable in drawables:
+                drawable.draw()
+            self.__updateDisplay__(drawStart)
+            return
+
+        for damagedRect in damagedRects:
+            # Only Pixels inside the damaged Rectangle may change, so clip every Blit to it
+            self.__screen__.set_clip(damagedRect)
+            self.__restoreBackground__(damagedRect)
+            for drawable in drawables:
+                if damagedRect.colliderect(currentStates[drawable][0]):
+                    drawable.draw()
+        self.__screen__.set_clip(None)
+        self.__updateDisplay__(drawStart, damagedRects)
+
+    def renderFull(self, gameObjects: list[GameObject], updateDisplay: bool = True) -> None:
+        """
+        Clear the Screen and draw all given Game Objects, regardless of the Render Mode.
+
+        Args:
+            gameObjects (list[GameObject]): The Objects to render, already sorted by Drawing Order.
+            updateDisplay (bool): Whether to push the Frame to the Display afterwards.
+        """
+        self.__validateWorldLayer__()
+        self.__drawFull__(gameObjects)
+        if updateDisplay:
+            pygame.display.update()
+
+    def __drawFull__(self, gameObjects: list[GameObject]) -> None:
+        """
+        Restore the whole Background and draw all given Game Objects without updating the Display.
+        """
+        self.__restoreBackground__(self.__screenRect__)
+        for gameObject in gameObjects:
+            gameObject.draw()
+        # Anything drawn outside the dirty Bookkeeping requires a complete Redraw next Frame
+        self.__fullRedrawPending__ = True
+
+    def __updateDisplay__(self, drawStart: float, rects: list[pygame.Rect] = None) -> None:
+        """
+        Push the drawn Frame to the Display and report the Draw and Display Times to the Profiler.
+
+        Args:
+            drawStart (float): perf_counter Value when drawing the Frame began.
+            rects (list[pygame.Rect]): The changed Areas, None to update the whole Display.
+        """
+        profiler = self.__frameProfiler__
+        displayStart = time.perf_counter() if profiler is not None else 0.0
+        if rects is None:
+            pygame.display.update()
+        elif rects:
+            pygame.display.update(rects)
+        if profiler is not None:
+            displayEnd = time.perf_counter()
+            profiler.addPhaseTime("draw", displayStart - drawStart)
+            profiler.addPhaseTime("display", displayEnd - displayStart)
+
+    def __collectDamagedRects__(self, currentStates: dict[GameObject, tuple]) -> list[pygame.Rect]:
+        """
+        Compare the current Render States with the previous Frame.
+
+        Returns:
+            list[pygame.Rect]: The old and new Rectangles of every Image that appeared, disappeared or changed.
+        """
+        damagedRects: list[pygame.Rect] = []
+        previousStates = self.__previousStates__
+        for drawable, state in currentStates.items():
+            previousState = previousStates.get(drawable)
+            if previousState is None:
+                damagedRects.append(state[0])
+            elif previousState != state:
+                damagedRects.append(previousState[0])
+                damagedRects.append(state[0])
+        for drawable, previousState in previousStates.items():
+            if drawable not in currentStates:
+                damagedRects.append(previousState[0])
+        return damagedRects
+
+    def __mergeRects__(self, rects: list[pygame.Rect]) -> list[pygame.Rect]:
+        """
+        Clip the Rectangles to the Screen and merge overlapping ones until no two of them overlap.
+
+        Returns:
+            list[pygame.Rect]: Disjoint Rectangles covering all given Rectangles.
+        """
+        mergedRects: list[pygame.Rect] = []
+        for rect in rects:
+            rect = rect.clip(self.__screenRect__)
+            if rect.width == 0 or rect.height == 0:
+                continue
+            index = rect.collidelist(mergedRects)
+            while index != -1:
+                rect.union_ip(mergedRects.pop(index))
+                index = rect.collidelist(mergedRects)
+            mergedRects.append(rect)
+        return mergedRects
+
+    def __validateWorldLayer__(self) -> None:
+        """
+        Rebuild the World Layer if a static Object was added, removed or changed its Appearance.
+        """
+        staticDrawables: list = []
+        for staticGameObject in self.__staticGameObjects__:
+            staticGameObject.collectDrawables(staticDrawables)
+        staticStates = [drawable.getRenderState() for drawable in staticDrawables]
+        if self.__worldLayerValid__ and staticStates == self.__staticStates__:
+            return
+
+        self.__worldLayer__.fill(self.__backgroundColor__)
+        for drawable in staticDrawables:
+            drawable.drawOnto(self.__worldLayer__)
+        self.__staticStates__ = staticStates
+        self.__worldLayerValid__ = True
+        self.__fullRedrawPending__ = True
+
+    def __restoreBackground__(self, rect: pygame.Rect) -> None:
+        """
+        Restore the Background and static Objects inside the given Rectangle from the World Layer.
+        """
+        self.__screen__.blit(self.__worldLayer__, rect, rect)
+
+    def getRenderMode(self) -> str:
+        return self.__renderMode__
\ No newline at end of file
@@ -0,0 +1,175 @@
+import math
+from collections import OrderedDict
+
+import pygame
+
+from Services.ConfigService import getConfig
+
+ROTATION_CACHE_INSTANCE = None
+
+
+class RotationCacheService:
+    """
+    A Class representing a shared Cache for rotated Images.
+
+    Rotating an Image with pygame.transform.rotate resamples every Pixel, which is too expensive
+    to repeat each Frame for every Object. This Cache quantizes the requested Angle to a configured
+    Resolution and keeps the rotated Surfaces keyed by (Image Identity, Angle Index).
+    Entries are evicted in Least Recently Used Order once the Byte Budget is exceeded.
+
+    Attributes:
+        __angleStep__ (float): Angle Resolution in Degrees.
+        __stepsPerTurn__ (int): Number of quantized Angles in a full Turn.
+        __maxBytes__ (int): Byte Budget for all cached Surfaces.
+        __usedBytes__ (int): Bytes currently used by cached Surfaces.
+        __entries__ (OrderedDict): Cached Entries in LRU Order, mapping (id(image), angleIndex) to (image, rotatedImage, bytes).
+        __hits__ (int): Number of Lookups answered from the Cache.
+        __misses__ (int): Number of Lookups that required a Rotation.
+    """
+    __angleStep__: float
+    __stepsPerTurn__: int
+    __maxBytes__: int
+    __usedBytes__: int
+    __entries__: OrderedDict
+    __hits__: int
+    __misses__: int
+
+    def __init__(self, angleStep: float = 1.0, maxBytes: int = 64 * 1024 * 1024):
+        """
+        Initialize the RotationCacheService.
+
+        Args:
+            angleStep (float): Angle Resolution in Degrees. Requested Angles are rounded to a Multiple of it.
+            maxBytes (int): Byte Budget for all cached Surfaces.
+        """
+        self.__stepsPerTurn__ = max(1, round(360 / angleStep))
+        self.__angleStep__ = 360 / self.__stepsPerTurn__
+        self.__maxBytes__ = maxBytes
+        self.__usedBytes__ = 0
+        self.__entries__ = OrderedDict()
+        self.__hits__ = 0
+        self.__misses__ = 0
+
+    def getRotatedImage(self, image: pygame.Surface, angle: float) -> pygame.Surface:
+        """
+        Return the given Image rotated by the quantized Angle.
+
+        Angles that quantize to 0 return the Image itself, so unrotated Objects never allocate.
+
+        Args:
+            image (pygame.Surface): The Source Image.
+            angle (float): Rotation Angle in Degrees.
+
+        Returns:
+            pygame.Surface: The rotated Image.
+        """
+        angleIndex = self.__getAngleIndex__(angle)
+        if angleIndex == 0:
+            return image
+
+        key = (id(image), angleIndex)
+        entry = self.__entries__.get(key)
+        if entry is not None:
+            self.__entries__.move_to_end(key)
+            self.__hits__ += 1
+            return entry[1]
+
+        self.__misses__ += 1
+        return self.__insert__(image, angleIndex)
+
+    def prewarm(self, image: pygame.Surface) -> None:
+        """
+        Rotate the Image into every quantized Angle ahead of Time.
+
+        Stops early if the Byte Budget would be exceeded, so pre-warming never evicts other Entries.
+
+        Args:
+            image (pygame.Surface): The Source Image.
+        """
+        for angleIndex in range(1, self.__stepsPerTurn__):
+            if (id(image), angleIndex) in self.__entries__:
+                continue
+            rotatedImage = pygame.transform.rotate(image, angleIndex * self.__angleStep__)
+            size = rotatedImage.get_pitch() * rotatedImage.get_height()
+            if self.__usedBytes__ + size > self.__maxBytes__:
+                return
+            self.__store__(image, angleIndex, rotatedImage, size)
+
+    def invalidate(self, image: pygame.Surface) -> None:
+        """
+        Drop all cached Rotations of an Image, e.g. after its Pixels were modified in place.
+
+        Args:
+            image (pygame.Surface): The Source Image.
+        """
+        imageId = id(image)
+        for key in [key for key in self.__entries__ if key[0] == imageId]:
+            self.__usedBytes__ -= self.__entries__.pop(key)[2]
+
+    def clear(self) -> None:
+        """
+        Drop all cached Rotations.
+        """
+        self.__entries__.clear()
+        self.__usedBytes__ = 0
+
+    def __getAngleIndex__(self, angle: float) -> int:
+        """
+        Quantize an Angle to the Index of the nearest cached Angle.
+        """
+        return math.floor(angle / self.__angleStep__ + 0.5) % self.__stepsPerTurn__
+
+    def __insert__(self, image: pygame.Surface, angleIndex: int) -> pygame.Surface:
+        """
+        Rotate the Image, store it and evict the least recently used Entries above the Byte Budget.
+        """
+        rotatedImage = pygame.transform.rotate(image, angleIndex * self.__angleStep__)
+        self.__store__(image, angleIndex, rotatedImage, rotatedImage.get_pitch() * rotatedImage.get_height())
+        while self.__usedBytes__ > self.__maxBytes__ and len(self.__entries__) > 1:
+            self.__usedBytes__ -= self.__entries__.popitem(last=False)[1][2]
+        return rotatedImage
+
+    def __store__(self, image: pygame.Surface, angleIndex: int, rotatedImage: pygame.Surface, size: int) -> None:
+        # The Source Image is kept alive by the Entry, so its id() cannot be reused while cached
+        self.__entries__[(id(image), angleIndex)] = (image, rotatedImage, size)
+        self.__usedBytes__ += size
+
+    def getAngleStep(self) -> float:
+        return self.__angleStep__
+
+    def getUsedBytes(self) -> int:
+        return self.__usedBytes__
+
+    def getMaxBytes(self) -> int:
+        return self.__maxBytes__
+
+    def getHits(self) -> int:
+        return self.__hits__
+
+    def getMisses(self) -> int:
+        return self.__misses__
+
+    def __str__(self) -> str:
+        return (
+            f"{type(self).__name__} (angleStep={self.__angleStep__}, entries={len(self.__entries__)}, "
+            f"usedBytes={self.__usedBytes__}, maxBytes={self.__maxBytes__}, hits={self.__hits__}, misses={self.__misses__})"
+        )
+
+
+def getRotationCache() -> RotationCacheService:
+    """
+    Retrieve the process-wide RotationCacheService Instance.
+
+    Creates the Instance from the Render Configuration on first Use.
+
+    Returns:
+        RotationCacheService: The shared Rotation Cache.
+    """
+    global ROTATION_CACHE_INSTANCE
+    if ROTATION_CACHE_INSTANCE is None:
+        renderConfig = getConfig().getRenderConfig()
+        ROTATION_CACHE_INSTANCE = RotationCacheService(
+            angleStep=renderConfig.getRotationCacheAngleStep(),
+            maxBytes=renderConfig.getRotationCacheMaxBytes()
+        )
+    return ROTATION_CACHE_INSTANCE
\ No newline at end of file
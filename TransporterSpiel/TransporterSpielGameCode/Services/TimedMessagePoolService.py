@@ -0,0 +1,121 @@
+import pygame
+
+from Model.GameObjects.Messages.TimedMessage import TimedTextGameObject
+
+
+class TimedMessagePoolService:
+    """
+    A Class recycling the TimedTextGameObjects of the short Messages shown during a Game Round.
+
+    Every Refuel, Load, Unload or Theft shows a Message for a few Seconds. Instead of creating a
+    new Message with its Text Surface and Background Surface each Time, expired Messages are
+    released into the Pool. acquire prefers a free Message that last showed the same Text, which is
+    shown again without rendering anything. Otherwise any free Message is restarted, which renders
+    only its new Text and reuses a Background Surface it already has in the needed Size. Only if no
+    Message is free, a new one is created.
+
+    Attributes:
+        __screen__ (pygame.Surface): The Surface the Messages are drawn on.
+        __fontSize__ (int): Font Size of all Messages of the Pool.
+        __capacity__ (int): Maximum Number of free Messages kept, further released Messages are dropped.
+        __freeMessages__ (list[TimedTextGameObject]): The expired Messages waiting for Reuse.
+        __hitCount__ (int): Number of acquire Calls served with a free Message.
+        __missCount__ (int): Number of acquire Calls that had to create a new Message.
+        __textRenderCount__ (int): Number of Hits whose Text differed and was rendered again.
+    """
+    __screen__: pygame.Surface
+    __fontSize__: int
+    __capacity__: int
+    __freeMessages__: list[TimedTextGameObject]
+    __hitCount__: int
+    __missCount__: int
+    __textRenderCount__: int
+
+    def __init__(self, screen: pygame.Surface, fontSize: int = 24, capacity: int = 16):
+        """
+        Initialize an empty TimedMessagePoolService.
+
+        Args:
+            screen (pygame.Surface): The Surface the Messages are drawn on.
+            fontSize (int): Font Size of all Messages of the Pool.
+            capacity (int): Maximum Number of free Messages kept for Reuse.
+        """
+        self.__screen__ = screen
+        self.__fontSize__ = fontSize
+        self.__capacity__ = capacity
+        self.__freeMessages__ = []
+        self.__hitCount__ = 0
+        self.__missCount__ = 0
+        self.__textRenderCount__ = 0
+
+    def acquire(self, message: str, xCoordinate: float, yCoordinate: float, duration: float) -> TimedTextGameObject:
+        """
+        Return a Message showing the given Text from the Start of its Fade, reused from the Pool if possible.
+
+        Args:
+            message (str): The Text to show.
+            xCoordinate (float): X-Coordinate of the Center of the Message.
+            yCoordinate (float): Y-Coordinate of the Center of the Message.
+            duration (float): Seconds until the Message expires.
+
+        Returns:
+            TimedTextGameObject: The Message, to be released again once it expired.
+        """
+        freeMessages = self.__freeMessages__
+        if not freeMessages:
+            self.__missCount__ += 1
+            return TimedTextGameObject(
+                message=message,
+                xCoordinate=xCoordinate,
+                yCoordinate=yCoordinate,
+                fontSize=self.__fontSize__,
+                screen=self.__screen__,
+                duration=duration
+            )
+
+        self.__hitCount__ += 1
+        # Prefer the most recently released Message with the same Text, as it needs no Rendering
+        index = len(freeMessages) - 1
+        while index >= 0 and freeMessages[index].getMessage() != message:
+            index -= 1
+        if index < 0:
+            index = len(freeMessages) - 1
+            self.__textRenderCount__ += 1
+        timedMessage = freeMessages.pop(index)
+        timedMessage.restart(message, xCoordinate, yCoordinate, duration)
+        return timedMessage
+
+    def release(self, timedMessage: TimedTextGameObject) -> None:
+        """
+        Return an expired Message to the Pool. It must no longer be drawn by the Caller.
+
+        Args:
+            timedMessage (TimedTextGameObject): A Message returned by acquire.
+        """
+        if len(self.__freeMessages__) < self.__capacity__:
+            self.__freeMessages__.append(timedMessage)
+
+    def getHitCount(self) -> int:
+        return self.__hitCount__
+
+    def getMissCount(self) -> int:
+        return self.__missCount__
+
+    def getTextRenderCount(self) -> int:
+        return self.__textRenderCount__
+
+    def getFreeCount(self) -> int:
+        return len(self.__freeMessages__)
+
+    def getHitRate(self) -> float:
+        """
+        Return the Share of acquire Calls served from the Pool, 0 before the first Call.
+        """
+        requests = self.__hitCount__ + self.__missCount__
+        return self.__hitCount__ / requests if requests else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{type(self).__name__} (hits={self.__hitCount__}, misses={self.__missCount__}, "
+            f"textRenders={self.__textRenderCount__}, free={len(self.__freeMessages__)}, capacity={self.__capacity__})"
+        )
\ No newline at end of file
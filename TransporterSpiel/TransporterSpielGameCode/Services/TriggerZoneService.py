@@ -0,0 +1,145 @@
+from Model.GameObjects.Base.ImageGameObject import ImageGameObject
+from Model.GameObjects.Base.SpatialHashGrid import SpatialHashGrid
+from Model.GameObjects.Game.TriggerZone import TriggerZone
+
+
+class TriggerZoneService:
+    """
+    A Class emitting Enter, Stay and Exit Events of Activators touching Trigger Zones.
+
+    Only the Zone Owners are in the Spatial Hash Grid. Every Tick, each Activator, e.g. the Ore
+    Transport, queries the Grid with its Collision Circle, which compares squared Distances of the
+    nearby Owners only. The touched Zones are compared with the Contacts of the previous Tick: new
+    Contacts enter, lasting Contacts stay and missing Contacts exit. The Cost therefore grows with the
+    Activators and their actual Contacts instead of polling every Station.
+
+    Enter and Stay Events of an Activator in a Zone are at least stayInterval Ticks of the Zone apart,
+    also across Exits. An Activator edging in and out of a Zone enters again only once the Interval
+    since its last Event passed, so it cannot interact more often than staying inside.
+
+    Attributes:
+        __collisionGrid__ (SpatialHashGrid): The Broadphase containing the Zone Owners.
+        __zones__ (dict[ImageGameObject, TriggerZone]): The Zone of every Owner.
+        __activators__ (list[ImageGameObject]): The Objects that trigger the Zones.
+        __contacts__ (dict[tuple[TriggerZone, ImageGameObject], bool]): Whether every current Contact already entered.
+        __lastEventTicks__ (dict[tuple[TriggerZone, ImageGameObject], int]): Tick of the last Enter or Stay Event of every Contact, kept after Exits.
+        __tickCount__ (int): Number of Ticks so far.
+    """
+    __collisionGrid__: SpatialHashGrid
+    __zones__: dict[ImageGameObject, TriggerZone]
+    __activators__: list[ImageGameObject]
+    __contacts__: dict[tuple[TriggerZone, ImageGameObject], bool]
+    __lastEventTicks__: dict[tuple[TriggerZone, ImageGameObject], int]
+    __tickCount__: int
+
+    def __init__(self, collisionGrid: SpatialHashGrid):
+        """
+        Initialize a TriggerZoneService without Zones.
+
+        Args:
+            collisionGrid (SpatialHashGrid): The Broadphase, the Zone Owners are added to it.
+        """
+        self.__collisionGrid__ = collisionGrid
+        self.__zones__ = {}
+        self.__activators__ = []
+        self.__contacts__ = {}
+        self.__lastEventTicks__ = {}
+        self.__tickCount__ = 0
+
+    def addZone(self, zone: TriggerZone) -> None:
+        """
+        Register a Zone, one per Owner. Zones registered earlier handle their Events first.
+
+        Raises:
+            ValueError: If the Owner already has a Zone.
+        """
+        owner = zone.getOwner()
+        if owner in self.__zones__:
+            raise ValueError(f"{type(owner).__name__} already has a TriggerZone")
+        zone.setPriority(len(self.__zones__))
+        self.__zones__[owner] = zone
+        self.__collisionGrid__.add(owner)
+
+    def removeZone(self, zone: TriggerZone) -> None:
+        """
+        Remove a Zone and its Contacts without Exit Events.
+        """
+        del self.__zones__[zone.getOwner()]
+        self.__collisionGrid__.remove(zone.getOwner())
+        self.__contacts__ = {key: entered for key, entered in self.__contacts__.items() if key[0] is not zone}
+        self.__lastEventTicks__ = {key: tick for key, tick in self.__lastEventTicks__.items() if key[0] is not zone}
+
+    def addActivator(self, activator: ImageGameObject) -> None:
+        if activator not in self.__activators__:
+            self.__activators__.append(activator)
+
+    def removeActivator(self, activator: ImageGameObject) -> None:
+        """
+        Remove an Activator and its Contacts without Exit Events.
+        """
+        self.__activators__.remove(activator)
+        self.__contacts__ = {key: entered for key, entered in self.__contacts__.items() if key[1] is not activator}
+        self.__lastEventTicks__ = {key: tick for key, tick in self.__lastEventTicks__.items() if key[1] is not activator}
+
+    def clearContacts(self) -> None:
+        """
+        Forget all Contacts and past Events without Exit Events, e.g. when the Round restarts and the Activators are put back.
+        """
+        self.__contacts__.clear()
+        self.__lastEventTicks__.clear()
+        self.__tickCount__ = 0
+
+    def tick(self) -> None:
+        """
+        Update the Contacts after the Objects moved and emit their Events, Exits first.
+        """
+        self.__tickCount__ += 1
+        tickCount = self.__tickCount__
+        collisionGrid = self.__collisionGrid__
+        zones = self.__zones__
+        collisionGrid.refresh()
+        touchedKeys: list[tuple[TriggerZone, ImageGameObject]] = []
+        for activator in self.__activators__:
+            touchedOwners = collisionGrid.queryOverlapping(activator)
+            if touchedOwners:
+                touchedZones = sorted((zones[owner] for owner in touchedOwners), key=TriggerZone.getPriority)
+                touchedKeys.extend((zone, activator) for zone in touchedZones)
+
+        previousContacts = self.__contacts__
+        if not touchedKeys and not previousContacts:
+            # Nothing touches any Zone, like most of the Time
+            return
+        contacts: dict[tuple[TriggerZone, ImageGameObject], bool] = {}
+        for key in touchedKeys:
+            contacts[key] = previousContacts.pop(key, False)
+        self.__contacts__ = contacts
+
+        for (zone, activator), entered in previousContacts.items():
+            if entered:
+                zone.exit(activator)
+        lastEventTicks = self.__lastEventTicks__
+        for key, entered in contacts.items():
+            zone, activator = key
+            lastEventTick = lastEventTicks.get(key)
+            if lastEventTick is not None and tickCount - lastEventTick < zone.getStayInterval():
+                continue
+            lastEventTicks[key] = tickCount
+            if entered:
+                zone.stay(activator)
+            else:
+                # A Contact whose Enter was delayed by a recent Event enters now
+                contacts[key] = True
+                zone.enter(activator)
+
+    def isInside(self, activator: ImageGameObject, owner: ImageGameObject) -> bool:
+        """
+        Return whether the Activator touched the Zone of the Owner in the last Tick.
+        """
+        zone = self.__zones__.get(owner)
+        return zone is not None and (zone, activator) in self.__contacts__
+
+    def getContactCount(self) -> int:
+        return len(self.__contacts__)
+
+    def __str__(self) -> str:
+        return f"{type(self).__name__} (zones={len(self.__zones__)}, activators={len(self.__activators__)}, contacts={len(self.__contacts__)})"
\ No newline at end of file
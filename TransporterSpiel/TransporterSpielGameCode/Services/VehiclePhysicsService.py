@@ -0,0 +1,287 @@
+try:
+    import numpy
+except ImportError:
+    # NumPy is optional, without it every Vehicle moves itself (vehiclePhysicsBackend "python")
+    numpy = None
+
+
+def isVectorizedPhysicsAvailable() -> bool:
+    """
+    Return whether NumPy is installed, which the vectorized Vehicle Physics require.
+    """
+    return numpy is not None
+
+
+class PhysicsColumn:
+    """
+    A Descriptor for a Vehicle Attribute that can live in a Row of a VehiclePhysicsService.
+
+    While the Vehicle is not attached to a Service, the Value is kept in the Storage Slot of the Vehicle,
+    named like the Attribute with "Value" appended (e.g. __speedValue__ for __speed__), which the Class
+    has to declare in its __slots__. While attached, the Value is read from and written to the Column of
+    the Attribute Name, so the Vehicle is a thin View over its Row and the Service can advance all
+    Rows at once.
+
+    Attributes:
+        __columnName__ (str): Name of the Attribute and of the Column.
+        __isInteger__ (bool): Whether the Column holds Integers instead of Floats.
+        __storage__ (member_descriptor): The Storage Slot used while the Vehicle is not attached.
+    """
+    __columnName__: str
+    __isInteger__: bool
+    __storage__: object
+
+    def __init__(self, isInteger: bool = False):
+        self.__columnName__ = ""
+        self.__isInteger__ = isInteger
+        self.__storage__ = None
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.__columnName__ = name
+        storageSlotName = getStorageSlotName(name)
+        if storageSlotName not in owner.__dict__:
+            raise TypeError(f"{owner.__name__} must declare the Slot {storageSlotName} for the PhysicsColumn {name}")
+        self.__storage__ = owner.__dict__[storageSlotName]
+
+    def getColumnName(self) -> str:
+        return self.__columnName__
+
+    def isInteger(self) -> bool:
+        return self.__isInteger__
+
+    def getLocalValue(self, vehicle):
+        """
+        Return the Value kept in the Vehicle itself, i.e. while it is not attached.
+        """
+        return self.__storage__.__get__(vehicle)
+
+    def setLocalValue(self, vehicle, value) -> None:
+        self.__storage__.__set__(vehicle, value)
+
+    def __get__(self, vehicle, owner: type = None):
+        if vehicle is None:
+            return self
+        physicsService = vehicle.__physicsService__
+        if physicsService is None:
+            return self.__storage__.__get__(vehicle)
+        return physicsService.__columns__[self.__columnName__].item(vehicle.__physicsRow__)
+
+    def __set__(self, vehicle, value) -> None:
+        physicsService = vehicle.__physicsService__
+        if physicsService is None:
+            self.__storage__.__set__(vehicle, value)
+        else:
+            physicsService.__columns__[self.__columnName__][vehicle.__physicsRow__] = value
+
+
+def getStorageSlotName(columnName: str) -> str:
+    """
+    Return the Name of the Slot storing a PhysicsColumn while its Vehicle is not attached.
+
+    Args:
+        columnName (str): The Attribute Name, e.g. "__speed__".
+
+    Returns:
+        str: The Slot Name, e.g. "__speedValue__".
+    """
+    return f"{columnName[:-2]}Value__"
+
+
+class VehiclePhysicsService:
+    """
+    A Class advancing the Movement, Friction and Fuel Burn of many Vehicles in one vectorized Step.
+
+    Attached Vehicles store their Physics State (see the PhysicsColumn Attributes of Vehicle) in NumPy
+    Arrays with one Row per Vehicle. During a Simulation Tick, Vehicle.update and Vehicle.__move__ of an
+    attached Vehicle only request Friction and Movement for its Row, and step() then applies them to
+    all requested Rows with Array Operations instead of Python Float Math per Vehicle. Steering,
+    Acceleration and the Helicopter AI still run per Vehicle through the same Attributes.
+
+    Movement is applied after all Vehicles were updated, so within a Tick a Vehicle sees the other
+    Vehicles at their Position from the previous Tick. The Results therefore differ slightly from the
+    "python" Backend, where each Vehicle moves during its own Update.
+
+    Attributes:
+        __physicsColumns__ (list[PhysicsColumn]): The Vehicle Attributes stored in Columns.
+        __columns__ (dict[str, numpy.ndarray]): One Array per Physics Attribute, indexed by Row.
+        __frictionRequested__ (numpy.ndarray): Rows that apply Friction in the next Step.
+        __moveRequested__ (numpy.ndarray): Rows that move in the next Step.
+        __vehicles__ (list[Vehicle]): The attached Vehicle of every used Row.
+        __tickScale__ (float): Factor for the per-Tick Values at the configured Tick Rate.
+    """
+    __physicsColumns__: list
+    __columns__: dict
+    __frictionRequested__: 'numpy.ndarray'
+    __moveRequested__: 'numpy.ndarray'
+    __vehicles__: list
+    __tickScale__: float
+
+    def __init__(self, columns: list[PhysicsColumn], tickScale: float = 1.0, capacity: int = 16):
+        """
+        Initialize a VehiclePhysicsService with empty Rows.
+
+        Args:
+            columns (list[PhysicsColumn]): The Vehicle Attributes to store in Columns.
+            tickScale (float): Factor for the per-Tick Values, see FixedTimestep.getTickScale.
+            capacity (int): Number of Rows to allocate initially, grown on Demand.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if numpy is None:
+            raise ImportError("The vectorized Vehicle Physics require NumPy")
+        self.__physicsColumns__ = list(columns)
+        self.__columns__ = {
+            column.getColumnName(): numpy.zeros(capacity, dtype=numpy.int64 if column.isInteger() else numpy.float64)
+            for column in columns
+        }
+        self.__frictionRequested__ = numpy.zeros(capacity, dtype=bool)
+        self.__moveRequested__ = numpy.zeros(capacity, dtype=bool)
+        self.__vehicles__ = []
+        self.__tickScale__ = tickScale
+
+    def attach(self, vehicle) -> None:
+        """
+        Move the Physics State of a Vehicle into a new Row and make the Vehicle a View over it.
+
+        Args:
+            vehicle (Vehicle): The Vehicle to attach, it must not be attached to any Service.
+
+        Raises:
+            ValueError: If the Vehicle is already attached.
+        """
+        if vehicle.__physicsService__ is not None:
+            raise ValueError(f"{type(vehicle).__name__} is already attached to a VehiclePhysicsService")
+        row = len(self.__vehicles__)
+        if row == len(self.__moveRequested__):
+            self.__grow__(2 * row)
+        for physicsColumn in self.__physicsColumns__:
+            self.__columns__[physicsColumn.getColumnName()][row] = physicsColumn.getLocalValue(vehicle)
+        self.__vehicles__.append(vehicle)
+        vehicle.__physicsRow__ = row
+        vehicle.__physicsService__ = self
+
+    def detach(self, vehicle) -> None:
+        """
+        Copy the Physics State of a Vehicle back into the Vehicle and free its Row.
+
+        The last Row is moved into the freed Row, so the used Rows stay contiguous.
+
+        Args:
+            vehicle (Vehicle): An attached Vehicle.
+
+        Raises:
+            ValueError: If the Vehicle is not attached to this Service.
+        """
+        if vehicle.__physicsService__ is not self:
+            raise ValueError(f"{type(vehicle).__name__} is not attached to this VehiclePhysicsService")
+        row = vehicle.__physicsRow__
+        for physicsColumn in self.__physicsColumns__:
+            physicsColumn.setLocalValue(vehicle, self.__columns__[physicsColumn.getColumnName()].item(row))
+        vehicle.__physicsService__ = None
+
+        lastRow = len(self.__vehicles__) - 1
+        lastVehicle = self.__vehicles__.pop()
+        if row != lastRow:
+            for column in self.__columns__.values():
+                column[row] = column[lastRow]
+            self.__frictionRequested__[row] = self.__frictionRequested__[lastRow]
+            self.__moveRequested__[row] = self.__moveRequested__[lastRow]
+            self.__vehicles__[row] = lastVehicle
+            lastVehicle.__physicsRow__ = row
+        self.__frictionRequested__[lastRow] = False
+        self.__moveRequested__[lastRow] = False
+
+    def detachAll(self) -> None:
+        """
+        Detach all Vehicles, e.g. when the Game Round ends.
+        """
+        while self.__vehicles__:
+            self.detach(self.__vehicles__[-1])
+
+    def requestUpdate(self, row: int, friction: bool) -> None:
+        """
+        Request that a Row moves in the next Step.
+
+        Args:
+            row (int): The Row of the Vehicle.
+            friction (bool): Whether Friction slows the Vehicle down before it moves.
+        """
+        self.__moveRequested__[row] = True
+        if friction:
+            self.__frictionRequested__[row] = True
+
+    def step(self) -> None:
+        """
+        Apply Friction, Movement and Fuel Burn to all requested Rows and clear the Requests.
+
+        Performs the same Calculation as Vehicle.update and Vehicle.__move__, for all Rows at once.
+        The Change Counter of every Row whose Speed or Fuel Level changed is increased.
+        """
+        rows = len(self.__vehicles__)
+        if rows == 0:
+            return
+        columns = self.__columns__
+        speed = columns["__speed__"][:rows]
+        fuelLevel = columns["__fuelLevel__"][:rows]
+        friction = self.__frictionRequested__[:rows]
+        move = self.__moveRequested__[:rows]
+
+        # Friction, nudging slow Vehicles to a Standstill
+        frictionStep = 0.001 * self.__tickScale__
+        forward = friction & (speed > 0.01)
+        backward = friction & (speed < -0.01)
+        stopping = friction & ~forward & ~backward & (speed != 0)
+        newSpeed = numpy.where(forward, numpy.maximum(0.0, speed - frictionStep), speed)
+        newSpeed = numpy.where(backward, numpy.minimum(0.0, speed + frictionStep), newSpeed)
+        newSpeed[stopping] = 0.0
+        changed = newSpeed != speed
+        speed[:] = newSpeed
+
+        # Movement along the Orientation, Speed is given per Reference Tick
+        distance = numpy.where(move, speed * self.__tickScale__, 0.0)
+        radians = numpy.radians(columns["__orientation__"][:rows])
+        columns["__xCoordinate__"][:rows] += numpy.cos(radians) * distance
+        columns["__yCoordinate__"][:rows] -= numpy.sin(radians) * distance
+
+        # Fuel Burn based on the covered Distance
+        fuelUsed = columns["__fuelConsumption__"][:rows] / 10 * numpy.abs(distance)
+        burning = move & (fuelUsed > 0) & (fuelLevel > 0)
+        fuelLevel[burning] = numpy.maximum(0.0, fuelLevel[burning] - fuelUsed[burning])
+        changed |= burning
+
+        columns["__changeCount__"][:rows] += changed
+        friction[:] = False
+        move[:] = False
+
+    def getVehicleCount(self) -> int:
+        return len(self.__vehicles__)
+
+    def getColumn(self, columnName: str) -> 'numpy.ndarray':
+        """
+        Return a View of the used Rows of a Column, e.g. for Analysis or vectorized Game Logic.
+
+        Args:
+            columnName (str): Name of the Vehicle Attribute, e.g. "__xCoordinate__".
+
+        Returns:
+            numpy.ndarray: The Column Values by Row, sharing Memory with the Service.
+        """
+        return self.__columns__[columnName][:len(self.__vehicles__)]
+
+    def __grow__(self, capacity: int) -> None:
+        """
+        Reallocate all Columns with the given Number of Rows, keeping the used Rows.
+        """
+        for columnName, column in self.__columns__.items():
+            grownColumn = numpy.zeros(capacity, dtype=column.dtype)
+            grownColumn[:len(column)] = column
+            self.__columns__[columnName] = grownColumn
+        for attributeName in ("__frictionRequested__", "__moveRequested__"):
+            flags = getattr(self, attributeName)
+            grownFlags = numpy.zeros(capacity, dtype=bool)
+            grownFlags[:len(flags)] = flags
+            setattr(self, attributeName, grownFlags)
+
+    def __str__(self) -> str:
+        return f"{type(self).__name__} (vehicles={len(self.__vehicles__)}, columns={list(self.__columns__)})"
\ No newline at end of file